@@ -48,6 +48,7 @@ from .ui.operators import (
     QUIXEL_OT_import_fbx,
 )
 from .ui.import_modal import QUIXEL_OT_import_confirm
+from .ui.import_toolbar import warm_up_draw_constants
 from .ui.bridge_launcher import QUIXEL_OT_launch_bridge
 from .ui.bridge_panel import QUIXEL_PT_bridge_panel
 from .ui import bridge_menu
@@ -115,12 +116,18 @@ def register():
     if not bpy.app.timers.is_registered(check_pending_imports):
         bpy.app.timers.register(check_pending_imports)
 
+    # Compile the import toolbar shaders before the toolbar first appears
+    if not bpy.app.timers.is_registered(warm_up_draw_constants):
+        bpy.app.timers.register(warm_up_draw_constants, first_interval=0.5)
+
 
 def unregister():
     """Unregister the addon from Blender"""
-    # Stop the background timer
+    # Stop the background timers
     if bpy.app.timers.is_registered(check_pending_imports):
         bpy.app.timers.unregister(check_pending_imports)
+    if bpy.app.timers.is_registered(warm_up_draw_constants):
+        bpy.app.timers.unregister(warm_up_draw_constants)
 
     # Shutdown the coordinator
     shutdown_coordinator()
@@ -7,6 +7,7 @@ import bpy
 import math
 import mathutils
 import re
+from functools import lru_cache
 from pathlib import Path
 
 from ..utils.naming import (
@@ -17,6 +18,12 @@ from ..utils.naming import (
 from ..utils.validation import validate_asset_directory
 
 
+# IOI format: _LOD_ followed by 8 characters where the digit's position is the LOD level
+_IOI_LOD_PATTERN = re.compile(r'_LOD_([_0-9]{8})', re.IGNORECASE)
+# Standard format: _LOD0, LOD1, etc.
+_STANDARD_LOD_PATTERN = re.compile(r'LOD(\d+)', re.IGNORECASE)
+
+
 def detect_asset_type(asset_dir):
     """Detect the type of asset (FBX or surface material).
     
@@ -136,6 +143,7 @@ def organize_objects_by_variation(objects):
     return variations
 
 
+@lru_cache(maxsize=4096)
 def extract_lod_from_object_name(obj_name):
     """Extract LOD level from object name.
 
@@ -143,6 +151,8 @@ def extract_lod_from_object_name(obj_name):
     - IOI format: base_name_LOD_0_______ (LOD level indicated by position of number)
     - Standard format: base_name_LOD0, base_name_LOD1, etc.
 
+    Results are cached per name since the same names are parsed repeatedly.
+
     Args:
         obj_name: Name of the object
 
@@ -151,8 +161,7 @@ def extract_lod_from_object_name(obj_name):
     """
     # First, try to match IOI format: _LOD_ followed by 8 characters where the number's position indicates LOD level
     # Example: _LOD_0_______ (LOD 0), _LOD__1______ (LOD 1), _LOD___2_____ (LOD 2)
-    ioi_pattern = re.compile(r'_LOD_([_0-9]{8})', re.IGNORECASE)
-    ioi_match = ioi_pattern.search(obj_name)
+    ioi_match = _IOI_LOD_PATTERN.search(obj_name)
 
     if ioi_match:
         lod_string = ioi_match.group(1)  # e.g., "0_______" or "__1______"
@@ -165,17 +174,11 @@ def extract_lod_from_object_name(obj_name):
         return 0
 
     # Fall back to standard LOD patterns: _LOD0, _LOD1, LOD0, LOD1, etc.
-    standard_patterns = [
-        re.compile(r'_?LOD(\d+)', re.IGNORECASE),  # Matches _LOD0, LOD1, etc.
-        re.compile(r'LOD(\d+)', re.IGNORECASE),     # Matches LOD0, LOD1 (without underscore)
-    ]
-
-    for pattern in standard_patterns:
-        match = pattern.search(obj_name)
-        if match:
-            lod_level = int(match.group(1))
-            # Clamp to valid range (0-7)
-            return max(0, min(7, lod_level))
+    match = _STANDARD_LOD_PATTERN.search(obj_name)
+    if match:
+        lod_level = int(match.group(1))
+        # Clamp to valid range (0-7)
+        return max(0, min(7, lod_level))
 
     # No LOD found, default to 0
     return 0
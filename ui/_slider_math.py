@@ -0,0 +1,62 @@
+"""Scalar math helpers for the LOD slider widget.
+
+These run on every mouse motion event while the slider is dragged, so they
+are compiled with numba when it is available. Blender does not ship numba,
+so plain Python implementations are used otherwise.
+"""
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
+
+
+@njit(cache=True)
+def _compute_marker_positions(x_screen, width, handle_radius, num_markers):
+    """Compute evenly spaced marker X positions across the usable track width.
+
+    Args:
+        x_screen: Left edge of the slider in region space
+        width: Slider width
+        handle_radius: Handle radius (track is inset by this on both sides)
+        num_markers: Number of markers to place
+
+    Returns:
+        list: X position of each marker
+    """
+    usable_width = width - (handle_radius * 2)
+    spacing = usable_width / (num_markers - 1) if num_markers > 1 else 0.0
+
+    positions = []
+    for i in range(num_markers):
+        positions.append(x_screen + handle_radius + (i * spacing))
+    return positions
+
+
+@njit(cache=True)
+def _closest_marker_index(marker_xs, x):
+    """Return the index of the marker closest to x, or -1 if there are none."""
+    closest_index = -1
+    min_dist = 1.0e30
+    for i in range(len(marker_xs)):
+        dist = abs(x - marker_xs[i])
+        if dist < min_dist:
+            min_dist = dist
+            closest_index = i
+    return closest_index
+
+
+@njit(cache=True)
+def _point_in_circle(px, py, cx, cy, r):
+    """Check if point (px, py) lies inside the circle at (cx, cy) with radius r."""
+    dx = px - cx
+    dy = py - cy
+    # Compare squared distances to avoid the sqrt
+    return dx * dx + dy * dy <= r * r
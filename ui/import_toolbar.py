@@ -13,12 +13,182 @@ import bpy
 import blf
 import gpu
 import math
-import mathutils
+import numpy as np
+import re
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from gpu_extras.batch import batch_for_shader
 from gpu_extras.presets import draw_circle_2d
-from mathutils import Vector, Matrix
+from mathutils import Matrix
 from ..utils.floor_plane_manager import create_floor_plane
+from ._slider_math import _compute_marker_positions, _closest_marker_index, _point_in_circle
+
+
+# Unit circle used by the non-shader circle fallbacks (32 segments, closed)
+_CIRCLE_SEGMENTS = 32
+_CIRCLE_ANGLES = np.linspace(0.0, 2.0 * math.pi, _CIRCLE_SEGMENTS + 1, dtype=np.float32)
+_COS = np.cos(_CIRCLE_ANGLES)
+_SIN = np.sin(_CIRCLE_ANGLES)
+_CIRCLE_FAN_INDICES = [(0, i + 1, i + 2) for i in range(_CIRCLE_SEGMENTS)]
+
+# Texture coordinates / indices for a textured quad
+_QUAD_TEX_COORDS = np.array(((0, 0), (1, 0), (1, 1), (0, 1)), dtype=np.float32)
+_QUAD_INDICES = ((0, 1, 2), (0, 2, 3))
+
+# Widget border color (#545454, same as the accept button outline)
+_BORDER_COLOR = (0.329, 0.329, 0.329, 1.0)
+
+# LOD text labels: rotation (stand up facing the camera) and colors
+_HALF_PI = math.pi / 2
+_COLOR_LOD_SELECTED = (1.0, 1.0, 1.0, 1.0)
+_COLOR_LOD_BELOW = (0.15, 0.15, 0.15, 1.0)
+_COLOR_LOD_ABOVE = (0.9, 0.9, 0.9, 1.0)
+
+# Rotation/scale part of a translation-only matrix_world
+_IDENTITY_3X3 = np.identity(3, dtype=np.float32)
+
+# LOD name patterns ("LOD2" -> 2, "Rock_LOD2" -> "Rock", IOI "_LOD_2_______")
+_LOD_NUM_RE = re.compile(r'LOD(\d+)')
+_LOD_SUB_RE = re.compile(r'_?LOD\d+')
+_LOD_IOI_RE = re.compile(r'_LOD_[_0-9]{8}')
+
+
+def _world_bbox(obj):
+    """Get the world-space axis-aligned bounds of an object's bounding box.
+
+    Transforms all 8 bound_box corners with one matrix product instead of
+    8 separate Matrix @ Vector calls. Translation-only matrices (the common
+    case for LODs under an attach root) just offset the local extents.
+
+    Returns:
+        tuple: (mins, maxs) float32 arrays of the world X/Y/Z extents
+    """
+    local = np.asarray(obj.bound_box, dtype=np.float32)
+    matrix = np.asarray(obj.matrix_world, dtype=np.float32)
+
+    if np.array_equal(matrix[:3, :3], _IDENTITY_3X3):
+        translation = matrix[:3, 3]
+        mins = local.min(axis=0) + translation
+        maxs = local.max(axis=0) + translation
+    else:
+        corners = np.ones((8, 4), dtype=np.float32)
+        corners[:, :3] = local
+        world = corners @ matrix.T
+        mins = world[:, :3].min(axis=0)
+        maxs = world[:, :3].max(axis=0)
+    return mins, maxs
+
+
+def _color_to_u8(color):
+    """Quantize an RGBA float color (0-1) to a uint8 tuple (0-255)."""
+    return tuple(int(round(max(0.0, min(1.0, c)) * 255.0)) for c in color)
+
+
+@lru_cache(maxsize=256)
+def _srgb_to_linear_cached(color):
+    r, g, b = (c / 12.92 if c < 0.04045 else ((c + 0.055) / 1.055) ** 2.4 for c in color[:3])
+    return (r, g, b, color[3] if len(color) > 3 else 1.0)
+
+
+def _srgb_to_linear_rgba(color):
+    """Convert an sRGB UI color to the linear RGBA the AA shader expects.
+
+    The AA shader draws a uniform color, so the conversion is done once per
+    color here (and cached, the UI palette is small) instead of per fragment.
+    RGB colors are padded to alpha 1.0 inside the cache, so callers pass
+    their colors as-is.
+    """
+    return _srgb_to_linear_cached(tuple(color))
+
+
+@lru_cache(maxsize=256)
+def _text_dims_cached(text, size, ui_scale, dpi):
+    # ui_scale/dpi are only part of the key, so a DPI change measures again
+    blf.size(0, size)
+    return blf.dimensions(0, text)
+
+
+def _text_dims(text, size):
+    """Get (width, height) of text at a font size, measured once per (text, size, DPI).
+
+    Labels in the toolbar are static, so after the first frame every lookup is
+    a cache hit instead of a glyph-cache walk in blf. The UI scale and DPI are
+    part of the cache key, so changing them re-measures instead of keeping
+    stale widths. Only the default font (id 0) is used here. The font size is
+    only set when measuring, so callers still call blf.size() before drawing.
+    """
+    system = bpy.context.preferences.system
+    return _text_dims_cached(text, size, system.ui_scale, system.dpi)
+
+
+def _build_colored_batch(prim_type, positions, colors_u8):
+    """Build a batch with per-vertex uint8 colors for the FLAT/SMOOTH_COLOR shaders.
+
+    UI colors come from a small fixed palette, so storing them as normalized
+    U8 x 4 (4 bytes) instead of F32 x 4 (16 bytes) is lossless.
+
+    Args:
+        prim_type: Primitive type ('TRIS', 'LINES', ...)
+        positions: (N, 2) float32 array of vertex positions
+        colors_u8: (N, 4) uint8 array of vertex colors
+
+    Returns:
+        GPUBatch: Batch to draw with the builtin FLAT_COLOR or SMOOTH_COLOR shader
+    """
+    if DrawConstants.u8_color_format is None:
+        fmt = gpu.types.GPUVertFormat()
+        fmt.attr_add(id="pos", comp_type='F32', len=2, fetch_mode='FLOAT')
+        fmt.attr_add(id="color", comp_type='U8', len=4, fetch_mode='INT_TO_FLOAT_UNIT')
+        DrawConstants.u8_color_format = fmt
+
+    vbo = gpu.types.GPUVertBuf(DrawConstants.u8_color_format, len(positions))
+    vbo.attr_fill("pos", positions)
+    vbo.attr_fill("color", colors_u8)
+    return gpu.types.GPUBatch(type=prim_type, buf=vbo)
+
+
+class SliderGeometryBuilder:
+    """Collects colored triangles for the slider track and markers into one batch."""
+
+    def __init__(self):
+        self.positions = []
+        self.colors = []
+
+    def add_quad(self, x, y, width, height, color_left, color_right=None):
+        """Add an axis-aligned quad, optionally with a left-to-right color gradient."""
+        left = _color_to_u8(color_left)
+        right = left if color_right is None else _color_to_u8(color_right)
+        x2 = x + width
+        y2 = y + height
+        self.positions.extend(((x, y), (x2, y), (x2, y2), (x, y), (x2, y2), (x, y2)))
+        self.colors.extend((left, right, right, left, right, left))
+
+    def add_half_disc(self, cx, cy, radius, start_angle, color, segments=8):
+        """Add a half disc (180 degrees counter-clockwise from start_angle) as a fan."""
+        c = _color_to_u8(color)
+        step = math.pi / segments
+        for i in range(segments):
+            a0 = start_angle + i * step
+            a1 = a0 + step
+            self.positions.extend((
+                (cx, cy),
+                (cx + radius * math.cos(a0), cy + radius * math.sin(a0)),
+                (cx + radius * math.cos(a1), cy + radius * math.sin(a1)),
+            ))
+            self.colors.extend((c, c, c))
+
+    def build(self):
+        """Upload the collected triangles as a single TRIS batch (None if empty)."""
+        if not self.positions:
+            return None
+        return _build_colored_batch(
+            'TRIS',
+            np.array(self.positions, dtype=np.float32),
+            np.array(self.colors, dtype=np.uint8),
+        )
 
 
 # Pre-computed shader constants for smooth circle rendering
@@ -26,37 +196,52 @@ class DrawConstants:
     """Pre-computed shader and batch data for efficient circle rendering."""
 
     filled_circle_shader = None
-    filled_circle_batch = None
     uniform_shader = None
     
-    # Anti-aliased circle shader and quad batch
+    # Shared anti-aliased shape shader, selected per draw via shapeType
+    anti_aliased_shader = None
+    AA_SHAPE_CIRCLE = 0
+    AA_SHAPE_RING = 1
+    AA_SHAPE_RECT = 2
+    AA_SHAPE_ROUNDED_RECT = 3  # Rounded-box SDF over rectPos/rectSize with cornerRadii
+    AA_SHAPE_ROUNDED_BORDER = 4  # Band of 'thickness' just inside the rounded-box outline
+    AA_SHAPE_CHEVRON = 5  # Downward V with its tip at center and arms of length radius
+
+    # Anti-aliased circle shader (alias of anti_aliased_shader) and quad batch
     anti_aliased_circle_shader = None
     circle_quad_batch = None
+
+    # Shader/quad drawing up to MAX_SDF_RECTS rounded rects in one call,
+    # plus the uniform locations of its rects/colors/params arrays
+    MAX_SDF_RECTS = 16
+    toolbar_sdf_shader = None
+    toolbar_sdf_locations = None
+    toolbar_quad_batch = None
     
     # Anti-aliased circle outline shader
     anti_aliased_circle_outline_shader = None
     
-    # Anti-aliased quarter-circle arc shader for borders
-    anti_aliased_arc_shader = None
-    
     # Anti-aliased rectangle shader
     anti_aliased_rect_shader = None
     
     # Anti-aliased border shader
     anti_aliased_border_shader = None
 
-    # Cached batches for rounded rectangles
-    rect_batch_h = None
-    rect_batch_v = None
+    # Builtin IMAGE shader and a unit textured quad shared by every image
+    # and texture-cache blit, placed with gpu.matrix instead of per-widget VBOs
+    image_shader = None
+    image_quad_batch = None
 
-    # Cached batches for corner arcs (32 segments per arc)
-    arc_batches = {}  # Key: radius, Value: batch
+    # Vertex format for batches with normalized uint8 per-vertex colors
+    u8_color_format = None
 
-    # Cached batch for simple lines
-    line_batch = None
+    # Unit-radius circle fill (TRIS fan) and outline (LINE_STRIP) at the origin
+    # for the UNIFORM_COLOR fallbacks, placed with gpu.matrix translate/scale
+    unit_circle_fan_batch = None
+    unit_circle_ring_batch = None
 
-    # Cached batch for dropdown chevron arrow
-    chevron_batch = None
+    # Viewport (width, height) of the frame being drawn, see begin_frame()
+    frame_viewport_size = None
 
     @classmethod
     def initialize(cls):
@@ -66,259 +251,107 @@ class DrawConstants:
             cls.uniform_shader = gpu.shader.from_builtin('UNIFORM_COLOR')
             cls.filled_circle_shader = cls.uniform_shader
 
-            # Create a unit circle batch (will be scaled during drawing)
-            segments = 64  # High quality circle
-            vertices = [(0, 0)]  # Center point
-            for i in range(segments + 1):
-                angle = 2 * math.pi * i / segments
-                x = math.cos(angle)
-                y = math.sin(angle)
-                vertices.append((x, y))
-
-            indices = []
-            for i in range(segments):
-                indices.append((0, i + 1, i + 2))
-
-            cls.filled_circle_batch = batch_for_shader(
-                cls.uniform_shader, 'TRIS', {"pos": vertices}, indices=indices
-            )
-
-            # Create reusable rectangle batches (unit square, will be scaled)
-            vertices = [(0, 0), (1, 0), (1, 1), (0, 1)]
-            indices = [(0, 1, 2), (0, 2, 3)]
-            cls.rect_batch_h = batch_for_shader(
-                cls.uniform_shader, 'TRIS', {"pos": vertices}, indices=indices
-            )
-            cls.rect_batch_v = batch_for_shader(
-                cls.uniform_shader, 'TRIS', {"pos": vertices}, indices=indices
-            )
-
-            # Create line batch for simple 2-point lines
-            vertices = [(0, 0), (1, 1)]
-            cls.line_batch = batch_for_shader(
-                cls.uniform_shader, 'LINES', {"pos": vertices}
+            # Baked unit circles for the non-shader circle fallbacks
+            cls.unit_circle_fan_batch = _fans_and_quads_batch(((0.0, 0.0),), 1.0, ())
+            cls.unit_circle_ring_batch = batch_for_shader(
+                cls.uniform_shader, 'LINE_STRIP', {"pos": np.column_stack((_COS, _SIN))}
             )
 
-            # Create chevron batch for dropdown arrow (V shape)
-            # Unit chevron pointing down: two lines forming a V
-            arrow_size = 1.0
-            vertices = (
-                (-arrow_size, arrow_size),     # Left top point
-                (0, 0),                         # Center bottom point
-                (0, 0),                         # Center bottom point (duplicate for second line)
-                (arrow_size, arrow_size)       # Right top point
-            )
-            cls.chevron_batch = batch_for_shader(
-                cls.uniform_shader, 'LINES', {"pos": vertices}
-            )
-            
-            # Create anti-aliased circle shader
-            cls._create_anti_aliased_circle_shader()
-            
-            # Create anti-aliased circle outline shader
-            cls._create_anti_aliased_circle_outline_shader()
-            
-            # Create anti-aliased quarter-circle arc shader for borders
-            cls._create_anti_aliased_arc_shader()
-            
-            # Create anti-aliased rectangle shader
-            cls._create_anti_aliased_rect_shader()
+            # Create the shared anti-aliased shape shader
+            cls._create_anti_aliased_shader()
             
             # Create unit quad batch for anti-aliased circles (will be scaled/translated)
             quad_vertices = [(0, 0), (1, 0), (1, 1), (0, 1)]
             quad_indices = [(0, 1, 2), (0, 2, 3)]
-            cls.circle_quad_batch = batch_for_shader(
-                cls.anti_aliased_circle_shader, 'TRIS', {"pos": quad_vertices}, indices=quad_indices
-            )
+            if cls.anti_aliased_shader is not None:
+                cls.circle_quad_batch = batch_for_shader(
+                    cls.anti_aliased_shader, 'TRIS',
+                    {"pos": quad_vertices}, indices=quad_indices
+                )
+
+            # Create the multi-rect SDF shader and its covering quad
+            cls._create_toolbar_sdf_shader()
+            if cls.toolbar_sdf_shader is not None:
+                cls.toolbar_quad_batch = batch_for_shader(
+                    cls.toolbar_sdf_shader, 'TRIS', {"pos": quad_vertices}, indices=quad_indices
+                )
+
+            # Shared textured unit quad for image blits
+            # (2D_IMAGE is the builtin name in older Blender versions, IMAGE in newer ones)
+            for shader_name in ('2D_IMAGE', 'IMAGE'):
+                try:
+                    cls.image_shader = gpu.shader.from_builtin(shader_name)
+                    break
+                except Exception:
+                    continue
+            else:
+                print("⚠️ Image shader unavailable, images will not be drawn")
+                cls.image_shader = None
+            if cls.image_shader is not None:
+                cls.image_quad_batch = batch_for_shader(
+                    cls.image_shader, 'TRIS',
+                    {"pos": quad_vertices, "texCoord": _QUAD_TEX_COORDS}, indices=quad_indices
+                )
+
+    @staticmethod
+    def _query_viewport_size():
+        viewport = gpu.state.viewport_get()
+        width = viewport[2] if len(viewport) > 2 else 1920
+        height = viewport[3] if len(viewport) > 3 else 1080
+        return width, height
 
     @classmethod
-    def get_arc_batch(cls, radius, segments=32):
-        """Get or create a cached arc batch for the given radius."""
-        key = (radius, segments)
-        if key not in cls.arc_batches:
-            # Create unit quarter-circle arc (0 to π/2)
-            vertices = []
-            for i in range(segments + 1):
-                angle = 0.5 * math.pi * i / segments
-                x = math.cos(angle)
-                y = math.sin(angle)
-                vertices.append((x, y))
-
-            cls.arc_batches[key] = batch_for_shader(
-                cls.uniform_shader, 'LINE_STRIP', {"pos": vertices}
-            )
-        return cls.arc_batches[key]
-    
-    @classmethod
-    def _create_anti_aliased_circle_shader(cls):
-        """Create a custom shader for anti-aliased circle rendering.
-        
-        Uses distance-based alpha falloff with smoothstep for smooth edges.
-        Uses screen-space coordinates with proper viewport handling.
+    def begin_frame(cls):
+        """Prepare shared state once per frame for all widgets drawn in it.
+
+        Ensures shaders and batches exist (normally already compiled by
+        warm_up_draw_constants at registration), so widget draw methods
+        don't each check, and reads the viewport size.
         """
-        vertex_shader = '''
-        in vec2 pos;
-        uniform vec2 center;
-        uniform vec2 viewportSize;
-        uniform float scale;
-        
-        out vec2 screenPos;
-        
-        void main() {
-            // Transform unit quad (0,0 to 1,1) to screen space
-            // Center the quad at origin, then scale and translate
-            vec2 local = (pos - vec2(0.5, 0.5)) * scale;
-            vec2 screen = center + local;
-            screenPos = screen;
-            
-            // Convert screen coordinates to NDC (-1 to 1 range)
-            // Blender's screen space: (0,0) at bottom-left
-            vec2 ndc = vec2(
-                (screen.x / viewportSize.x) * 2.0 - 1.0,
-                (screen.y / viewportSize.y) * 2.0 - 1.0
-            );
-            
-            gl_Position = vec4(ndc.x, ndc.y, 0.0, 1.0);
-        }
-        '''
-        
-        fragment_shader = '''
-        uniform vec4 color;
-        uniform vec2 center;
-        uniform float radius;
-        uniform float edgeSoftness;
-        
-        in vec2 screenPos;
-        out vec4 fragColor;
-        
-        void main() {
-            // Calculate distance from center in screen space (pixels)
-            float dist = distance(screenPos, center);
-            
-            // Use smoothstep for soft edge anti-aliasing
-            // The fade goes from (radius - edgeSoftness) to (radius + edgeSoftness)
-            // We adjust the radius in the calling code so outer edge aligns with rectangle
-            float alpha = 1.0 - smoothstep(radius - edgeSoftness, radius + edgeSoftness, dist);
-            
-            // Apply gamma correction to match Blender's built-in shader color handling
-            // Colors appear brighter without this, suggesting they need to be in linear space
-            // Convert sRGB input to linear for correct display
-            vec3 linearColor = mix(
-                color.rgb / 12.92,
-                pow((color.rgb + 0.055) / 1.055, vec3(2.4)),
-                step(0.04045, color.rgb)
-            );
-            
-            fragColor = vec4(linearColor, color.a * alpha);
-        }
-        '''
-        
-        try:
-            cls.anti_aliased_circle_shader = gpu.types.GPUShader(vertex_shader, fragment_shader)
-        except Exception as e:
-            # Fallback: if shader creation fails, we'll use the old method
-            print(f"Warning: Failed to create anti-aliased circle shader: {e}")
-            cls.anti_aliased_circle_shader = None
-    
+        cls.initialize()
+        cls.frame_viewport_size = cls._query_viewport_size()
+
     @classmethod
-    def _create_anti_aliased_circle_outline_shader(cls):
-        """Create a custom shader for anti-aliased circle outline rendering.
-        
-        Uses distance-based alpha falloff to create smooth outline edges.
-        Uses screen-space coordinates with proper viewport handling.
-        """
-        vertex_shader = '''
-        in vec2 pos;
-        uniform vec2 center;
-        uniform vec2 viewportSize;
-        uniform float scale;
-        
-        out vec2 screenPos;
-        
-        void main() {
-            // Transform unit quad (0,0 to 1,1) to screen space
-            // Center the quad at origin, then scale and translate
-            vec2 local = (pos - vec2(0.5, 0.5)) * scale;
-            vec2 screen = center + local;
-            screenPos = screen;
-            
-            // Convert screen coordinates to NDC (-1 to 1 range)
-            vec2 ndc = vec2(
-                (screen.x / viewportSize.x) * 2.0 - 1.0,
-                (screen.y / viewportSize.y) * 2.0 - 1.0
-            );
-            
-            gl_Position = vec4(ndc.x, ndc.y, 0.0, 1.0);
-        }
-        '''
-        
-        fragment_shader = '''
-        uniform vec4 color;
-        uniform vec2 center;
-        uniform float radius;
-        uniform float thickness;
-        uniform float edgeSoftness;
-        
-        in vec2 screenPos;
-        out vec4 fragColor;
-        
-        void main() {
-            // Calculate distance from center in screen space (pixels)
-            float dist = distance(screenPos, center);
-            
-            // Create a ring shape: inside radius - thickness/2, outside radius + thickness/2
-            float innerRadius = radius - thickness * 0.5;
-            float outerRadius = radius + thickness * 0.5;
-            
-            // Use smoothstep for soft edge anti-aliasing on both inner and outer edges
-            float innerAlpha = smoothstep(innerRadius - edgeSoftness, innerRadius + edgeSoftness, dist);
-            float outerAlpha = 1.0 - smoothstep(outerRadius - edgeSoftness, outerRadius + edgeSoftness, dist);
-            
-            // Combine both edges (ring shape)
-            float alpha = innerAlpha * outerAlpha;
-            
-            // Apply gamma correction to match Blender's built-in shader color handling
-            // Colors appear brighter without this, suggesting they need to be in linear space
-            // Convert sRGB input to linear for correct display
-            vec3 linearColor = mix(
-                color.rgb / 12.92,
-                pow((color.rgb + 0.055) / 1.055, vec3(2.4)),
-                step(0.04045, color.rgb)
-            );
-            
-            fragColor = vec4(linearColor, color.a * alpha);
-        }
-        '''
-        
-        try:
-            cls.anti_aliased_circle_outline_shader = gpu.types.GPUShader(vertex_shader, fragment_shader)
-        except Exception as e:
-            # Fallback: if shader creation fails, we'll use the old method
-            print(f"Warning: Failed to create anti-aliased circle outline shader: {e}")
-            cls.anti_aliased_circle_outline_shader = None
-    
+    def viewport_size(cls):
+        """Get (width, height) of the current frame's viewport for the AA shader."""
+        size = cls.frame_viewport_size
+        if size is None:
+            # Drawn outside a toolbar frame
+            size = cls._query_viewport_size()
+        return size
+
     @classmethod
-    def _create_anti_aliased_arc_shader(cls):
-        """Create a custom shader for anti-aliased quarter-circle arc rendering.
-        
-        Uses distance-based alpha falloff to create smooth arc edges.
-        Only draws pixels within the specified angle range.
+    def _create_anti_aliased_shader(cls):
+        """Create the shared anti-aliased shape shader.
+
+        Circles, ring outlines, (rounded) rectangles and borders share one
+        program; callers pick the shape with the ``shapeType`` uniform (see
+        the ``AA_SHAPE_*`` constants), so switching shapes does not rebind.
+
+        Rounded rects and borders take a per-corner radius (``cornerRadii``),
+        so a whole widget background or outline is a single quad.
         """
         vertex_shader = '''
         in vec2 pos;
+        uniform int shapeType;
         uniform vec2 center;
-        uniform vec2 viewportSize;
         uniform float scale;
+        uniform vec2 rectPos;
+        uniform vec2 rectSize;
+        uniform vec2 viewportSize;
         
         out vec2 screenPos;
         
         void main() {
-            // Transform unit quad (0,0 to 1,1) to screen space
-            vec2 local = (pos - vec2(0.5, 0.5)) * scale;
-            vec2 screen = center + local;
+            // Radial shapes center a (scale x scale) quad on center,
+            // rectangles stretch the unit quad over rectPos/rectSize
+            vec2 radial = center + (pos - vec2(0.5, 0.5)) * scale;
+            vec2 boxed = rectPos + pos * rectSize;
+            vec2 screen = mix(radial, boxed, float(shapeType >= 2 && shapeType <= 4));
             screenPos = screen;
             
             // Convert screen coordinates to NDC (-1 to 1 range)
+            // Blender's screen space: (0,0) at bottom-left
             vec2 ndc = vec2(
                 (screen.x / viewportSize.x) * 2.0 - 1.0,
                 (screen.y / viewportSize.y) * 2.0 - 1.0
@@ -329,166 +362,360 @@ class DrawConstants:
         '''
         
         fragment_shader = '''
-        uniform vec4 color;
+        uniform int shapeType;
         uniform vec2 center;
+        uniform vec4 color;
         uniform float radius;
         uniform float thickness;
         uniform float edgeSoftness;
-        uniform float startAngle;
-        uniform float endAngle;
+        uniform vec2 rectPos;
+        uniform vec2 rectSize;
+        uniform vec4 cornerRadii;  // Per-corner radius: BL, BR, TR, TL
         
         in vec2 screenPos;
         out vec4 fragColor;
         
-        // Convert sRGB to linear color space
-        vec3 srgb_to_linear(vec3 srgb) {
-            return mix(
-                srgb / 12.92,
-                pow((srgb + 0.055) / 1.055, vec3(2.4)),
-                step(0.04045, srgb)
-            );
-        }
-        
         void main() {
-            // Calculate distance from center
             vec2 offset = screenPos - center;
             float dist = length(offset);
             
-            // Calculate angle from center
-            float angle = atan(offset.y, offset.x);
-            // Normalize angle to [0, 2π]
-            if (angle < 0.0) {
-                angle += 6.28318530718; // 2 * PI
-            }
+            // Filled circle: fade from (radius - edgeSoftness) to (radius + edgeSoftness)
+            float circleAlpha = 1.0 - smoothstep(radius - edgeSoftness, radius + edgeSoftness, dist);
             
-            // Normalize start and end angles to [0, 2π]
-            float start = startAngle;
-            float end = endAngle;
-            if (start < 0.0) start += 6.28318530718;
-            if (end < 0.0) end += 6.28318530718;
+            // Ring: inside radius - thickness/2, outside radius + thickness/2
+            float innerRadius = radius - thickness * 0.5;
+            float outerRadius = radius + thickness * 0.5;
+            float ringAlpha = smoothstep(innerRadius - edgeSoftness, innerRadius + edgeSoftness, dist)
+                * (1.0 - smoothstep(outerRadius - edgeSoftness, outerRadius + edgeSoftness, dist));
             
-            // Check if angle is within range
-            bool inAngleRange = false;
-            if (end > start) {
-                inAngleRange = (angle >= start && angle <= end);
-            } else {
-                // Handle wrap-around case
-                inAngleRange = (angle >= start || angle <= end);
-            }
+            // Rectangle: fade over edgeSoftness at the nearest edge
+            vec2 lo = screenPos - rectPos;
+            vec2 hi = (rectPos + rectSize) - screenPos;
+            float minDist = min(min(lo.x, hi.x), min(lo.y, hi.y));
+            float rectAlpha = smoothstep(0.0, edgeSoftness, minDist);
             
-            if (!inAngleRange) {
-                fragColor = vec4(0.0, 0.0, 0.0, 0.0);
-                return;
-            }
+            // Rounded rect: signed distance to the rounded box (negative inside),
+            // fading over edgeSoftness just inside the outline. The corner radius
+            // comes from the quadrant the fragment lies in, so square corners
+            // are just a zero radius.
+            vec2 halfSize = rectSize * 0.5;
+            vec2 local = screenPos - (rectPos + halfSize);
+            vec2 side = step(0.0, local);  // (right, top)
+            float cornerRadius = mix(mix(cornerRadii.x, cornerRadii.y, side.x),
+                                     mix(cornerRadii.w, cornerRadii.z, side.x), side.y);
+            cornerRadius = min(cornerRadius, min(halfSize.x, halfSize.y));
+            vec2 q = abs(local) - halfSize + cornerRadius;
+            float boxDist = length(max(q, 0.0)) + min(max(q.x, q.y), 0.0) - cornerRadius;
+            float roundedAlpha = 1.0 - smoothstep(-edgeSoftness, 0.0, boxDist);
             
-            // Create a ring shape: inside radius - thickness/2, outside radius + thickness/2
-            float innerRadius = radius - thickness * 0.5;
-            float outerRadius = radius + thickness * 0.5;
+            // Rounded border: the same SDF kept between -thickness and 0, with
+            // both edges centered on the pixel boundary
+            float halfSoft = edgeSoftness * 0.5;
+            float borderAlpha = (1.0 - smoothstep(-halfSoft, halfSoft, boxDist))
+                * smoothstep(-thickness - halfSoft, -thickness + halfSoft, boxDist);
             
-            // Use smoothstep for soft edge anti-aliasing on both inner and outer edges
-            float innerAlpha = smoothstep(innerRadius - edgeSoftness, innerRadius + edgeSoftness, dist);
-            float outerAlpha = 1.0 - smoothstep(outerRadius - edgeSoftness, outerRadius + edgeSoftness, dist);
+            // Chevron: stroke of 'thickness' along the segment from the tip to
+            // (radius, radius), mirrored for the left arm
+            vec2 arm = vec2(radius);
+            vec2 mirrored = vec2(abs(offset.x), offset.y);
+            float along = clamp(dot(mirrored, arm) / dot(arm, arm), 0.0, 1.0);
+            float strokeDist = length(mirrored - arm * along);
+            float chevronAlpha = 1.0 - smoothstep(thickness * 0.5 - halfSoft, thickness * 0.5 + halfSoft, strokeDist);
             
-            // Combine both edges (ring shape)
-            float alpha = innerAlpha * outerAlpha;
+            // Branchless select of the requested shape
+            float alpha = circleAlpha * float(shapeType == 0)
+                + ringAlpha * float(shapeType == 1)
+                + rectAlpha * float(shapeType == 2)
+                + roundedAlpha * float(shapeType == 3)
+                + borderAlpha * float(shapeType == 4)
+                + chevronAlpha * float(shapeType == 5);
             
-            // Apply sRGB to linear conversion
-            vec3 linearColor = srgb_to_linear(color.rgb);
+            // Fully transparent fragments (outside the shape) write nothing
+            if (color.a * alpha < 0.003) {
+                discard;
+            }
             
-            fragColor = vec4(linearColor, color.a * alpha);
+            // color is already linear (converted once on the CPU)
+            fragColor = vec4(color.rgb, color.a * alpha);
         }
         '''
         
         try:
-            cls.anti_aliased_arc_shader = gpu.types.GPUShader(vertex_shader, fragment_shader)
+            cls.anti_aliased_shader = gpu.types.GPUShader(vertex_shader, fragment_shader)
         except Exception as e:
             # Fallback: if shader creation fails, we'll use the old method
-            print(f"Warning: Failed to create anti-aliased arc shader: {e}")
-            cls.anti_aliased_arc_shader = None
-    
+            print(f"Warning: Failed to create anti-aliased shader: {e}")
+            import traceback
+            traceback.print_exc()
+            cls.anti_aliased_shader = None
+
+        # The per-shape names are kept as aliases so existing availability
+        # checks keep working; callers must still set shapeType after bind()
+        cls.anti_aliased_circle_shader = cls.anti_aliased_shader
+        cls.anti_aliased_circle_outline_shader = cls.anti_aliased_shader
+        cls.anti_aliased_rect_shader = cls.anti_aliased_shader
+
     @classmethod
-    def _create_anti_aliased_rect_shader(cls):
-        """Create a custom shader for anti-aliased rectangle rendering.
-        
-        Uses distance-based alpha falloff on all edges for smooth anti-aliasing.
-        Uses screen-space coordinates with proper viewport handling.
+    def _create_toolbar_sdf_shader(cls):
+        """Create the shader that draws several rounded rects in one quad.
+
+        Each fragment of the covering quad evaluates the rounded-box SDF of
+        up to MAX_SDF_RECTS rects (uniform arrays) and composites them in
+        order, so all panel backgrounds cost a single draw call. Only
+        fragments in a rect's edge band pay for the SDF; the interior and
+        the outside are resolved from the plain box distance.
         """
         vertex_shader = '''
         in vec2 pos;
-        uniform vec2 rectPos;
-        uniform vec2 rectSize;
+        uniform vec4 bounds;
         uniform vec2 viewportSize;
         
         out vec2 screenPos;
         
         void main() {
-            // Transform unit quad (0,0 to 1,1) to screen space
-            vec2 screen = rectPos + pos * rectSize;
+            // Stretch the unit quad over the covering bounds (x, y, w, h)
+            vec2 screen = bounds.xy + pos * bounds.zw;
             screenPos = screen;
-            
-            // Convert screen coordinates to NDC (-1 to 1 range)
-            vec2 ndc = vec2(
-                (screen.x / viewportSize.x) * 2.0 - 1.0,
-                (screen.y / viewportSize.y) * 2.0 - 1.0
-            );
-            
-            gl_Position = vec4(ndc.x, ndc.y, 0.0, 1.0);
+            gl_Position = vec4(screen / viewportSize * 2.0 - 1.0, 0.0, 1.0);
         }
         '''
         
         fragment_shader = '''
-        uniform vec4 color;
-        uniform vec2 rectPos;
-        uniform vec2 rectSize;
-        uniform float edgeSoftness;
+        uniform int count;
+        uniform vec4 rects[%d];
+        uniform vec4 colors[%d];
+        uniform vec4 params[%d];
         
         in vec2 screenPos;
         out vec4 fragColor;
         
+        // Signed distance to a box with rounded corners (negative inside)
+        float sdRoundBox(vec2 p, vec2 halfSize, float r) {
+            vec2 q = abs(p) - halfSize + r;
+            return length(max(q, 0.0)) + min(max(q.x, q.y), 0.0) - r;
+        }
+        
         void main() {
-            // Calculate distance to each edge (all should be positive inside the rectangle)
-            float distLeft = screenPos.x - rectPos.x;
-            float distRight = (rectPos.x + rectSize.x) - screenPos.x;
-            float distBottom = screenPos.y - rectPos.y;
-            float distTop = (rectPos.y + rectSize.y) - screenPos.y;
-            
-            // Find minimum distance to any edge (this is the distance to the nearest edge)
-            float minDist = min(min(distLeft, distRight), min(distBottom, distTop));
-            
-            // Use smoothstep for soft edge anti-aliasing
-            // Rectangle is opaque inside, fades smoothly at the very edges
-            // edgeSoftness controls the transition width (typically 1.0-2.0 pixels)
-            // When minDist >= edgeSoftness (inside): alpha = 1.0 (fully opaque)
-            // When 0 < minDist < edgeSoftness (near edge): alpha fades smoothly
-            // When minDist <= 0 (outside): alpha = 0.0 (transparent)
-            float alpha = 1.0;
-            if (minDist < edgeSoftness) {
-                // Fade at edges for anti-aliasing
-                alpha = smoothstep(0.0, edgeSoftness, minDist);
+            vec4 result = vec4(0.0);
+            for (int i = 0; i < %d; i++) {
+                if (i >= count) {
+                    break;
+                }
+                // rects: x, y, width, height / params: radius, edgeSoftness
+                vec2 halfSize = rects[i].zw * 0.5;
+                vec2 local = screenPos - (rects[i].xy + halfSize);
+                // Distance to the plain box: outside adds nothing, and deeper
+                // than radius + softness is fully covered without the SDF
+                vec2 boxQ = abs(local) - halfSize;
+                float boxDist = max(boxQ.x, boxQ.y);
+                if (boxDist > 0.0) {
+                    continue;
+                }
+                float coverage = 1.0;
+                if (boxDist > -(params[i].x + params[i].y)) {
+                    // Edge band or corner: anti-aliased rounded-box SDF
+                    float dist = sdRoundBox(local, halfSize, params[i].x);
+                    coverage = 1.0 - smoothstep(-params[i].y, 0.0, dist);
+                }
+                float alpha = colors[i].a * coverage;
+                // Later rects go over earlier ones (premultiplied "over")
+                result = vec4(colors[i].rgb * alpha, alpha) + result * (1.0 - alpha);
             }
-            
-            // Apply gamma correction to match Blender's built-in shader color handling
-            // Convert sRGB input to linear for correct display
-            vec3 linearColor = mix(
-                color.rgb / 12.92,
-                pow((color.rgb + 0.055) / 1.055, vec3(2.4)),
-                step(0.04045, color.rgb)
-            );
-            
-            fragColor = vec4(linearColor, color.a * alpha);
+            fragColor = result;
         }
-        '''
+        ''' % ((cls.MAX_SDF_RECTS,) * 4)
         
         try:
-            cls.anti_aliased_rect_shader = gpu.types.GPUShader(vertex_shader, fragment_shader)
-            # Debug: verify shader was created
-            # print("Anti-aliased rectangle shader created successfully")
+            shader = gpu.types.GPUShader(vertex_shader, fragment_shader)
+            cls.toolbar_sdf_locations = tuple(
+                shader.uniform_from_name(name) for name in ("rects", "colors", "params")
+            )
+            cls.toolbar_sdf_shader = shader
         except Exception as e:
-            # Fallback: if shader creation fails, we'll use the old method
-            print(f"Warning: Failed to create anti-aliased rectangle shader: {e}")
-            import traceback
-            traceback.print_exc()
-            cls.anti_aliased_rect_shader = None
+            # Fallback: draw_rounded_rects draws each rect on its own
+            print(f"Warning: Failed to create toolbar SDF shader: {e}")
+            cls.toolbar_sdf_shader = None
+
+
+def warm_up_draw_constants():
+    """Compile shaders and build batches ahead of the first toolbar draw.
+
+    Registered as a one-shot bpy.app.timers callback at add-on registration
+    so the compile stall doesn't land on the frame the toolbar appears.
+    (A module function, since timers are matched by function identity.)
+
+    Returns:
+        None: Unregisters the timer
+    """
+    if bpy.app.background:
+        return None
+    try:
+        DrawConstants.initialize()
+    except Exception as e:
+        # No usable GPU context yet: leave it to the first draw
+        print(f"⚠️ Could not pre-compile toolbar shaders, compiling on first draw: {e}")
+        DrawConstants.filled_circle_shader = None
+        return None
+
+    # Shader compile errors are caught inside initialize() and leave the shader
+    # None; retry once at the first draw instead of keeping the fallbacks for
+    # the whole session
+    if DrawConstants.anti_aliased_shader is None or DrawConstants.toolbar_sdf_shader is None:
+        print("⚠️ Toolbar shaders failed to pre-compile, retrying on first draw")
+        DrawConstants.filled_circle_shader = None
+    return None
+
+
+@dataclass(slots=True, frozen=True)
+class RoundedRectGeometry:
+    """Everything draw_rounded_rect derives from a rect's position and size.
+
+    Widgets keep one of these and only recompute it when they move.
+    """
+
+    x: float
+    y: float
+    width: float
+    height: float
+    radius: float
+    corners: tuple        # Corner circle centers: BL, BR, TR, TL (fallback only)
+    strip_h: tuple        # Horizontal strip (x, y, width, height) (fallback only)
+    strip_v: tuple        # Vertical strip (x, y, width, height) (fallback only)
+
+    @classmethod
+    def compute(cls, x, y, width, height, radius):
+        """Precompute the corner and strip geometry of a rounded rectangle.
+
+        The radius is clamped to half the smaller side (a pill at most), so
+        the strips never get a negative size.
+        """
+        radius = max(0.0, min(radius, width * 0.5, height * 0.5))
+        inner_w = width - 2 * radius
+        inner_h = height - 2 * radius
+        return cls(
+            x, y, width, height, radius,
+            corners=(
+                (x + radius, y + radius),
+                (x + width - radius, y + radius),
+                (x + width - radius, y + height - radius),
+                (x + radius, y + height - radius),
+            ),
+            strip_h=(x + radius, y, inner_w, height),
+            strip_v=(x, y + radius, width, inner_h),
+        )
+
+
+def _fans_and_quads_batch(centers, radius, rects):
+    """Build one UNIFORM_COLOR TRIS batch of filled circles plus axis-aligned rects.
+
+    Everything is emitted in final screen-space positions, so callers need
+    neither the matrix stack nor one draw per part.
+
+    Args:
+        centers: (x, y) centers of the circles, all of the given radius
+        radius: Circle radius
+        rects: (x, y, width, height) rectangles
+    """
+    fan_size = _CIRCLE_SEGMENTS + 2  # Center + closed ring
+    fan_count = len(centers)
+    fan_end = fan_count * fan_size
+
+    positions = np.empty((fan_end + 4 * len(rects), 2), dtype=np.float32)
+    if fan_count:
+        ring = np.column_stack((_COS, _SIN)) * radius
+        center_array = np.array(centers, dtype=np.float32)
+        fans = positions[:fan_end].reshape(fan_count, fan_size, 2)
+        fans[:, 0] = center_array
+        fans[:, 1:] = center_array[:, None, :] + ring[None, :, :]
+    quads = positions[fan_end:].reshape(len(rects), 4, 2)
+    quads[:] = _QUAD_TEX_COORDS  # Unit square, scaled/offset per rect below
+    for quad, (rx, ry, rw, rh) in zip(quads, rects):
+        quad *= (rw, rh)
+        quad += (rx, ry)
+
+    indices = [(a + i * fan_size, b + i * fan_size, c + i * fan_size)
+               for i in range(fan_count) for a, b, c in _CIRCLE_FAN_INDICES]
+    indices += [(a + fan_end + 4 * i, b + fan_end + 4 * i, c + fan_end + 4 * i)
+                for i in range(len(rects)) for a, b, c in _QUAD_INDICES]
+    return batch_for_shader(DrawConstants.uniform_shader, 'TRIS', {"pos": positions}, indices=indices)
+
+
+@lru_cache(maxsize=64)
+def _rounded_rect_fallback_batch(width, height, radius):
+    """Build the triangles of a rounded rect at the origin for the UNIFORM_COLOR fallback.
+
+    Corner fans and both strips go into one batch. Cached per size, the
+    caller translates it to the rect's position.
+    """
+    if radius <= 0.5:
+        # Square corners: one quad, instead of two fully overlapping strips
+        return _fans_and_quads_batch((), 0.0, ((0.0, 0.0, width, height),))
+    geom = RoundedRectGeometry.compute(0.0, 0.0, width, height, radius)
+    return _fans_and_quads_batch(geom.corners, geom.radius, (geom.strip_h, geom.strip_v))
+
+
+@lru_cache(maxsize=8)
+def _unit_outline(segments):
+    """Closed unit outline of a rounded rect, as four quarter arcs of `segments` each.
+
+    Arcs run counterclockwise from the bottom edge (BR, TR, TL, BL), so the
+    straight edges are the LINE_STRIP segments joining consecutive arcs.
+
+    Returns:
+        tuple: (unit points as float32 (N, 2), corner index of each point)
+    """
+    angles = (
+        np.linspace(0.0, 0.5 * math.pi, segments + 1, dtype=np.float32)[None, :]
+        + (np.arange(4, dtype=np.float32)[:, None] - 1.0) * np.float32(0.5 * math.pi)
+    ).ravel()
+    angles = np.append(angles, angles[0])  # Close the loop
+    corner = np.append(np.repeat(np.arange(4), segments + 1), 0)
+    return np.column_stack((np.cos(angles), np.sin(angles))), corner
+
+
+def _rounded_outline_vertices(x, y, width, height, radius, segments=4):
+    """Get the closed LINE_STRIP outline of a rounded rect as a float32 (N, 2) array."""
+    unit, corner = _unit_outline(segments)
+    centers = np.array((
+        (x + width - radius, y + radius),           # Bottom-right
+        (x + width - radius, y + height - radius),  # Top-right
+        (x + radius, y + height - radius),          # Top-left
+        (x + radius, y + radius),                   # Bottom-left
+    ), dtype=np.float32)
+    return centers[corner] + unit * np.float32(radius)
+
+
+@lru_cache(maxsize=64)
+def _rounded_outline_batch(width, height, radius, segments=4):
+    """Build (once per size) the UNIFORM_COLOR LINE_STRIP batch of a rounded-rect outline at the origin."""
+    DrawConstants.initialize()
+    vertices = _rounded_outline_vertices(0.0, 0.0, width, height, radius, segments)
+    return batch_for_shader(DrawConstants.uniform_shader, 'LINE_STRIP', {"pos": vertices})
+
+
+@lru_cache(maxsize=8)
+def _checkmark_batch(size):
+    """Build (once per checkbox size) the UNIFORM_COLOR LINE_STRIP checkmark at the origin."""
+    DrawConstants.initialize()
+    padding = 3
+    vertices = (
+        (padding + 2, size / 2),
+        (size / 2 - 1, padding + 2),
+        (size - padding, size - padding),
+    )
+    return batch_for_shader(DrawConstants.uniform_shader, 'LINE_STRIP', {"pos": vertices})
+
+
+def _draw_rounded_outline(shader, x, y, width, height, radius, segments=4):
+    """Draw the cached rounded-rect outline with its bottom-left at (x, y).
+
+    The shader must already be bound with its color set. The outline is cached
+    by size only, so moving widgets keep reusing the same batch.
+    """
+    batch = _rounded_outline_batch(width, height, radius, segments)
+    with gpu.matrix.push_pop():
+        gpu.matrix.translate((x, y))
+        batch.draw(shader)
 
 
 def draw_rounded_rect(x, y, width, height, radius, color, segments=16):
@@ -501,117 +728,162 @@ def draw_rounded_rect(x, y, width, height, radius, color, segments=16):
         color: RGBA color tuple
         segments: Ignored (kept for API compatibility)
     """
+    draw_rounded_rect_geometry(RoundedRectGeometry.compute(x, y, width, height, radius), color)
+
+
+def draw_rounded_rect_geometry(geom, color, set_blend=True):
+    """Draw a filled rounded rectangle from precomputed RoundedRectGeometry.
+
+    Args:
+        geom: RoundedRectGeometry of the rectangle
+        color: RGBA color tuple
+        set_blend: Enable alpha blending for this draw only. Pass False when
+            the caller already enabled it around several draws.
+    """
     # Initialize shaders if needed
     DrawConstants.initialize()
 
-    gpu.state.blend_set('ALPHA')
-
-    # Draw corners FIRST, then rectangles on top
-    # This ensures corners blend correctly with the background for anti-aliasing,
-    # and rectangles cover inner edges to maintain color consistency
-    corners = [
-        (x + radius, y + radius),              # Bottom-left
-        (x + width - radius, y + radius),      # Bottom-right
-        (x + width - radius, y + height - radius),  # Top-right
-        (x + radius, y + height - radius),     # Top-left
-    ]
+    if set_blend:
+        gpu.state.blend_set('ALPHA')
 
-    # Draw anti-aliased circles at corners for smooth edges
-    # The rectangles drawn on top will cover the inner parts, ensuring color match
-    if DrawConstants.anti_aliased_circle_shader is not None:
-        aa_shader = DrawConstants.anti_aliased_circle_shader
-        
-        # Get viewport size for coordinate conversion
-        viewport = gpu.state.viewport_get()
-        viewport_width = viewport[2] if len(viewport) > 2 else 1920
-        viewport_height = viewport[3] if len(viewport) > 3 else 1080
-        
-        # Calculate scale to cover the circle area (with some padding for edge softness)
-        scale_size = (radius + 1.0) * 2.0
-        
-        # Ensure color is a proper tuple with 4 components (RGBA)
-        if len(color) == 3:
-            color_rgba = (color[0], color[1], color[2], 1.0)
+    aa_shader = DrawConstants.anti_aliased_shader
+    if aa_shader is not None:
+        # Viewport size for coordinate conversion (queried once per frame)
+        viewport_width, viewport_height = DrawConstants.viewport_size()
+
+        # The whole shape is one rounded-box SDF over a single quad: no corner
+        # circles or strips, so no overdraw seams between them
+        aa_shader.bind()
+        # Square corners: the plain rect coverage is enough
+        if geom.radius <= 0.5:
+            aa_shader.uniform_int("shapeType", DrawConstants.AA_SHAPE_RECT)
         else:
-            color_rgba = color
-        
-        for cx, cy in corners:
-            # Bind shader and set uniforms for each corner
-            aa_shader.bind()
-            aa_shader.uniform_float("center", (cx, cy))
-            aa_shader.uniform_float("viewportSize", (viewport_width, viewport_height))
-            # Adjust radius so the anti-aliased outer edge aligns perfectly with rectangle boundary
-            # The anti-aliasing extends from (radius - edgeSoftness) to (radius + edgeSoftness)
-            # To align outer edge at exact radius, we reduce the shader radius by edgeSoftness
-            edge_softness = 1.0
-            effective_radius = radius - edge_softness  # Outer edge will be at radius
-            aa_shader.uniform_float("radius", effective_radius)
-            aa_shader.uniform_float("color", color_rgba)  # Use the exact same color as the rectangles
-            aa_shader.uniform_float("edgeSoftness", edge_softness)  # 1-pixel soft edge for smooth anti-aliasing
-            aa_shader.uniform_float("scale", scale_size)
-            
-            DrawConstants.circle_quad_batch.draw(aa_shader)
+            aa_shader.uniform_int("shapeType", DrawConstants.AA_SHAPE_ROUNDED_RECT)
+        aa_shader.uniform_float("viewportSize", (viewport_width, viewport_height))
+        aa_shader.uniform_float("color", _srgb_to_linear_rgba(color))
+        aa_shader.uniform_float("edgeSoftness", 1.0)  # 1-pixel soft edge for smooth anti-aliasing
+        aa_shader.uniform_float("cornerRadii", (geom.radius,) * 4)
+        aa_shader.uniform_float("rectPos", (geom.x, geom.y))
+        aa_shader.uniform_float("rectSize", (geom.width, geom.height))
+        DrawConstants.circle_quad_batch.draw(aa_shader)
     else:
-        # Fallback to regular circles if anti-aliased shader not available
+        # Fallback to regular circles and rectangles if the anti-aliased shader is not available
         shader = DrawConstants.uniform_shader
         shader.bind()
         shader.uniform_float("color", color)
-        for cx, cy in corners:
-            with gpu.matrix.push_pop():
-                gpu.matrix.translate((cx, cy))
-                gpu.matrix.scale_uniform(radius)
-                DrawConstants.filled_circle_batch.draw(shader)
-
-    # Now draw the rectangular parts on top of the corners with anti-aliasing
-    # Get viewport size for coordinate conversion
-    viewport = gpu.state.viewport_get()
-    viewport_width = viewport[2] if len(viewport) > 2 else 1920
-    viewport_height = viewport[3] if len(viewport) > 3 else 1080
-    
-    # Ensure color is a proper tuple with 4 components (RGBA)
-    if len(color) == 3:
-        color_rgba = (color[0], color[1], color[2], 1.0)
-    else:
-        color_rgba = color
-    
-    # Use anti-aliased rectangle shader if available
-    if DrawConstants.anti_aliased_rect_shader is not None:
-        aa_rect_shader = DrawConstants.anti_aliased_rect_shader
-        aa_rect_shader.bind()
-        aa_rect_shader.uniform_float("viewportSize", (viewport_width, viewport_height))
-        aa_rect_shader.uniform_float("color", color_rgba)
-        aa_rect_shader.uniform_float("edgeSoftness", 1.0)  # 1-pixel soft edge for smooth anti-aliasing
-        
-        # Draw horizontal strip with anti-aliasing
-        aa_rect_shader.uniform_float("rectPos", (x + radius, y))
-        aa_rect_shader.uniform_float("rectSize", (width - 2 * radius, height))
-        DrawConstants.circle_quad_batch.draw(aa_rect_shader)
-        
-        # Draw vertical strip with anti-aliasing
-        aa_rect_shader.uniform_float("rectPos", (x, y + radius))
-        aa_rect_shader.uniform_float("rectSize", (width, height - 2 * radius))
-        DrawConstants.circle_quad_batch.draw(aa_rect_shader)
-    else:
-        # Fallback to regular rectangles
-        shader = DrawConstants.uniform_shader
-        shader.bind()
-        shader.uniform_float("color", color)
-        
-        # Draw horizontal strip using cached batch and matrix transforms
         with gpu.matrix.push_pop():
-            gpu.matrix.translate((x + radius, y))
-            gpu.matrix.scale((width - 2 * radius, height))
-            DrawConstants.rect_batch_h.draw(shader)
-        
-        # Draw vertical strip using cached batch and matrix transforms
-        with gpu.matrix.push_pop():
-            gpu.matrix.translate((x, y + radius))
-            gpu.matrix.scale((width, height - 2 * radius))
-            DrawConstants.rect_batch_v.draw(shader)
+            gpu.matrix.translate((geom.x, geom.y))
+            _rounded_rect_fallback_batch(geom.width, geom.height, geom.radius).draw(shader)
+
+    if set_blend:
+        gpu.state.blend_set('NONE')
+
+
+def draw_rounded_rects(items):
+    """Draw several filled rounded rectangles with a single SDF draw call.
 
+    Args:
+        items: Sequence of (RoundedRectGeometry, color) pairs, drawn in order
+
+    Falls back to one draw_rounded_rect_geometry call per rect if the SDF
+    shader is unavailable or there are more than MAX_SDF_RECTS rects.
+    """
+    DrawConstants.initialize()
+
+    shader = DrawConstants.toolbar_sdf_shader
+    count = len(items)
+    if shader is None or count > DrawConstants.MAX_SDF_RECTS:
+        for geom, color in items:
+            draw_rounded_rect_geometry(geom, color)
+        return
+    if not count:
+        return
+
+    data = np.zeros((3, DrawConstants.MAX_SDF_RECTS, 4), dtype=np.float32)
+    rects, colors, params = data
+    for i, (geom, color) in enumerate(items):
+        rects[i] = (geom.x, geom.y, geom.width, geom.height)
+        colors[i] = _srgb_to_linear_rgba(color)
+        params[i, :2] = (geom.radius, 1.0)  # 1-pixel soft edge like the AA shader
+
+    # One quad covering every rect (+1px for the soft edge)
+    x0 = rects[:count, 0].min() - 1.0
+    y0 = rects[:count, 1].min() - 1.0
+    x1 = (rects[:count, 0] + rects[:count, 2]).max() + 1.0
+    y1 = (rects[:count, 1] + rects[:count, 3]).max() + 1.0
+
+    gpu.state.blend_set('ALPHA_PREMULT')
+    shader.bind()
+    shader.uniform_float("viewportSize", DrawConstants.viewport_size())
+    shader.uniform_float("bounds", (x0, y0, x1 - x0, y1 - y0))
+    shader.uniform_int("count", count)
+    for location, values in zip(DrawConstants.toolbar_sdf_locations, data):
+        shader.uniform_vector_float(location, values, 4, DrawConstants.MAX_SDF_RECTS)
+    DrawConstants.toolbar_quad_batch.draw(shader)
     gpu.state.blend_set('NONE')
 
 
+def _draw_unit_circle(batch, shader, cx, cy, radius):
+    """Draw a baked unit-circle batch scaled to radius and centered at (cx, cy).
+
+    The shader must already be bound with its color set.
+    """
+    with gpu.matrix.push_pop():
+        gpu.matrix.translate((cx, cy))
+        gpu.matrix.scale((radius, radius))
+        batch.draw(shader)
+
+
+def draw_image(texture, x, y, width, height):
+    """Draw a texture over the rect at (x, y) with the shared unit image quad.
+
+    The caller sets the blend mode. Returns False if the IMAGE shader is
+    unavailable.
+    """
+    DrawConstants.initialize()
+
+    shader = DrawConstants.image_shader
+    if shader is None:
+        return False
+
+    shader.bind()
+    shader.uniform_sampler("image", texture)
+    with gpu.matrix.push_pop():
+        gpu.matrix.translate((x, y))
+        gpu.matrix.scale((width, height))
+        DrawConstants.image_quad_batch.draw(shader)
+    return True
+
+
+@contextmanager
+def _drawing_into_offscreen(fbo):
+    """Draw into fbo (cleared to transparent black) in its own pixel space.
+
+    The projection maps pixels of the buffer and the AA shader's viewport
+    size points at it, so widgets draw at local coordinates exactly as they
+    would on screen. Everything is restored on exit.
+    """
+    width, height = fbo.width, fbo.height
+    frame_viewport_size = DrawConstants.frame_viewport_size
+    try:
+        with fbo.bind():
+            gpu.state.active_framebuffer_get().clear(color=(0.0, 0.0, 0.0, 0.0))
+            DrawConstants.frame_viewport_size = (width, height)
+            with gpu.matrix.push_pop(), gpu.matrix.push_pop_projection():
+                # Pixel-space projection so blf and the fallback paths
+                # land where the AA shader does
+                gpu.matrix.load_identity()
+                gpu.matrix.load_projection_matrix(Matrix((
+                    (2.0 / width, 0.0, 0.0, -1.0),
+                    (0.0, 2.0 / height, 0.0, -1.0),
+                    (0.0, 0.0, 1.0, 0.0),
+                    (0.0, 0.0, 0.0, 1.0),
+                )))
+                yield
+    finally:
+        DrawConstants.frame_viewport_size = frame_viewport_size
+
+
 class BL_UI_Widget:
     """Base widget class for UI elements.
 
@@ -628,6 +900,8 @@ class BL_UI_Widget:
         self.area_height = 0
         self._bg_color = (0.2, 0.2, 0.2, 0.9)
         self._visible = True
+        self._corner_radius = 8  # Background corner radius
+        self._geom = None  # RoundedRectGeometry, rebuilt lazily after update()
 
     @property
     def visible(self):
@@ -637,6 +911,26 @@ class BL_UI_Widget:
     def visible(self, value):
         self._visible = value
 
+    @property
+    def width(self):
+        return self._width
+
+    @width.setter
+    def width(self, value):
+        self._width = value
+        self._x2 = self.x_screen + value
+        self._geom = None
+
+    @property
+    def height(self):
+        return self._height
+
+    @height.setter
+    def height(self, value):
+        self._height = value
+        self._y2 = self.y_screen + value
+        self._geom = None
+
     def init(self, context):
         """Initialize widget with context information."""
         self.area_height = context.area.height
@@ -646,6 +940,27 @@ class BL_UI_Widget:
         """Update widget position."""
         self.x_screen = x
         self.y_screen = y
+        # Right/top edges for is_in_rect, kept in sync with position and size
+        self._x2 = x + self._width
+        self._y2 = y + self._height
+        self._geom = None
+
+    def _rebuild_geom(self):
+        """Precompute the background geometry for the current position and size."""
+        self._geom = RoundedRectGeometry.compute(
+            self.x_screen, self.y_screen, self.width, self.height, self._corner_radius
+        )
+        return self._geom
+
+    def background(self):
+        """Get (RoundedRectGeometry, color) of the widget background for draw_rounded_rects."""
+        return self._geom or self._rebuild_geom(), self._bg_color
+
+    def is_offscreen(self):
+        """Check if the widget lies completely outside the current frame's viewport."""
+        viewport_width, viewport_height = DrawConstants.viewport_size()
+        return (self._x2 < 0 or self._y2 < 0 or
+                self.x_screen > viewport_width or self.y_screen > viewport_height)
 
     def is_in_rect(self, x, y):
         """Check if point (x, y) is inside widget bounds.
@@ -658,26 +973,15 @@ class BL_UI_Widget:
             bool: True if point is inside widget
         """
         # Both mouse coordinates and widget position use Y=0 at bottom
-        if ((self.x_screen <= x <= (self.x_screen + self.width)) and
-                (self.y_screen <= y <= (self.y_screen + self.height))):
-            return True
-        return False
+        return self.x_screen <= x <= self._x2 and self.y_screen <= y <= self._y2
 
     def draw(self):
         """Draw the widget as a rounded rectangle."""
-        if not self._visible:
+        if not self._visible or self.is_offscreen():
             return
 
-        # Use the rounded rectangle drawing function
-        draw_rounded_rect(
-            self.x_screen,
-            self.y_screen,
-            self.width,
-            self.height,
-            8,  # 8px corner radius for background
-            self._bg_color,
-            segments=16
-        )
+        # Draw the rounded background from the cached geometry
+        draw_rounded_rect_geometry(self._geom or self._rebuild_geom(), self._bg_color)
 
 
 class BL_UI_Button(BL_UI_Widget):
@@ -697,19 +1001,17 @@ class BL_UI_Button(BL_UI_Widget):
         self._hover_bg_color = (0.3, 0.5, 0.7, 0.95)
         self._pressed_bg_color = (0.2, 0.4, 0.6, 1.0)
         self._normal_bg_color = (0.25, 0.25, 0.25, 0.9)
+        self._corner_radius = 4  # 4px corner radius for buttons
 
         self.__state = 0
         self.mouse_up_func = None
 
-        # Pre-create shader and batch for rectangle
-        self.shader = gpu.shader.from_builtin('UNIFORM_COLOR')
-        vertices = ((0, 0), (1, 0), (1, 1), (0, 1))
-        indices = ((0, 1, 2), (0, 2, 3))
-        self.batch = batch_for_shader(
-            self.shader, 'TRIS',
-            {"pos": vertices},
-            indices=indices
-        )
+        # Offscreen texture holding the rendered button face. It is redrawn
+        # only when _cache_key (state, size, text, color) changes; False
+        # means offscreen rendering is unavailable and we draw directly
+        self._cache_key = None
+        self._cache_fbo = None
+        self._text_dims = None  # (width, height) of the label, reset by the text/text_size setters
 
     @property
     def text(self):
@@ -718,6 +1020,7 @@ class BL_UI_Button(BL_UI_Widget):
     @text.setter
     def text(self, value):
         self._text = value
+        self._text_dims = None
 
     @property
     def text_size(self):
@@ -726,6 +1029,7 @@ class BL_UI_Button(BL_UI_Widget):
     @text_size.setter
     def text_size(self, value):
         self._text_size = value
+        self._text_dims = None
 
     def set_mouse_up(self, func):
         """Set callback for mouse up event."""
@@ -740,38 +1044,89 @@ class BL_UI_Button(BL_UI_Widget):
         return self._normal_bg_color
 
     def draw(self):
-        """Draw the button with current state and rounded corners."""
-        if not self.visible:
+        """Draw the button with current state and rounded corners.
+
+        The face is rendered once into an offscreen texture and blitted as a
+        single textured quad until hover/press state, size, text or color change.
+        """
+        if not self.visible or self.is_offscreen():
             return
 
-        area_height = self.area_height
-        color = self.get_button_color()
+        key = (self.__state, self.width, self.height, self._text,
+               self._text_size, self._text_color, self.get_button_color())
+        if self._cache_fbo is not False and (key == self._cache_key or self._render_cache(key)):
+            self._draw_cache()
+        else:
+            self._draw_face(self._geom or self._rebuild_geom())
 
+    def _draw_face(self, geom):
+        """Draw the rounded background and centered text for the given geometry."""
         # Draw filled rounded rectangle
-        draw_rounded_rect(
-            self.x_screen,
-            self.y_screen,
-            self.width,
-            self.height,
-            4,  # 4px corner radius for buttons
-            color,
-            segments=16
-        )
+        draw_rounded_rect_geometry(geom, self.get_button_color())
 
         # Draw text
-        self.draw_text(area_height)
+        self._draw_text_at(geom.x, geom.y)
+
+    def _render_cache(self, key):
+        """Render the button face into the offscreen texture for key.
+
+        Returns:
+            bool: False if offscreen rendering is unavailable (caching is then disabled)
+        """
+        width = int(math.ceil(self.width))
+        height = int(math.ceil(self.height))
+        try:
+            DrawConstants.initialize()
+            if DrawConstants.image_shader is None:
+                raise RuntimeError("IMAGE shader unavailable")
+
+            fbo = self._cache_fbo
+            if fbo is None or (fbo.width, fbo.height) != (width, height):
+                if fbo is not None:
+                    fbo.free()
+                self._cache_fbo = None
+                fbo = gpu.types.GPUOffScreen(width, height)
+                self._cache_fbo = fbo
+
+            with _drawing_into_offscreen(fbo):
+                self._draw_face(RoundedRectGeometry.compute(
+                    0, 0, self.width, self.height, self._corner_radius
+                ))
+        except Exception as e:
+            print(f"⚠️ Button texture cache unavailable, drawing directly: {e}")
+            self._cache_fbo = False
+            self._cache_key = None
+            return False
+
+        self._cache_key = key
+        return True
+
+    def _draw_cache(self):
+        """Blit the cached button face at the current position."""
+        fbo = self._cache_fbo
+
+        # The texture was blended onto transparent black, so it is premultiplied
+        gpu.state.blend_set('ALPHA_PREMULT')
+        draw_image(fbo.texture_color, self.x_screen, self.y_screen, fbo.width, fbo.height)
+        gpu.state.blend_set('NONE')
 
     def draw_text(self, area_height):
         """Draw button text centered."""
+        self._draw_text_at(self.x_screen, self.y_screen)
+
+    def _draw_text_at(self, x, y):
+        """Draw button text centered in the button whose bottom-left is (x, y)."""
         blf.size(0, self._text_size)
 
-        # Get text dimensions
-        text_width, text_height = blf.dimensions(0, self._text)
+        # Get text dimensions, measured once per (size, text)
+        if self._text_dims is None:
+            self._text_dims = blf.dimensions(0, self._text)
+        text_width, text_height = self._text_dims
 
         # Calculate centered position
-        # Y=0 is at bottom in GPU coordinates, so we add to y_screen
-        text_x = self.x_screen + (self.width - text_width) / 2.0
-        text_y = self.y_screen + (self.height / 2) - (text_height / 2)
+        # Y=0 is at bottom in GPU coordinates, so we add to y
+        text_x = x + (self.width - text_width) / 2.0
+        text_y = y + (self.height / 2) - (text_height / 2)
 
         blf.position(0, text_x, text_y, 0)
 
@@ -810,6 +1165,8 @@ class BL_UI_Button(BL_UI_Widget):
 class BL_UI_Dropdown(BL_UI_Widget):
     """Dropdown widget for selecting LOD levels."""
 
+    _ARROW_SIZE = 4  # Chevron arm length (half its width and its height)
+
     def __init__(self, x, y, width, height):
         super().__init__(x, y, width, height)
         self._items = []
@@ -824,27 +1181,31 @@ class BL_UI_Dropdown(BL_UI_Widget):
         self.on_change = None
         self._hovered_item_index = -1  # Track which item is being hovered
         self._has_ever_hovered = False  # Track if we've ever hovered over an item
+        self._corner_radius = 4  # 4px corner radius for dropdown
+
+        # Cached layout - box, arrow and menu geometry rebuilt with _geom
+        # after update()/set_items()
+        self._arrow_tip = None
+        self._arrow_batch = None  # Only built when the AA shader is unavailable
+        self._menu_layout = None
+
+        # Offscreen texture holding all menu item labels, redrawn only when
+        # _text_cache_key (items, text size, menu size) changes; False means
+        # offscreen rendering is unavailable and labels are drawn directly
+        self._text_cache_key = None
+        self._text_cache_fbo = None
 
         # Check icon for selected item
         self._check_icon_path = None
         self._check_icon_image = None
         self._check_icon_texture = None
 
-        # Pre-create shader and batch
-        self.shader = gpu.shader.from_builtin('UNIFORM_COLOR')
-        vertices = ((0, 0), (1, 0), (1, 1), (0, 1))
-        indices = ((0, 1, 2), (0, 2, 3))
-        self.batch = batch_for_shader(
-            self.shader, 'TRIS',
-            {"pos": vertices},
-            indices=indices
-        )
-
     def set_items(self, items):
         """Set the dropdown items."""
         self._items = items
         if items and self._selected_index >= len(items):
             self._selected_index = 0
+        self._geom = None  # Menu layout depends on the item count
 
     def get_selected_item(self):
         """Get the currently selected item."""
@@ -877,148 +1238,44 @@ class BL_UI_Dropdown(BL_UI_Widget):
         if self._check_icon_path:
             self._load_check_icon()
 
-    def _draw_selective_rounded_rect(self, x, y, width, height, color,
-                                      top_left=True, top_right=True, bottom_left=True, bottom_right=True,
-                                      radius=4):
-        """Draw a filled rectangle with selective rounded corners using cached batches.
+    def _rebuild_geom(self):
+        """Precompute box, arrow and open-menu geometry for the current position and size."""
+        geom = super()._rebuild_geom()
 
-        Args:
-            x, y: Bottom-left position
-            width, height: Rectangle dimensions
-            color: RGBA color tuple
-            top_left, top_right, bottom_left, bottom_right: Which corners to round
-            radius: Corner radius (default 4)
-        """
-        # Initialize shaders if needed
+        # Dropdown arrow (V shape), tip 16px from the right edge and 2px above center
         DrawConstants.initialize()
+        tip_x = self.x_screen + self.width - 16
+        tip_y = self.y_screen + self.height / 2 + 2 - self._ARROW_SIZE
+        self._arrow_tip = (tip_x, tip_y)
+        if DrawConstants.anti_aliased_shader is None:
+            # Fallback lines in screen space, so drawing them needs no matrix transform
+            arrow_size = self._ARROW_SIZE
+            self._arrow_batch = batch_for_shader(DrawConstants.uniform_shader, 'LINES', {"pos": (
+                (tip_x - arrow_size, tip_y + arrow_size), (tip_x, tip_y),  # Left line
+                (tip_x, tip_y), (tip_x + arrow_size, tip_y + arrow_size),  # Right line
+            )})
+
+        item_height = 24
+        gap = 2  # 2px gap between button and dropdown menu
+        wrapper_padding = 2  # 2px padding inside wrapper
+        wrapper_border = 1  # 1px border
+        wrapper_radius = 4  # Same border radius as dropdown button
+        item_radius = 2  # Half the size of dropdown button radius (4px)
 
-        gpu.state.blend_set('ALPHA')
-        
-        # Get viewport size for coordinate conversion
-        viewport = gpu.state.viewport_get()
-        viewport_width = viewport[2] if len(viewport) > 2 else 1920
-        viewport_height = viewport[3] if len(viewport) > 3 else 1080
-        
-        # Ensure color is a proper tuple with 4 components (RGBA)
-        if len(color) == 3:
-            color_rgba = (color[0], color[1], color[2], 1.0)
-        else:
-            color_rgba = color
-        
-        # Draw corners FIRST with anti-aliasing
-        corners_to_draw = []
-        if bottom_left:
-            corners_to_draw.append((x + radius, y + radius))
-        if bottom_right:
-            corners_to_draw.append((x + width - radius, y + radius))
-        if top_right:
-            corners_to_draw.append((x + width - radius, y + height - radius))
-        if top_left:
-            corners_to_draw.append((x + radius, y + height - radius))
-        
-        # Draw anti-aliased circles at corners
-        if DrawConstants.anti_aliased_circle_shader is not None and corners_to_draw:
-            aa_shader = DrawConstants.anti_aliased_circle_shader
-            scale_size = (radius + 1.0) * 2.0
-            
-            for cx, cy in corners_to_draw:
-                aa_shader.bind()
-                aa_shader.uniform_float("center", (cx, cy))
-                aa_shader.uniform_float("viewportSize", (viewport_width, viewport_height))
-                # Adjust radius so the anti-aliased outer edge aligns perfectly
-                edge_softness = 1.0
-                effective_radius = radius - edge_softness  # Outer edge will be at radius
-                aa_shader.uniform_float("radius", effective_radius)
-                aa_shader.uniform_float("color", color_rgba)
-                aa_shader.uniform_float("edgeSoftness", edge_softness)
-                aa_shader.uniform_float("scale", scale_size)
-                DrawConstants.circle_quad_batch.draw(aa_shader)
-        else:
-            # Fallback to regular circles
-            shader = DrawConstants.uniform_shader
-            shader.bind()
-            shader.uniform_float("color", color)
-            for cx, cy in corners_to_draw:
-                with gpu.matrix.push_pop():
-                    gpu.matrix.translate((cx, cy))
-                    gpu.matrix.scale_uniform(radius)
-                    DrawConstants.filled_circle_batch.draw(shader)
-        
-        # Draw rectangular parts with anti-aliasing
-        if DrawConstants.anti_aliased_rect_shader is not None:
-            aa_rect_shader = DrawConstants.anti_aliased_rect_shader
-            aa_rect_shader.bind()
-            aa_rect_shader.uniform_float("viewportSize", (viewport_width, viewport_height))
-            aa_rect_shader.uniform_float("color", color_rgba)
-            aa_rect_shader.uniform_float("edgeSoftness", 1.0)
-            
-            # Draw main horizontal strip
-            h_left = x if not bottom_left and not top_left else x + radius
-            h_right = x + width if not bottom_right and not top_right else x + width - radius
-            h_width = h_right - h_left
-            if h_width > 0:
-                aa_rect_shader.uniform_float("rectPos", (h_left, y))
-                aa_rect_shader.uniform_float("rectSize", (h_width, height))
-                DrawConstants.circle_quad_batch.draw(aa_rect_shader)
-            
-            # Draw left vertical strip if needed
-            if bottom_left or top_left:
-                bl_y = (y + radius) if bottom_left else y
-                tl_y = (y + height - radius) if top_left else (y + height)
-                v_height = tl_y - bl_y
-                if v_height > 0:
-                    aa_rect_shader.uniform_float("rectPos", (x, bl_y))
-                    aa_rect_shader.uniform_float("rectSize", (radius, v_height))
-                    DrawConstants.circle_quad_batch.draw(aa_rect_shader)
-            
-            # Draw right vertical strip if needed
-            if bottom_right or top_right:
-                br_y = (y + radius) if bottom_right else y
-                tr_y = (y + height - radius) if top_right else (y + height)
-                v_height = tr_y - br_y
-                if v_height > 0:
-                    aa_rect_shader.uniform_float("rectPos", (x + width - radius, br_y))
-                    aa_rect_shader.uniform_float("rectSize", (radius, v_height))
-                    DrawConstants.circle_quad_batch.draw(aa_rect_shader)
-        else:
-            # Fallback to regular rectangles
-            shader = DrawConstants.uniform_shader
-            shader.bind()
-            shader.uniform_float("color", color)
-            
-            # Draw main horizontal strip
-            h_left = x if not bottom_left and not top_left else x + radius
-            h_right = x + width if not bottom_right and not top_right else x + width - radius
-            h_width = h_right - h_left
-            
-            with gpu.matrix.push_pop():
-                gpu.matrix.translate((h_left, y))
-                gpu.matrix.scale((h_width, height))
-                DrawConstants.rect_batch_h.draw(shader)
-            
-            # Draw left vertical strip if needed
-            if bottom_left or top_left:
-                bl_y = (y + radius) if bottom_left else y
-                tl_y = (y + height - radius) if top_left else (y + height)
-                v_height = tl_y - bl_y
-                
-                with gpu.matrix.push_pop():
-                    gpu.matrix.translate((x, bl_y))
-                    gpu.matrix.scale((radius, v_height))
-                    DrawConstants.rect_batch_v.draw(shader)
-            
-            # Draw right vertical strip if needed
-            if bottom_right or top_right:
-                br_y = (y + radius) if bottom_right else y
-                tr_y = (y + height - radius) if top_right else (y + height)
-                v_height = tr_y - br_y
-                
-                with gpu.matrix.push_pop():
-                    gpu.matrix.translate((x + width - radius, br_y))
-                    gpu.matrix.scale((radius, v_height))
-                    DrawConstants.rect_batch_v.draw(shader)
+        # Menu wrapper sits above the button, items are stacked inside its padding
+        wrapper_y = self.y_screen + self.height + gap
+        wrapper_height = len(self._items) * item_height + (wrapper_padding * 2) + (wrapper_border * 2)
+        inner_x = self.x_screen + wrapper_border + wrapper_padding
+        inner_y = wrapper_y + wrapper_border + wrapper_padding
+        inner_width = self.width - (wrapper_border * 2) - (wrapper_padding * 2)
 
-        gpu.state.blend_set('NONE')
+        self._menu_layout = (
+            RoundedRectGeometry.compute(self.x_screen, wrapper_y, self.width, wrapper_height, wrapper_radius),
+            inner_x, inner_y, inner_width, item_height,
+            [RoundedRectGeometry.compute(inner_x, inner_y + i * item_height, inner_width, item_height, item_radius)
+             for i in range(len(self._items))],
+        )
+        return geom
 
     def _draw_rounded_border(self, x, y, width, height, radius, color, thickness):
         """Draw a rounded rectangle border with anti-aliased edges.
@@ -1029,125 +1286,23 @@ class BL_UI_Dropdown(BL_UI_Widget):
             radius: Corner radius
             color: RGBA color tuple
             thickness: Border line thickness
-        """
-        DrawConstants.initialize()
 
-        gpu.state.blend_set('ALPHA')
-        
-        # Get viewport size for coordinate conversion
-        viewport = gpu.state.viewport_get()
-        viewport_width = viewport[2] if len(viewport) > 2 else 1920
-        viewport_height = viewport[3] if len(viewport) > 3 else 1080
-        
-        # Ensure color is a proper tuple with 4 components (RGBA)
-        if len(color) == 3:
-            color_rgba = (color[0], color[1], color[2], 1.0)
-        else:
-            color_rgba = color
-        
-        # Draw straight edges FIRST with anti-aliased rectangles
-        # This ensures edges cover the inner parts of corners, preventing corners from sticking out
-        if DrawConstants.anti_aliased_rect_shader is not None:
-            aa_rect_shader = DrawConstants.anti_aliased_rect_shader
-            aa_rect_shader.bind()
-            aa_rect_shader.uniform_float("viewportSize", (viewport_width, viewport_height))
-            aa_rect_shader.uniform_float("color", color_rgba)
-            # For thin borders, use very small edge softness to ensure visibility
-            # The border should be mostly opaque with just a tiny fade at the very edges
-            border_edge_softness = max(0.1, min(0.3, thickness * 0.3))
-            aa_rect_shader.uniform_float("edgeSoftness", border_edge_softness)
-            
-            # Extend slightly into corner area for seamless connection
-            edge_overlap = 0.5  # Extend 0.5px into corner area
-            
-            # Draw bottom edge (positioned so the border line is at y)
-            # For a 1px border, we want it from y to y + thickness, with anti-aliasing
-            if width - 2 * radius + 2 * edge_overlap > 0:
-                # Position rectangle so the bottom edge aligns with y
-                aa_rect_shader.uniform_float("rectPos", (x + radius - edge_overlap, y))
-                aa_rect_shader.uniform_float("rectSize", (width - 2 * radius + 2 * edge_overlap, thickness))
-                DrawConstants.circle_quad_batch.draw(aa_rect_shader)
-            
-            # Draw top edge (positioned so the border line is at y + height)
-            if width - 2 * radius + 2 * edge_overlap > 0:
-                # Position rectangle so the top edge aligns with y + height
-                aa_rect_shader.uniform_float("rectPos", (x + radius - edge_overlap, y + height - thickness))
-                aa_rect_shader.uniform_float("rectSize", (width - 2 * radius + 2 * edge_overlap, thickness))
-                DrawConstants.circle_quad_batch.draw(aa_rect_shader)
-            
-            # Draw left edge (positioned so the border line is at x)
-            # For very thin vertical borders, use simple solid rectangles to ensure visibility
-            if height - 2 * radius + 2 * edge_overlap > 0:
-                if thickness <= 1.0:
-                    # For 1px borders, use simple solid rectangle without anti-aliasing
-                    # This ensures the border is fully visible
-                    simple_shader = DrawConstants.uniform_shader
-                    simple_shader.bind()
-                    simple_shader.uniform_float("color", color_rgba)
-                    with gpu.matrix.push_pop():
-                        gpu.matrix.translate((x, y + radius - edge_overlap))
-                        gpu.matrix.scale((thickness, height - 2 * radius + 2 * edge_overlap))
-                        DrawConstants.rect_batch_h.draw(simple_shader)
-                else:
-                    # For thicker borders, use anti-aliased shader
-                    vertical_edge_softness = max(0.05, min(0.2, thickness * 0.2))
-                    aa_rect_shader.uniform_float("edgeSoftness", vertical_edge_softness)
-                    aa_rect_shader.uniform_float("rectPos", (x, y + radius - edge_overlap))
-                    aa_rect_shader.uniform_float("rectSize", (thickness, height - 2 * radius + 2 * edge_overlap))
-                    DrawConstants.circle_quad_batch.draw(aa_rect_shader)
-                    aa_rect_shader.uniform_float("edgeSoftness", border_edge_softness)
-            
-            # Draw right edge (positioned so the border line is at x + width)
-            if height - 2 * radius + 2 * edge_overlap > 0:
-                if thickness <= 1.0:
-                    # For 1px borders, use simple solid rectangle without anti-aliasing
-                    simple_shader = DrawConstants.uniform_shader
-                    simple_shader.bind()
-                    simple_shader.uniform_float("color", color_rgba)
-                    with gpu.matrix.push_pop():
-                        gpu.matrix.translate((x + width - thickness, y + radius - edge_overlap))
-                        gpu.matrix.scale((thickness, height - 2 * radius + 2 * edge_overlap))
-                        DrawConstants.rect_batch_h.draw(simple_shader)
-                else:
-                    # For thicker borders, use anti-aliased shader
-                    vertical_edge_softness = max(0.05, min(0.2, thickness * 0.2))
-                    aa_rect_shader.uniform_float("edgeSoftness", vertical_edge_softness)
-                    aa_rect_shader.uniform_float("rectPos", (x + width - thickness, y + radius - edge_overlap))
-                    aa_rect_shader.uniform_float("rectSize", (thickness, height - 2 * radius + 2 * edge_overlap))
-                    DrawConstants.circle_quad_batch.draw(aa_rect_shader)
-                    aa_rect_shader.uniform_float("edgeSoftness", border_edge_softness)
-        
-        # Use anti-aliased quarter-circle arc shader for corners
-        # Draw corners AFTER edges so they blend correctly on the outer edge
-        if DrawConstants.anti_aliased_arc_shader is not None:
-            aa_arc_shader = DrawConstants.anti_aliased_arc_shader
-            scale_size = (radius + thickness * 0.5 + 1.0) * 2.0
-            edge_softness = 1.0
-            
-            # Adjust radius to account for edge softness, similar to filled rectangles
-            # This prevents corners from sticking out
-            effective_radius = radius - edge_softness * 0.5
-            
-            # Corner definitions: (center_x, center_y, start_angle, end_angle)
-            corners = [
-                (x + radius, y + radius, math.pi, 1.5 * math.pi),              # Bottom-left
-                (x + width - radius, y + radius, 1.5 * math.pi, 2.0 * math.pi),  # Bottom-right
-                (x + width - radius, y + height - radius, 0.0, 0.5 * math.pi),   # Top-right
-                (x + radius, y + height - radius, 0.5 * math.pi, math.pi),     # Top-left
-            ]
-            
-            for cx, cy, start_angle, end_angle in corners:
-                aa_arc_shader.bind()
-                aa_arc_shader.uniform_float("center", (cx, cy))
-                aa_arc_shader.uniform_float("viewportSize", (viewport_width, viewport_height))
-                aa_arc_shader.uniform_float("radius", effective_radius)
-                aa_arc_shader.uniform_float("thickness", thickness)
-                aa_arc_shader.uniform_float("color", color_rgba)
-                aa_arc_shader.uniform_float("edgeSoftness", edge_softness)
-                aa_arc_shader.uniform_float("startAngle", start_angle)
-                aa_arc_shader.uniform_float("endAngle", end_angle)
-                aa_arc_shader.uniform_float("scale", scale_size)
-                DrawConstants.circle_quad_batch.draw(aa_arc_shader)
+        Alpha blending must already be enabled by the caller.
+        """
+        aa_shader = DrawConstants.anti_aliased_shader
+        if aa_shader is not None:
+            # The whole border is one band of the rounded-box SDF, so edges and
+            # corners meet without overlap seams
+            aa_shader.bind()
+            aa_shader.uniform_int("shapeType", DrawConstants.AA_SHAPE_ROUNDED_BORDER)
+            aa_shader.uniform_float("viewportSize", DrawConstants.viewport_size())
+            aa_shader.uniform_float("color", _srgb_to_linear_rgba(color))
+            aa_shader.uniform_float("edgeSoftness", 1.0)
+            aa_shader.uniform_float("thickness", thickness)
+            aa_shader.uniform_float("cornerRadii", (radius,) * 4)
+            aa_shader.uniform_float("rectPos", (x, y))
+            aa_shader.uniform_float("rectSize", (width, height))
+            DrawConstants.circle_quad_batch.draw(aa_shader)
         else:
             # Fallback to regular border
             gpu.state.line_width_set(thickness)
@@ -1155,49 +1310,10 @@ class BL_UI_Dropdown(BL_UI_Widget):
             shader.bind()
             shader.uniform_float("color", color)
 
-            # Draw straight edge lines - Bottom edge
-            vertices = [(x + radius, y), (x + width - radius, y)]
-            batch = batch_for_shader(shader, 'LINES', {"pos": vertices})
-            batch.draw(shader)
-
-            # Right edge
-            vertices = [(x + width, y + radius), (x + width, y + height - radius)]
-            batch = batch_for_shader(shader, 'LINES', {"pos": vertices})
-            batch.draw(shader)
-
-            # Top edge
-            vertices = [(x + width - radius, y + height), (x + radius, y + height)]
-            batch = batch_for_shader(shader, 'LINES', {"pos": vertices})
-            batch.draw(shader)
-
-            # Left edge
-            vertices = [(x, y + height - radius), (x, y + radius)]
-            batch = batch_for_shader(shader, 'LINES', {"pos": vertices})
-            batch.draw(shader)
-
-            # Draw quarter-circle arcs at corners
-            segments_per_arc = 32
-            corners = [
-                (x + radius, y + radius, math.pi, 1.5 * math.pi),              # Bottom-left
-                (x + width - radius, y + radius, 1.5 * math.pi, 2 * math.pi),  # Bottom-right
-                (x + width - radius, y + height - radius, 0, 0.5 * math.pi),   # Top-right
-                (x + radius, y + height - radius, 0.5 * math.pi, math.pi),     # Top-left
-            ]
-
-            for cx, cy, start_angle, end_angle in corners:
-                arc_vertices = []
-                for i in range(segments_per_arc + 1):
-                    angle = start_angle + (end_angle - start_angle) * i / segments_per_arc
-                    vx = cx + radius * math.cos(angle)
-                    vy = cy + radius * math.sin(angle)
-                    arc_vertices.append((vx, vy))
-
-                arc_batch = batch_for_shader(shader, 'LINE_STRIP', {"pos": arc_vertices})
-                arc_batch.draw(shader)
-
+            # Edges and 32-segment corner arcs as one cached closed outline
+            _draw_rounded_outline(shader, x, y, width, height, radius, 32)
             gpu.state.line_width_set(1.0)
 
-        gpu.state.blend_set('NONE')
 
     def _draw_check_icon(self, x, y, item_height, item_width=None):
         """Draw the check icon on the right side of a dropdown item.
@@ -1219,184 +1335,178 @@ class BL_UI_Dropdown(BL_UI_Widget):
         icon_x = x + width - icon_size - 8  # 8px right padding
         icon_y = y + (item_height - icon_size) / 2  # Center vertically
 
-        # Use IMAGE shader to draw the texture
+        # Draw the texture on the shared image quad
         gpu.state.blend_set('ALPHA')
-
-        try:
-            shader = gpu.shader.from_builtin('IMAGE')
-        except:
-            gpu.state.blend_set('NONE')
-            return
-
-        # Create batch for image quad
-        vertices = [
-            (icon_x, icon_y),
-            (icon_x + icon_size, icon_y),
-            (icon_x + icon_size, icon_y + icon_size),
-            (icon_x, icon_y + icon_size)
-        ]
-
-        texcoords = [(0, 0), (1, 0), (1, 1), (0, 1)]
-        indices = [(0, 1, 2), (0, 2, 3)]
-
-        batch = batch_for_shader(
-            shader, 'TRIS',
-            {"pos": vertices, "texCoord": texcoords},
-            indices=indices
-        )
-
-        shader.bind()
-        shader.uniform_sampler("image", self._check_icon_texture)
-        batch.draw(shader)
-
+        draw_image(self._check_icon_texture, icon_x, icon_y, icon_size, icon_size)
         gpu.state.blend_set('NONE')
 
     def draw(self):
         """Draw the dropdown widget."""
-        if not self.visible:
+        # The open menu extends above the box, so only a closed dropdown can be culled by its box
+        if not self.visible or (not self._is_open and self.is_offscreen()):
             return
 
+        geom = self._geom or self._rebuild_geom()
+
+        # Box, border and arrow share one alpha blend state
+        gpu.state.blend_set('ALPHA')
+
         # Draw main dropdown box with rounded corners
-        draw_rounded_rect(
-            self.x_screen,
-            self.y_screen,
-            self.width,
-            self.height,
-            4,  # 4px corner radius for dropdown
-            self._bg_color,
-            segments=16
-        )
+        draw_rounded_rect_geometry(geom, self._bg_color, set_blend=False)
 
-        # Draw border with accept button color (0.329, 0.329, 0.329, 1.0)
+        # Draw border with accept button color
         self._draw_rounded_border(
-            self.x_screen,
-            self.y_screen,
-            self.width,
-            self.height,
-            4,  # Same corner radius
-            (0.329, 0.329, 0.329, 1.0),  # Accept button color
+            geom.x, geom.y, geom.width, geom.height,
+            geom.radius,  # Same corner radius
+            _BORDER_COLOR,
             1  # Border thickness
         )
 
         # Draw text
         if self._items and 0 <= self._selected_index < len(self._items):
             selected_text = self._items[self._selected_index]
-            blf.size(0, self._text_size)
-            text_width, text_height = blf.dimensions(0, selected_text)
+            text_width, text_height = _text_dims(selected_text, self._text_size)
 
             text_x = self.x_screen + 8  # Left padding
             text_y = self.y_screen + (self.height / 2) - (text_height / 2)
 
+            blf.size(0, self._text_size)
             blf.position(0, text_x, text_y, 0)
             r, g, b, a = self._text_color
             blf.color(0, r, g, b, a)
             blf.draw(0, selected_text)
 
-        # Draw dropdown arrow using cached chevron batch
-        arrow_x = self.x_screen + self.width - 16
-        arrow_y = self.y_screen + self.height / 2 + 2  # 2px higher
-        arrow_size = 4
-
-        DrawConstants.initialize()
-        gpu.state.blend_set('ALPHA')
-
-        shader = DrawConstants.uniform_shader
-        shader.bind()
-        shader.uniform_float("color", (1.0, 1.0, 1.0, 1.0))
-
-        # Use cached chevron batch with matrix transform
-        with gpu.matrix.push_pop():
-            gpu.matrix.translate((arrow_x, arrow_y - arrow_size))
-            gpu.matrix.scale_uniform(arrow_size)
-            DrawConstants.chevron_batch.draw(shader)
+        # Draw dropdown arrow as an anti-aliased SDF stroke
+        aa_shader = DrawConstants.anti_aliased_shader
+        if aa_shader is not None:
+            aa_shader.bind()
+            aa_shader.uniform_int("shapeType", DrawConstants.AA_SHAPE_CHEVRON)
+            aa_shader.uniform_float("viewportSize", DrawConstants.viewport_size())
+            aa_shader.uniform_float("color", _srgb_to_linear_rgba((1.0, 1.0, 1.0, 1.0)))
+            aa_shader.uniform_float("edgeSoftness", 1.0)
+            aa_shader.uniform_float("thickness", 1.0)
+            aa_shader.uniform_float("radius", self._ARROW_SIZE)
+            aa_shader.uniform_float("center", self._arrow_tip)
+            aa_shader.uniform_float("scale", (self._ARROW_SIZE + 1.0) * 2.0)
+            DrawConstants.circle_quad_batch.draw(aa_shader)
+        else:
+            shader = DrawConstants.uniform_shader
+            shader.bind()
+            shader.uniform_float("color", (1.0, 1.0, 1.0, 1.0))
+            self._arrow_batch.draw(shader)
 
         gpu.state.blend_set('NONE')
 
         # If dropdown is open, draw items
         if self._is_open and self._items:
-            item_height = 24
-            gap = 2  # 2px gap between button and dropdown menu
-            wrapper_padding = 2  # 2px padding inside wrapper
-            wrapper_border = 1  # 1px border
-            wrapper_radius = 4  # Same border radius as dropdown button
-            
-            # Position dropdown menu with 2px gap from button
-            dropdown_y = self.y_screen + self.height + gap
-            total_height = len(self._items) * item_height
-            
-            # Calculate wrapper dimensions
-            wrapper_width = self.width
-            wrapper_height = total_height + (wrapper_padding * 2) + (wrapper_border * 2)
-            wrapper_x = self.x_screen
-            wrapper_y = dropdown_y
-            
-            # Inner content area (inside padding and border)
-            inner_x = wrapper_x + wrapper_border + wrapper_padding
-            inner_y = wrapper_y + wrapper_border + wrapper_padding
-            inner_width = wrapper_width - (wrapper_border * 2) - (wrapper_padding * 2)
-            inner_height = total_height
-            
-            # Draw wrapper background with rounded corners (use menu background color)
-            draw_rounded_rect(
-                wrapper_x, wrapper_y, wrapper_width, wrapper_height,
-                wrapper_radius, self._menu_bg_color, segments=16
-            )
-            
-            # Draw wrapper border
-            self._draw_rounded_border(
-                wrapper_x, wrapper_y, wrapper_width, wrapper_height,
-                wrapper_radius, (0.329, 0.329, 0.329, 1.0), wrapper_border
-            )
+            wrapper_geom, inner_x, inner_y, inner_width, item_height, item_geoms = self._menu_layout
+            if wrapper_geom.y > DrawConstants.viewport_size()[1]:
+                return  # Menu opens entirely above the viewport
 
-            # Draw all items with menu background color and rounded corners
-            item_radius = 2  # Half the size of dropdown button radius (4px)
-            for i in range(len(self._items)):
-                item_y = inner_y + (i * item_height)
-                # Draw each item with menu background color and rounded corners
-                draw_rounded_rect(
-                    inner_x, item_y, inner_width, item_height,
-                    item_radius, self._menu_bg_color, segments=16
-                )
+            # Wrapper, item, active and hovered backgrounds go into a single SDF
+            # draw (in this order, so later rects paint over earlier ones)
+            backgrounds = [(wrapper_geom, self._menu_bg_color)]
+            backgrounds.extend((item_geom, self._menu_bg_color) for item_geom in item_geoms)
 
-            # Draw active (selected) item with hover color background
+            # Active (selected) item with hover color background
             # Only show background when no item is being hovered AND we haven't ever hovered
             if 0 <= self._selected_index < len(self._items) and self._hovered_item_index == -1 and not self._has_ever_hovered:
-                active_item_y = inner_y + (self._selected_index * item_height)
-                item_radius = 2  # Half the size of dropdown button radius (4px)
-                # Draw active item background with all corners rounded (2px radius)
-                draw_rounded_rect(
-                    inner_x, active_item_y, inner_width, item_height,
-                    item_radius, self._active_bg_color, segments=16
-                )
+                backgrounds.append((item_geoms[self._selected_index], self._active_bg_color))
 
-            # Now draw hovered item on top with different color (takes priority over active)
+            # Hovered item on top with different color (takes priority over active)
             if 0 <= self._hovered_item_index < len(self._items):
-                hovered_item_y = inner_y + (self._hovered_item_index * item_height)
-                item_radius = 2  # Half the size of dropdown button radius (4px)
-                # Draw hovered item background with all corners rounded (2px radius)
-                draw_rounded_rect(
-                    inner_x, hovered_item_y, inner_width, item_height,
-                    item_radius, self._hover_bg_color, segments=16
-                )
+                backgrounds.append((item_geoms[self._hovered_item_index], self._hover_bg_color))
 
-            # Draw item text for all items
-            for i, item in enumerate(self._items):
-                item_y = inner_y + (i * item_height)
+            draw_rounded_rects(backgrounds)
 
-                # Draw item text
-                blf.size(0, self._text_size)
-                text_x = inner_x + 8
-                text_y = item_y + (item_height / 2) - 6
+            # Draw wrapper border (items are inset by the padding, so it can go last)
+            gpu.state.blend_set('ALPHA')
+            self._draw_rounded_border(
+                wrapper_geom.x, wrapper_geom.y, wrapper_geom.width, wrapper_geom.height,
+                wrapper_geom.radius, _BORDER_COLOR, 1
+            )
+            gpu.state.blend_set('NONE')
 
-                blf.position(0, text_x, text_y, 0)
-                blf.color(0, 1.0, 1.0, 1.0, 1.0)
-                blf.draw(0, item)
+            # Draw item text for all items, blitted from the label texture
+            key = (tuple(self._items), self._text_size, inner_width, item_height)
+            if self._text_cache_fbo is not False and (key == self._text_cache_key or self._render_text_cache(key)):
+                self._draw_text_cache(inner_x, inner_y)
+            else:
+                self._draw_item_texts(inner_x, inner_y, item_height)
 
             # Draw check icon for selected item (always visible, regardless of hover)
             if 0 <= self._selected_index < len(self._items):
                 selected_item_y = inner_y + (self._selected_index * item_height)
                 self._draw_check_icon(inner_x, selected_item_y, item_height, inner_width)
 
+    def _draw_item_texts(self, x, y, item_height):
+        """Draw the labels of all items, the first one in the row whose bottom-left is (x, y)."""
+        # Font size and color are shared by all items
+        blf.size(0, self._text_size)
+        blf.color(0, 1.0, 1.0, 1.0, 1.0)
+        text_x = x + 8
+        text_y = y + (item_height / 2) - 6
+        for item in self._items:
+            blf.position(0, text_x, text_y, 0)
+            blf.draw(0, item)
+            text_y += item_height
+
+    def _render_text_cache(self, key):
+        """Render all item labels into the offscreen texture for key.
+
+        Returns:
+            bool: False if offscreen rendering is unavailable (caching is then disabled)
+        """
+        _, _, inner_width, item_height = key
+        width = int(math.ceil(inner_width))
+        height = int(math.ceil(len(self._items) * item_height))
+        try:
+            DrawConstants.initialize()
+            if DrawConstants.image_shader is None:
+                raise RuntimeError("IMAGE shader unavailable")
+
+            fbo = self._text_cache_fbo
+            if fbo is None or (fbo.width, fbo.height) != (width, height):
+                if fbo is not None:
+                    fbo.free()
+                self._text_cache_fbo = None
+                fbo = gpu.types.GPUOffScreen(width, height)
+                self._text_cache_fbo = fbo
+
+            with _drawing_into_offscreen(fbo):
+                self._draw_item_texts(0, 0, item_height)
+        except Exception as e:
+            print(f"⚠️ Dropdown label texture unavailable, drawing directly: {e}")
+            self._text_cache_fbo = False
+            self._text_cache_key = None
+            return False
+
+        self._text_cache_key = key
+        return True
+
+    def _draw_text_cache(self, x, y):
+        """Blit the cached item labels with their bottom-left at (x, y)."""
+        fbo = self._text_cache_fbo
+
+        # The labels were blended onto transparent black, so they are premultiplied
+        gpu.state.blend_set('ALPHA_PREMULT')
+        draw_image(fbo.texture_color, x, y, fbo.width, fbo.height)
+        gpu.state.blend_set('NONE')
+
+    def _item_index_at(self, x, y):
+        """Get the index of the open menu item under (x, y), or -1.
+
+        Items are stacked at a fixed pitch, so the row follows directly from y.
+        """
+        if self._geom is None:
+            self._rebuild_geom()
+        _, inner_x, inner_y, inner_width, item_height, _ = self._menu_layout
+        if inner_x <= x <= (inner_x + inner_width) and y >= inner_y:
+            index = int((y - inner_y) // item_height)
+            if index < len(self._items):
+                return index
+        return -1
+
     def mouse_move(self, x, y):
         """Handle mouse move event to track hover state."""
         if not self._is_open:
@@ -1404,25 +1514,9 @@ class BL_UI_Dropdown(BL_UI_Widget):
             return
 
         # Check which dropdown item is being hovered
-        item_height = 24
-        gap = 2  # 2px gap between button and dropdown menu
-        wrapper_padding = 2  # 2px padding inside wrapper
-        wrapper_border = 1  # 1px border
-        
-        # Position dropdown menu with 2px gap from button
-        dropdown_y = self.y_screen + self.height + gap
-        inner_y = dropdown_y + wrapper_border + wrapper_padding
-        inner_x = self.x_screen + wrapper_border + wrapper_padding
-        inner_width = self.width - (wrapper_border * 2) - (wrapper_padding * 2)
-
-        self._hovered_item_index = -1  # Reset
-        for i, item in enumerate(self._items):
-            item_y = inner_y + (i * item_height)
-            if (inner_x <= x <= (inner_x + inner_width) and
-                    item_y <= y <= (item_y + item_height)):
-                self._hovered_item_index = i
-                self._has_ever_hovered = True  # Mark that we've hovered
-                break
+        self._hovered_item_index = self._item_index_at(x, y)
+        if self._hovered_item_index != -1:
+            self._has_ever_hovered = True  # Mark that we've hovered
 
     def mouse_down(self, x, y):
         """Handle mouse down event."""
@@ -1438,27 +1532,14 @@ class BL_UI_Dropdown(BL_UI_Widget):
             return True
         elif self._is_open:
             # Check if clicked on an item in the dropdown
-            item_height = 24
-            gap = 2  # 2px gap between button and dropdown menu
-            wrapper_padding = 2  # 2px padding inside wrapper
-            wrapper_border = 1  # 1px border
-            
-            # Position dropdown menu with 2px gap from button
-            dropdown_y = self.y_screen + self.height + gap
-            inner_y = dropdown_y + wrapper_border + wrapper_padding
-            inner_x = self.x_screen + wrapper_border + wrapper_padding
-            inner_width = self.width - (wrapper_border * 2) - (wrapper_padding * 2)
-
-            for i, item in enumerate(self._items):
-                item_y = inner_y + (i * item_height)
-                if (inner_x <= x <= (inner_x + inner_width) and
-                        item_y <= y <= (item_y + item_height)):
-                    self._selected_index = i
-                    self._is_open = False
-                    self._hovered_item_index = -1  # Reset hover when selecting
-                    if self.on_change:
-                        self.on_change(item)
-                    return True
+            index = self._item_index_at(x, y)
+            if index != -1:
+                self._selected_index = index
+                self._is_open = False
+                self._hovered_item_index = -1  # Reset hover when selecting
+                if self.on_change:
+                    self.on_change(self._items[index])
+                return True
 
             # Clicked outside dropdown, close it
             self._is_open = False
@@ -1476,7 +1557,7 @@ class BL_UI_Checkbox(BL_UI_Widget):
         self._text_color = (1.0, 1.0, 1.0, 1.0)
         self._checked = False
         self._checkbox_size = 16
-        self._checkbox_border_color = (0.329, 0.329, 0.329, 1.0)  # Accept button color
+        self._checkbox_border_color = _BORDER_COLOR
         self._checkbox_bg_color = (0.157, 0.157, 0.157, 1.0)  # #282828
         self._checkbox_check_color = (0.2, 0.5, 0.8, 1.0)  # Blue checkmark
         self.on_change = None
@@ -1499,22 +1580,24 @@ class BL_UI_Checkbox(BL_UI_Widget):
 
     def draw(self):
         """Draw the checkbox with label."""
-        if not self.visible:
+        if not self.visible or self.is_offscreen():
             return
 
         # Calculate checkbox position (left side)
         checkbox_x = self.x_screen
         checkbox_y = self.y_screen + (self.height - self._checkbox_size) / 2
 
+        # Background, border and checkmark share one alpha blend state
+        gpu.state.blend_set('ALPHA')
+
         # Draw checkbox background
-        draw_rounded_rect(
-            checkbox_x,
-            checkbox_y,
-            self._checkbox_size,
-            self._checkbox_size,
-            2,  # 2px corner radius
+        draw_rounded_rect_geometry(
+            RoundedRectGeometry.compute(
+                checkbox_x, checkbox_y, self._checkbox_size, self._checkbox_size,
+                2  # 2px corner radius
+            ),
             self._checkbox_bg_color,
-            segments=8
+            set_blend=False
         )
 
         # Draw checkbox border
@@ -1524,10 +1607,12 @@ class BL_UI_Checkbox(BL_UI_Widget):
         if self._checked:
             self._draw_checkmark(checkbox_x, checkbox_y, self._checkbox_size)
 
+        gpu.state.blend_set('NONE')
+
         # Draw label text (to the right of checkbox)
         blf.size(0, self._text_size)
         text_x = checkbox_x + self._checkbox_size + 6  # 6px gap between checkbox and text
-        text_y = self.y_screen + (self.height / 2) - (blf.dimensions(0, self._text)[1] / 2)
+        text_y = self.y_screen + (self.height / 2) - (_text_dims(self._text, self._text_size)[1] / 2)
 
         blf.position(0, text_x, text_y, 0)
         r, g, b, a = self._text_color
@@ -1535,113 +1620,22 @@ class BL_UI_Checkbox(BL_UI_Widget):
         blf.draw(0, self._text)
 
     def _draw_checkbox_border(self, x, y, size, color, thickness):
-        """Draw checkbox border with anti-aliasing."""
-        DrawConstants.initialize()
-        
-        gpu.state.blend_set('ALPHA')
-        
-        # Get viewport size for coordinate conversion
-        viewport = gpu.state.viewport_get()
-        viewport_width = viewport[2] if len(viewport) > 2 else 1920
-        viewport_height = viewport[3] if len(viewport) > 3 else 1080
-        
-        # Ensure color is a proper tuple with 4 components (RGBA)
-        if len(color) == 3:
-            color_rgba = (color[0], color[1], color[2], 1.0)
-        else:
-            color_rgba = color
-        
+        """Draw checkbox border with anti-aliasing (caller enables blending)."""
         radius = 2
-        
-        # Draw straight edges FIRST with anti-aliased rectangles
-        if DrawConstants.anti_aliased_rect_shader is not None:
-            aa_rect_shader = DrawConstants.anti_aliased_rect_shader
-            aa_rect_shader.bind()
-            aa_rect_shader.uniform_float("viewportSize", (viewport_width, viewport_height))
-            aa_rect_shader.uniform_float("color", color_rgba)
-            # Use very small edge softness for thin borders
-            border_edge_softness = max(0.1, min(0.3, thickness * 0.3))
-            aa_rect_shader.uniform_float("edgeSoftness", border_edge_softness)
-            
-            edge_overlap = 0.5
-            
-            # Draw bottom edge
-            if size - 2 * radius + 2 * edge_overlap > 0:
-                aa_rect_shader.uniform_float("rectPos", (x + radius - edge_overlap, y))
-                aa_rect_shader.uniform_float("rectSize", (size - 2 * radius + 2 * edge_overlap, thickness))
-                DrawConstants.circle_quad_batch.draw(aa_rect_shader)
-            
-            # Draw top edge
-            if size - 2 * radius + 2 * edge_overlap > 0:
-                aa_rect_shader.uniform_float("rectPos", (x + radius - edge_overlap, y + size - thickness))
-                aa_rect_shader.uniform_float("rectSize", (size - 2 * radius + 2 * edge_overlap, thickness))
-                DrawConstants.circle_quad_batch.draw(aa_rect_shader)
-            
-            # Draw left edge
-            if size - 2 * radius + 2 * edge_overlap > 0:
-                if thickness <= 1.0:
-                    # For 1px borders, use simple solid rectangle
-                    simple_shader = DrawConstants.uniform_shader
-                    simple_shader.bind()
-                    simple_shader.uniform_float("color", color_rgba)
-                    with gpu.matrix.push_pop():
-                        gpu.matrix.translate((x, y + radius - edge_overlap))
-                        gpu.matrix.scale((thickness, size - 2 * radius + 2 * edge_overlap))
-                        DrawConstants.rect_batch_h.draw(simple_shader)
-                else:
-                    vertical_edge_softness = max(0.05, min(0.2, thickness * 0.2))
-                    aa_rect_shader.uniform_float("edgeSoftness", vertical_edge_softness)
-                    aa_rect_shader.uniform_float("rectPos", (x, y + radius - edge_overlap))
-                    aa_rect_shader.uniform_float("rectSize", (thickness, size - 2 * radius + 2 * edge_overlap))
-                    DrawConstants.circle_quad_batch.draw(aa_rect_shader)
-                    aa_rect_shader.uniform_float("edgeSoftness", border_edge_softness)
-            
-            # Draw right edge
-            if size - 2 * radius + 2 * edge_overlap > 0:
-                if thickness <= 1.0:
-                    # For 1px borders, use simple solid rectangle
-                    simple_shader = DrawConstants.uniform_shader
-                    simple_shader.bind()
-                    simple_shader.uniform_float("color", color_rgba)
-                    with gpu.matrix.push_pop():
-                        gpu.matrix.translate((x + size - thickness, y + radius - edge_overlap))
-                        gpu.matrix.scale((thickness, size - 2 * radius + 2 * edge_overlap))
-                        DrawConstants.rect_batch_h.draw(simple_shader)
-                else:
-                    vertical_edge_softness = max(0.05, min(0.2, thickness * 0.2))
-                    aa_rect_shader.uniform_float("edgeSoftness", vertical_edge_softness)
-                    aa_rect_shader.uniform_float("rectPos", (x + size - thickness, y + radius - edge_overlap))
-                    aa_rect_shader.uniform_float("rectSize", (thickness, size - 2 * radius + 2 * edge_overlap))
-                    DrawConstants.circle_quad_batch.draw(aa_rect_shader)
-                    aa_rect_shader.uniform_float("edgeSoftness", border_edge_softness)
-        
-        # Use anti-aliased quarter-circle arc shader for corners
-        if DrawConstants.anti_aliased_arc_shader is not None:
-            aa_arc_shader = DrawConstants.anti_aliased_arc_shader
-            scale_size = (radius + thickness * 0.5 + 1.0) * 2.0
-            edge_softness = 1.0
-            effective_radius = radius - edge_softness * 0.5
-            
-            # Corner definitions: (center_x, center_y, start_angle, end_angle)
-            corners = [
-                (x + radius, y + radius, math.pi, 1.5 * math.pi),              # Bottom-left
-                (x + size - radius, y + radius, 1.5 * math.pi, 2.0 * math.pi),  # Bottom-right
-                (x + size - radius, y + size - radius, 0.0, 0.5 * math.pi),   # Top-right
-                (x + radius, y + size - radius, 0.5 * math.pi, math.pi),     # Top-left
-            ]
-            
-            for cx, cy, start_angle, end_angle in corners:
-                aa_arc_shader.bind()
-                aa_arc_shader.uniform_float("center", (cx, cy))
-                aa_arc_shader.uniform_float("viewportSize", (viewport_width, viewport_height))
-                aa_arc_shader.uniform_float("radius", effective_radius)
-                aa_arc_shader.uniform_float("thickness", thickness)
-                aa_arc_shader.uniform_float("color", color_rgba)
-                aa_arc_shader.uniform_float("edgeSoftness", edge_softness)
-                aa_arc_shader.uniform_float("startAngle", start_angle)
-                aa_arc_shader.uniform_float("endAngle", end_angle)
-                aa_arc_shader.uniform_float("scale", scale_size)
-                DrawConstants.circle_quad_batch.draw(aa_arc_shader)
+
+        aa_shader = DrawConstants.anti_aliased_shader
+        if aa_shader is not None:
+            # One rounded-box SDF band for edges and corners together
+            aa_shader.bind()
+            aa_shader.uniform_int("shapeType", DrawConstants.AA_SHAPE_ROUNDED_BORDER)
+            aa_shader.uniform_float("viewportSize", DrawConstants.viewport_size())
+            aa_shader.uniform_float("color", _srgb_to_linear_rgba(color))
+            aa_shader.uniform_float("edgeSoftness", 1.0)
+            aa_shader.uniform_float("thickness", thickness)
+            aa_shader.uniform_float("cornerRadii", (radius,) * 4)
+            aa_shader.uniform_float("rectPos", (x, y))
+            aa_shader.uniform_float("rectSize", (size, size))
+            DrawConstants.circle_quad_batch.draw(aa_shader)
         else:
             # Fallback to regular border
             gpu.state.line_width_set(thickness)
@@ -1649,69 +1643,23 @@ class BL_UI_Checkbox(BL_UI_Widget):
             shader.bind()
             shader.uniform_float("color", color)
             
-            vertices = []
-            segments = 4
-            # Bottom edge
-            vertices.append((x + radius, y))
-            vertices.append((x + size - radius, y))
-            # Bottom-right corner
-            cx, cy = x + size - radius, y + radius
-            for i in range(segments + 1):
-                angle = 1.5 * math.pi + (0.5 * math.pi * i / segments)
-                vertices.append((cx + radius * math.cos(angle), cy + radius * math.sin(angle)))
-            # Right edge
-            vertices.append((x + size, y + size - radius))
-            # Top-right corner
-            cx, cy = x + size - radius, y + size - radius
-            for i in range(segments + 1):
-                angle = 0 + (0.5 * math.pi * i / segments)
-                vertices.append((cx + radius * math.cos(angle), cy + radius * math.sin(angle)))
-            # Top edge
-            vertices.append((x + size - radius, y + size))
-            vertices.append((x + radius, y + size))
-            # Top-left corner
-            cx, cy = x + radius, y + size - radius
-            for i in range(segments + 1):
-                angle = 0.5 * math.pi + (0.5 * math.pi * i / segments)
-                vertices.append((cx + radius * math.cos(angle), cy + radius * math.sin(angle)))
-            # Left edge
-            vertices.append((x, y + size - radius))
-            vertices.append((x, y + radius))
-            # Bottom-left corner
-            cx, cy = x + radius, y + radius
-            for i in range(segments + 1):
-                angle = math.pi + (0.5 * math.pi * i / segments)
-                vertices.append((cx + radius * math.cos(angle), cy + radius * math.sin(angle)))
-            vertices.append((x + radius, y))
-            
-            batch = batch_for_shader(shader, 'LINE_STRIP', {"pos": vertices})
-            batch.draw(shader)
+            _draw_rounded_outline(shader, x, y, size, size, radius)
             gpu.state.line_width_set(1.0)
 
-        gpu.state.blend_set('NONE')
-
     def _draw_checkmark(self, x, y, size):
-        """Draw checkmark inside checkbox."""
-        gpu.state.blend_set('ALPHA')
+        """Draw checkmark inside checkbox (caller enables blending)."""
         gpu.state.line_width_set(2.0)
 
-        shader = gpu.shader.from_builtin('UNIFORM_COLOR')
-
-        # Create checkmark shape
-        padding = 3
-        vertices = (
-            (x + padding + 2, y + size / 2),
-            (x + size / 2 - 1, y + padding + 2),
-            (x + size - padding, y + size - padding)
-        )
-
-        batch = batch_for_shader(shader, 'LINE_STRIP', {"pos": vertices})
+        # Checkmark shape is cached per size and translated into place
+        batch = _checkmark_batch(size)
+        shader = DrawConstants.uniform_shader
         shader.bind()
         shader.uniform_float("color", self._checkbox_check_color)
-        batch.draw(shader)
+        with gpu.matrix.push_pop():
+            gpu.matrix.translate((x, y))
+            batch.draw(shader)
 
         gpu.state.line_width_set(1.0)
-        gpu.state.blend_set('NONE')
 
     def mouse_down(self, x, y):
         """Handle mouse down event."""
@@ -1737,11 +1685,18 @@ class BL_UI_ToggleButton(BL_UI_Widget):
         self._bg_color = (0.114, 0.114, 0.114, 1.0)  # #1d1d1d (same as toolbar background)
         self._toggled_bg_color = (0.0745, 0.541, 0.910, 1.0)  # #138ae8 when toggled
         self._hover_bg_color = (0.2, 0.2, 0.2, 1.0)
-        self._border_color = (0.329, 0.329, 0.329, 1.0)
+        self._corner_radius = 2  # 2px corner radius
+        self._border_color = _BORDER_COLOR
         self._text_color = (1.0, 1.0, 1.0, 1.0)
         self._is_hovered = False
         self.on_toggle = None
 
+        # Cached layout - text metrics keyed on (icon_text, icon_size), icon
+        # geometry recomputed in update() when the button moves
+        self._cached_text_dims = None
+        self._cached_text_key = None
+        self._icon_geometry = None
+
     @property
     def toggled(self):
         return self._toggled
@@ -1757,6 +1712,7 @@ class BL_UI_ToggleButton(BL_UI_Widget):
     @icon_text.setter
     def icon_text(self, value):
         self._icon_text = value
+        self._cached_text_dims = None
 
     @property
     def icon_path(self):
@@ -1796,155 +1752,96 @@ class BL_UI_ToggleButton(BL_UI_Widget):
         if self._icon_path:
             self._load_icon_image()
 
-    def draw(self):
-        """Draw the square toggle button."""
-        if not self.visible:
-            return
-
-        # Determine background color
+    def background(self):
+        """Get (RoundedRectGeometry, color) of the background for the current state."""
         if self._toggled:
             bg_color = self._toggled_bg_color
         elif self._is_hovered:
             bg_color = self._hover_bg_color
         else:
             bg_color = self._bg_color
+        return self._geom or self._rebuild_geom(), bg_color
+
+    def draw(self):
+        """Draw the square toggle button."""
+        if not self.visible or self.is_offscreen():
+            return
 
         # Draw background
-        draw_rounded_rect(
-            self.x_screen,
-            self.y_screen,
-            self.width,
-            self.height,
-            2,  # 2px corner radius
-            bg_color,
-            segments=8
-        )
+        draw_rounded_rect_geometry(*self.background())
+        self.draw_foreground()
+
+    def draw_foreground(self):
+        """Draw the icon only, for when the background was drawn with draw_rounded_rects."""
+        if not self.visible or self.is_offscreen():
+            return
 
         # Border removed - no border drawing
 
-        # Draw icon image or text
-        if self._icon_texture:
+        # Draw icon image or text (text if the shared image shader is unavailable)
+        DrawConstants.initialize()
+        if self._icon_texture and DrawConstants.image_shader is not None:
             # Draw icon image centered
             self._draw_icon_image()
         else:
             # Draw icon text centered (fallback)
-            blf.size(0, self._icon_size)
-            text_width, text_height = blf.dimensions(0, self._icon_text)
-            text_x = self.x_screen + (self.width - text_width) / 2
-            text_y = self.y_screen + (self.height - text_height) / 2
-
-            blf.position(0, text_x, text_y, 0)
-            r, g, b, a = self._text_color
-            blf.color(0, r, g, b, a)
-            blf.draw(0, self._icon_text)
+            self._draw_icon_text()
 
-    def _draw_icon_image(self):
-        """Draw the icon image centered in the button."""
-        if not self._icon_texture:
-            return
+    def update(self, x, y):
+        """Update widget position."""
+        super().update(x, y)
 
-        # Calculate icon size (leave some padding)
+        # Icon only depends on the widget rect, so compute it once per move
         padding = 4
         icon_size = min(self.width, self.height) - (padding * 2)
         icon_x = self.x_screen + (self.width - icon_size) / 2
         icon_y = self.y_screen + (self.height - icon_size) / 2
+        self._icon_geometry = (icon_x, icon_y, icon_size)
+
+    def _get_text_dimensions(self):
+        """Get (width, height) of the icon text, measuring only when text or size changed."""
+        key = (self._icon_text, self._icon_size)
+        if self._cached_text_dims is None or self._cached_text_key != key:
+            blf.size(0, self._icon_size)
+            self._cached_text_dims = blf.dimensions(0, self._icon_text)
+            self._cached_text_key = key
+        return self._cached_text_dims
 
-        # Use 2D image shader to draw the texture
+    def _draw_icon_text(self):
+        """Draw the icon text centered in the button."""
+        text_width, text_height = self._get_text_dimensions()
+        text_x = self.x_screen + (self.width - text_width) / 2
+        text_y = self.y_screen + (self.height - text_height) / 2
+
+        blf.size(0, self._icon_size)
+        blf.position(0, text_x, text_y, 0)
+        r, g, b, a = self._text_color
+        blf.color(0, r, g, b, a)
+        blf.draw(0, self._icon_text)
+
+    def _draw_icon_image(self):
+        """Draw the icon image centered in the button."""
+        # Icon size/position (with padding) is cached in update()
+        if self._icon_geometry is None:
+            self.update(self.x_screen, self.y_screen)
+        icon_x, icon_y, icon_size = self._icon_geometry
+
+        # Draw the texture on the shared image quad
         gpu.state.blend_set('ALPHA')
-        
-        # Create shader for image drawing (2D_IMAGE is the correct builtin shader)
-        try:
-            shader = gpu.shader.from_builtin('2D_IMAGE')
-        except:
-            # Fallback: try alternative shader name for different Blender versions
-            try:
-                shader = gpu.shader.from_builtin('IMAGE')
-            except:
-                # If shader not available, fall back to text
-                blf.size(0, self._icon_size)
-                text_width, text_height = blf.dimensions(0, self._icon_text)
-                text_x = self.x_screen + (self.width - text_width) / 2
-                text_y = self.y_screen + (self.height - text_height) / 2
-                blf.position(0, text_x, text_y, 0)
-                r, g, b, a = self._text_color
-                blf.color(0, r, g, b, a)
-                blf.draw(0, self._icon_text)
-                gpu.state.blend_set('NONE')
-                return
-        
-        shader.bind()
-        shader.uniform_sampler("image", self._icon_texture)
-        
-        # Create quad vertices for the icon
-        vertices = (
-            (icon_x, icon_y),
-            (icon_x + icon_size, icon_y),
-            (icon_x + icon_size, icon_y + icon_size),
-            (icon_x, icon_y + icon_size)
-        )
-        
-        # Texture coordinates (corrected to fix vertical mirroring)
-        tex_coords = (
-            (0, 0),  # Bottom-left vertex -> bottom-left of texture
-            (1, 0),  # Bottom-right vertex -> bottom-right of texture
-            (1, 1),  # Top-right vertex -> top-right of texture
-            (0, 1)   # Top-left vertex -> top-left of texture
-        )
-        
-        indices = ((0, 1, 2), (0, 2, 3))
-        batch = batch_for_shader(shader, 'TRIS', {"pos": vertices, "texCoord": tex_coords}, indices=indices)
-        batch.draw(shader)
-        
+        draw_image(self._icon_texture, icon_x, icon_y, icon_size, icon_size)
         gpu.state.blend_set('NONE')
 
     def _draw_border(self, x, y, size, color, thickness):
         """Draw button border."""
-        import math
         gpu.state.blend_set('ALPHA')
         gpu.state.line_width_set(thickness)
 
+        DrawConstants.initialize()
         radius = 2
-        shader = gpu.shader.from_builtin('UNIFORM_COLOR')
-        vertices = []
-
-        # Create rounded rectangle border
-        segments = 4
-        # Bottom edge
-        vertices.append((x + radius, y))
-        vertices.append((x + size - radius, y))
-        # Bottom-right corner
-        cx, cy = x + size - radius, y + radius
-        for i in range(segments + 1):
-            angle = 1.5 * math.pi + (0.5 * math.pi * i / segments)
-            vertices.append((cx + radius * math.cos(angle), cy + radius * math.sin(angle)))
-        # Right edge
-        vertices.append((x + size, y + size - radius))
-        # Top-right corner
-        cx, cy = x + size - radius, y + size - radius
-        for i in range(segments + 1):
-            angle = 0 + (0.5 * math.pi * i / segments)
-            vertices.append((cx + radius * math.cos(angle), cy + radius * math.sin(angle)))
-        # Top edge
-        vertices.append((x + size - radius, y + size))
-        vertices.append((x + radius, y + size))
-        # Top-left corner
-        cx, cy = x + radius, y + size - radius
-        for i in range(segments + 1):
-            angle = 0.5 * math.pi + (0.5 * math.pi * i / segments)
-            vertices.append((cx + radius * math.cos(angle), cy + radius * math.sin(angle)))
-        # Left edge
-        vertices.append((x, y + size - radius))
-        vertices.append((x, y + radius))
-        # Bottom-left corner
-        cx, cy = x + radius, y + radius
-        for i in range(segments + 1):
-            angle = math.pi + (0.5 * math.pi * i / segments)
-            vertices.append((cx + radius * math.cos(angle), cy + radius * math.sin(angle)))
-
-        batch = batch_for_shader(shader, 'LINE_STRIP', {"pos": vertices})
+        shader = DrawConstants.uniform_shader
         shader.bind()
         shader.uniform_float("color", color)
-        batch.draw(shader)
+        _draw_rounded_outline(shader, x, y, size, size, radius)
 
         gpu.state.line_width_set(1.0)
         gpu.state.blend_set('NONE')
@@ -1979,6 +1876,7 @@ class BL_UI_DropdownButton(BL_UI_Widget):
         self._icon_texture = None
         self._bg_color = (0.114, 0.114, 0.114, 1.0)  # #1d1d1d (same as toolbar background)
         self._hover_bg_color = (0.475, 0.475, 0.475, 1.0)  # #797979
+        self._corner_radius = 2  # 2px corner radius
         self._is_hovered = False
         self.on_click = None
 
@@ -2017,24 +1915,24 @@ class BL_UI_DropdownButton(BL_UI_Widget):
         if self._icon_path:
             self._load_icon_image()
 
+    def background(self):
+        """Get (RoundedRectGeometry, color) of the background for the current state."""
+        bg_color = self._hover_bg_color if self._is_hovered else self._bg_color
+        return self._geom or self._rebuild_geom(), bg_color
+
     def draw(self):
         """Draw the dropdown button."""
-        if not self.visible:
-            return
-
-        # Determine background color
-        bg_color = self._hover_bg_color if self._is_hovered else self._bg_color
+        if not self.visible or self.is_offscreen():
+            return
 
         # Draw background
-        draw_rounded_rect(
-            self.x_screen,
-            self.y_screen,
-            self.width,
-            self.height,
-            2,  # 2px corner radius
-            bg_color,
-            segments=8
-        )
+        draw_rounded_rect_geometry(*self.background())
+        self.draw_foreground()
+
+    def draw_foreground(self):
+        """Draw the icon only, for when the background was drawn with draw_rounded_rects."""
+        if not self.visible or self.is_offscreen():
+            return
 
         # Draw icon if available
         if self._icon_texture:
@@ -2052,36 +1950,9 @@ class BL_UI_DropdownButton(BL_UI_Widget):
         icon_x = self.x_screen + (self.width - icon_width) / 2
         icon_y = self.y_screen + (self.height - icon_height) / 2
 
-        # Use IMAGE shader to draw the texture
+        # Draw the texture on the shared image quad
         gpu.state.blend_set('ALPHA')
-
-        try:
-            shader = gpu.shader.from_builtin('IMAGE')
-        except:
-            gpu.state.blend_set('NONE')
-            return
-
-        # Create batch for image quad
-        vertices = [
-            (icon_x, icon_y),
-            (icon_x + icon_width, icon_y),
-            (icon_x + icon_width, icon_y + icon_height),
-            (icon_x, icon_y + icon_height)
-        ]
-
-        texcoords = [(0, 0), (1, 0), (1, 1), (0, 1)]
-        indices = [(0, 1, 2), (0, 2, 3)]
-
-        batch = batch_for_shader(
-            shader, 'TRIS',
-            {"pos": vertices, "texCoord": texcoords},
-            indices=indices
-        )
-
-        shader.bind()
-        shader.uniform_sampler("image", self._icon_texture)
-        batch.draw(shader)
-
+        draw_image(self._icon_texture, icon_x, icon_y, icon_width, icon_height)
         gpu.state.blend_set('NONE')
 
     def mouse_down(self, x, y):
@@ -2200,88 +2071,22 @@ class BL_UI_HDRIThumbnailButton(BL_UI_Widget):
         img_y = self.y_screen + padding
 
         gpu.state.blend_set('ALPHA')
-
-        try:
-            shader = gpu.shader.from_builtin('IMAGE')
-        except:
-            gpu.state.blend_set('NONE')
-            return
-
-        # Create batch for image quad
-        vertices = [
-            (img_x, img_y),
-            (img_x + img_width, img_y),
-            (img_x + img_width, img_y + img_height),
-            (img_x, img_y + img_height)
-        ]
-
-        texcoords = [(0, 0), (1, 0), (1, 1), (0, 1)]
-        indices = [(0, 1, 2), (0, 2, 3)]
-
-        batch = batch_for_shader(
-            shader, 'TRIS',
-            {"pos": vertices, "texCoord": texcoords},
-            indices=indices
-        )
-
-        shader.bind()
-        shader.uniform_sampler("image", self._thumbnail_texture)
-        batch.draw(shader)
-
+        draw_image(self._thumbnail_texture, img_x, img_y, img_width, img_height)
         gpu.state.blend_set('NONE')
 
     def _draw_border(self, color, width):
         """Draw border around the thumbnail."""
-        DrawConstants.initialize()
         gpu.state.blend_set('ALPHA')
         gpu.state.line_width_set(width)
 
+        DrawConstants.initialize()
         shader = DrawConstants.uniform_shader
 
-        # Create rounded rectangle outline
+        # Rounded rectangle outline, built once per size
         radius = 18
-        x, y = self.x_screen, self.y_screen
-        w, h = self.width, self.height
-
-        vertices = []
-        segments = 16
-
-        # Bottom edge
-        vertices.append((x + radius, y))
-        vertices.append((x + w - radius, y))
-        # Bottom-right corner
-        cx, cy = x + w - radius, y + radius
-        for i in range(segments + 1):
-            angle = 1.5 * math.pi + (0.5 * math.pi * i / segments)
-            vertices.append((cx + radius * math.cos(angle), cy + radius * math.sin(angle)))
-        # Right edge
-        vertices.append((x + w, y + h - radius))
-        # Top-right corner
-        cx, cy = x + w - radius, y + h - radius
-        for i in range(segments + 1):
-            angle = 0 + (0.5 * math.pi * i / segments)
-            vertices.append((cx + radius * math.cos(angle), cy + radius * math.sin(angle)))
-        # Top edge
-        vertices.append((x + w - radius, y + h))
-        vertices.append((x + radius, y + h))
-        # Top-left corner
-        cx, cy = x + radius, y + h - radius
-        for i in range(segments + 1):
-            angle = 0.5 * math.pi + (0.5 * math.pi * i / segments)
-            vertices.append((cx + radius * math.cos(angle), cy + radius * math.sin(angle)))
-        # Left edge
-        vertices.append((x, y + h - radius))
-        vertices.append((x, y + radius))
-        # Bottom-left corner
-        cx, cy = x + radius, y + radius
-        for i in range(segments + 1):
-            angle = math.pi + (0.5 * math.pi * i / segments)
-            vertices.append((cx + radius * math.cos(angle), cy + radius * math.sin(angle)))
-
-        batch = batch_for_shader(shader, 'LINE_STRIP', {"pos": vertices})
         shader.bind()
         shader.uniform_float("color", color)
-        batch.draw(shader)
+        _draw_rounded_outline(shader, self.x_screen, self.y_screen, self.width, self.height, radius, 16)
 
         gpu.state.line_width_set(1.0)
         gpu.state.blend_set('NONE')
@@ -2355,11 +2160,27 @@ class BL_UI_HDRIPanel(BL_UI_Widget):
             btn.on_select = self._handle_thumbnail_select
             self.thumbnail_buttons.append(btn)
 
+        self._sync_thumbnail_bounds()
+
     def init(self, context):
         """Initialize panel and all thumbnail buttons."""
         super().init(context)
         for btn in self.thumbnail_buttons:
             btn.init(context)
+        self._sync_thumbnail_bounds()
+
+    def _sync_thumbnail_bounds(self):
+        """Refresh the (N, 4) array of thumbnail bounds (x1, y1, x2, y2) used for hit-testing."""
+        self._thumb_bounds = np.array(
+            [(btn.x_screen, btn.y_screen, btn._x2, btn._y2) for btn in self.thumbnail_buttons],
+            dtype=np.float32,
+        ).reshape(-1, 4)
+
+    def _thumbnail_index_at(self, x, y):
+        """Get the index of the thumbnail under (x, y) with one vectorized test, or -1."""
+        bounds = self._thumb_bounds
+        mask = (bounds[:, 0] <= x) & (x <= bounds[:, 2]) & (bounds[:, 1] <= y) & (y <= bounds[:, 3])
+        return int(mask.argmax()) if mask.any() else -1
 
     def _handle_thumbnail_select(self, hdr_path, hdri_name):
         """Handle thumbnail selection."""
@@ -2451,12 +2272,7 @@ class BL_UI_HDRIPanel(BL_UI_Widget):
         if not self.is_in_rect(x, y):
             return False
 
-        # Check thumbnail buttons
-        for btn in self.thumbnail_buttons:
-            if btn.mouse_down(x, y):
-                return True
-
-        # Click was on panel background (consume event)
+        # Click on a thumbnail or on the panel background: consume event either way
         return True
 
     def mouse_up(self, x, y):
@@ -2464,9 +2280,9 @@ class BL_UI_HDRIPanel(BL_UI_Widget):
         if not self.is_in_rect(x, y):
             return False
 
-        for btn in self.thumbnail_buttons:
-            if btn.mouse_up(x, y):
-                return True
+        index = self._thumbnail_index_at(x, y)
+        if index >= 0:
+            self.thumbnail_buttons[index].mouse_up(x, y)
 
         return True
 
@@ -2475,16 +2291,16 @@ class BL_UI_HDRIPanel(BL_UI_Widget):
         if not self.visible:
             return
 
-        for btn in self.thumbnail_buttons:
-            btn.mouse_move(x, y)
+        index = self._thumbnail_index_at(x, y)
+        for i, btn in enumerate(self.thumbnail_buttons):
+            btn._is_hovered = i == index
 
     def update_position(self, x, y):
         """Update panel position and reposition all thumbnails."""
         # Update panel position (including screen coordinates)
         self.x = x
         self.y = y
-        self.x_screen = x
-        self.y_screen = y
+        self.update(x, y)
 
         # Recalculate thumbnail positions
         thumbnail_size = 128
@@ -2506,8 +2322,9 @@ class BL_UI_HDRIPanel(BL_UI_Widget):
 
             btn.x = btn_x
             btn.y = btn_y
-            btn.x_screen = btn_x
-            btn.y_screen = btn_y
+            btn.update(btn_x, btn_y)
+
+        self._sync_thumbnail_bounds()
 
 
 class BL_UI_Slider(BL_UI_Widget):
@@ -2526,7 +2343,7 @@ class BL_UI_Slider(BL_UI_Widget):
         self._track_height = 4
         self._track_color = (0.333, 0.333, 0.333, 1.0)  # #555555 (inside min/max range)
         self._track_color_outside = (0.2, 0.2, 0.2, 1.0)  # Darker gray for outside range (slightly brighter)
-        self._track_border_color = (0.329, 0.329, 0.329, 1.0)
+        self._track_border_color = _BORDER_COLOR
         self._handle_radius = 8
         self._handle_color = (0.0745, 0.541, 0.910, 1.0)  # #138ae8
         self._handle_hover_color = (0.094, 0.620, 1.0, 1.0)  # Slightly lighter
@@ -2554,9 +2371,23 @@ class BL_UI_Slider(BL_UI_Widget):
         self._white_number_color = (1.0, 1.0, 1.0, 1.0)  # White for 0 and MAX LOD
         self._orange_warning_color = (1.0, 0.5, 0.0, 1.0)  # Orange for warning state
 
+        # Track/marker geometry is only rebuilt when _dirty is set by a geometry
+        # change or geometry_key changes; value, hover, drag and loading state
+        # only affect the handle, which is drawn separately
+        self._dirty = True
+        self._geometry_batch = None  # Fused track + gradient + marker triangles
+        self._geometry_key = None
+        self._indicator_xs = []  # X positions of missing-LOD indicators
+        self._number_labels = ()  # (text, x, y, color) of every LOD number, rebuilt with the geometry
+
+        # Lookup table: raw slider position -> value clamped to the min/max LOD range
+        self._value_map = ()
+        self._build_value_map()
+
     def set_available_lods(self, lod_levels):
         """Set which LOD levels are available (enabled markers)."""
         self._available_lods = lod_levels
+        self._dirty = True
 
     def set_min_max_lods(self, min_lod, max_lod):
         """Set the min and max LOD values for displaying markers above the track."""
@@ -2566,6 +2397,19 @@ class BL_UI_Slider(BL_UI_Widget):
             self._max_lod = max_lod
             # Clear marker positions to force recalculation on next draw
             self._marker_positions = []
+            self._build_value_map()
+            self._dirty = True
+
+    def _build_value_map(self):
+        """Precompute the clamped value for every slider position.
+
+        The knob slides from position 0 to position maxLOD (including auto-generated
+        LODs). Position 0 corresponds to Quixel LOD minLOD (shown at bottom), so the
+        lower bound is always 0; without a maxLOD the full slider range is allowed.
+        """
+        upper = self._max_lod if self._max_lod is not None else self._max_value
+        positions = np.arange(self._min_value, self._max_value + 1)
+        self._value_map = tuple(np.clip(positions, 0, upper).tolist())
 
     def set_object_max_lod(self, max_lod):
         """Set the object's maximum available LOD level."""
@@ -2573,6 +2417,7 @@ class BL_UI_Slider(BL_UI_Widget):
         # Don't change _max_value - keep it at 7 to show all markers
         # Clear marker positions to force recalculation
         self._marker_positions = []
+        self._dirty = True
 
     def set_loading_state(self, is_loading):
         """Set the loading state of the slider (affects handle color)."""
@@ -2580,24 +2425,14 @@ class BL_UI_Slider(BL_UI_Widget):
 
     def set_auto_lod_enabled(self, enabled):
         """Set the Auto LOD enabled state (affects orange indicators)."""
-        self._auto_lod_enabled = enabled
+        if self._auto_lod_enabled != enabled:
+            self._auto_lod_enabled = enabled
+            self._dirty = True
 
     def set_value(self, value):
         """Set the slider value (LOD level 0-7), clamped to min/max range."""
-        # First clamp to overall slider range (0-7)
-        value = max(self._min_value, min(self._max_value, value))
-
-        # Then clamp to min/max LOD range if set
-        # The knob should slide in the range from 0 to maxLOD (including auto-generated LODs)
-        # Position 0 corresponds to Quixel LOD minLOD (shown at bottom)
-        # Position maxLOD corresponds to the max LOD (shown at top)
-        if self._min_lod is not None and self._max_lod is not None:
-            # Allow sliding from position 0 to position maxLOD (to include auto-generated LODs)
-            value = max(0, min(value, self._max_lod))
-        elif self._min_lod is not None:
-            value = max(0, value)  # Start from position 0
-        elif self._max_lod is not None:
-            value = min(value, self._max_lod)
+        # Clamp to overall slider range (0-7), then map into the min/max LOD range
+        value = self._value_map[max(self._min_value, min(self._max_value, int(value)))]
 
         self._current_value = value
 
@@ -2612,13 +2447,10 @@ class BL_UI_Slider(BL_UI_Widget):
         
         # Recalculate if positions don't exist or if the number of markers has changed
         if not self._marker_positions or len(self._marker_positions) != num_markers:
-            usable_width = self.width - (self._handle_radius * 2)
-            spacing = usable_width / (num_markers - 1) if num_markers > 1 else 0
-
-            self._marker_positions = []
-            for i in range(num_markers):
-                x = self.x_screen + self._handle_radius + (i * spacing)
-                self._marker_positions.append(x)
+            # Stored as a tuple so it can be passed straight into the compiled helpers
+            self._marker_positions = tuple(_compute_marker_positions(
+                float(self.x_screen), float(self.width), float(self._handle_radius), num_markers
+            ))
 
     def _get_handle_position(self):
         """Get the X position of the handle for current value."""
@@ -2635,28 +2467,12 @@ class BL_UI_Slider(BL_UI_Widget):
             self._calculate_marker_positions()
 
         # Find closest marker
-        min_dist = float('inf')
-        closest_value = self._current_value
-
-        for i, marker_x in enumerate(self._marker_positions):
-            dist = abs(x - marker_x)
-            if dist < min_dist:
-                min_dist = dist
-                closest_value = i
+        closest_value = _closest_marker_index(self._marker_positions, float(x))
+        if closest_value < 0:
+            closest_value = self._current_value
 
         # Clamp value to min/max LOD range
-        # The knob should slide in the range from 0 to maxLOD (including auto-generated LODs)
-        # Position 0 corresponds to Quixel LOD minLOD (shown at bottom)
-        # Position maxLOD corresponds to the max LOD (shown at top)
-        if self._min_lod is not None and self._max_lod is not None:
-            # Allow sliding from position 0 to position maxLOD (to include auto-generated LODs)
-            closest_value = max(0, min(closest_value, self._max_lod))
-        elif self._min_lod is not None:
-            closest_value = max(0, closest_value)  # Start from position 0
-        elif self._max_lod is not None:
-            closest_value = min(closest_value, self._max_lod)
-
-        return closest_value
+        return self._value_map[closest_value]
 
     def draw(self):
         """Draw the slider with track, markers, and handle."""
@@ -2666,9 +2482,34 @@ class BL_UI_Slider(BL_UI_Widget):
         # Recalculate marker positions if needed
         self._calculate_marker_positions()
 
-        # Determine if we're in warning state (min_lod > 0)
-        is_warning_state = (self._min_lod is not None and self._min_lod > 0)
-        
+        # Track, gradients and markers are fused into one cached batch that is
+        # only rebuilt when something affecting the geometry changed
+        geometry_key = (
+            self.x_screen, self.y_screen, self.width, self.height,
+            self._min_lod, self._max_lod, self._auto_lod_enabled,
+            tuple(self._available_lods) if self._available_lods else (),
+        )
+        if self._dirty or self._geometry_batch is None or geometry_key != self._geometry_key:
+            self._rebuild_geometry()
+            self._geometry_key = geometry_key
+
+        if self._geometry_batch is not None:
+            gpu.state.blend_set('ALPHA')
+            shader = gpu.shader.from_builtin('SMOOTH_COLOR')
+            shader.bind()
+            self._geometry_batch.draw(shader)
+            gpu.state.blend_set('NONE')
+
+        self._draw_missing_indicators()
+        self._draw_number_labels()
+        self._draw_handle()
+
+        self._dirty = False
+
+    def _rebuild_geometry(self):
+        """Rebuild the fused track + marker batch from the current slider state."""
+        builder = SliderGeometryBuilder()
+
         # Determine which LODs need auto-generation or are missing
         # Preview LOD i maps to Quixel LOD (minLOD + i)
         # We need to check all preview LODs from 0 to maxLOD (the slider positions)
@@ -2695,6 +2536,9 @@ class BL_UI_Slider(BL_UI_Widget):
                     if self._auto_lod_enabled:
                         auto_generated_lods.add(quixel_lod)
 
+        # X positions of the orange dot / "?" indicators for missing LODs
+        self._indicator_xs = []
+
         # Draw track (split into segments based on min/max range)
         track_y = self.y_screen + (self.height - self._track_height) / 2
         track_start_x = self.x_screen + self._handle_radius
@@ -2702,7 +2546,19 @@ class BL_UI_Slider(BL_UI_Widget):
 
         # Draw track - always full width from start to end
         track_end_x = track_start_x + track_full_width
-        
+
+        # Colors at the two ends of the track, used for the rounded end caps
+        track_ends = [self._track_color, self._track_color]
+
+        def add_track_piece(x, width, color_left, color_right=None):
+            if color_right is None:
+                color_right = color_left
+            builder.add_quad(x, track_y, width, self._track_height, color_left, color_right)
+            if x <= track_start_x:
+                track_ends[0] = color_left
+            if x + width >= track_end_x:
+                track_ends[1] = color_right
+
         if self._min_lod is not None and self._max_lod is not None and len(self._marker_positions) > 0:
             # Calculate positions
             # Min marker at position 0 (where bottom shows minLOD, top shows 0)
@@ -2714,24 +2570,7 @@ class BL_UI_Slider(BL_UI_Widget):
 
             # Segment 1: Start to min_lod (darker gray)
             if min_lod_x > track_start_x:
-                segment1_width = min_lod_x - track_start_x
-                draw_rounded_rect(
-                    track_start_x,
-                    track_y,
-                    segment1_width,
-                    self._track_height,
-                    2,
-                    self._track_color_outside,
-                    segments=8
-                )
-
-            # Find the first orange segment position (if any)
-            first_orange_preview_lod = None
-            for preview_lod in range(0, self._max_lod + 1):
-                quixel_lod = self._min_lod + preview_lod
-                if quixel_lod in auto_generated_lods:
-                    first_orange_preview_lod = preview_lod
-                    break
+                add_track_piece(track_start_x, min_lod_x - track_start_x, self._track_color_outside)
 
             # Segment 2: min_lod to max_lod - draw per preview LOD level
             # Draw each preview LOD segment separately, using orange for auto-generated ones
@@ -2768,155 +2607,53 @@ class BL_UI_Slider(BL_UI_Widget):
                 # Use orange if this Quixel LOD needs auto-generation, otherwise normal color
                 # IMPORTANT: Check if this Quixel LOD needs auto-generation
                 is_auto_generated = quixel_lod in auto_generated_lods
-                if is_auto_generated:
-                    segment_color = self._orange_warning_color
-                else:
-                    segment_color = self._track_color
-                
-                # Draw the segment
-                draw_rounded_rect(
-                    segment_start_x,
-                    track_y,
-                    segment_width,
-                    self._track_height,
-                    2,
-                    segment_color,
-                    segments=8
-                )
+                segment_color = self._orange_warning_color if is_auto_generated else self._track_color
+                add_track_piece(segment_start_x, segment_width, segment_color)
 
                 # Draw gradient when transitioning from non-orange to orange segment (autoLOD enabled)
-                # Check if current segment is orange and previous segment was not orange
+                # The gradient is a single quad with per-vertex colors (SMOOTH_COLOR interpolates)
                 if is_auto_generated and self._auto_lod_enabled:
                     if preview_lod > 0:
-                        # Check if previous segment was orange
-                        prev_quixel_lod = self._min_lod + (preview_lod - 1)
-                        prev_is_orange = prev_quixel_lod in auto_generated_lods
-
                         # Only draw gradient if previous segment was NOT orange (transition point)
-                        if not prev_is_orange:
+                        prev_quixel_lod = self._min_lod + (preview_lod - 1)
+                        if prev_quixel_lod not in auto_generated_lods:
                             # Draw gradient from previous marker to this orange marker
-                            prev_segment_start_index = preview_lod - 1
-                            if prev_segment_start_index < len(self._marker_positions):
-                                prev_segment_start_x = self._marker_positions[prev_segment_start_index]
-                                gradient_width = segment_start_x - prev_segment_start_x
-                                if gradient_width > 0:
-                                    # Draw full gradient from previous marker to orange marker
-                                    gradient_segments = 30  # More segments for smoother gradient
-                                    for i in range(gradient_segments):
-                                        t = i / (gradient_segments - 1) if gradient_segments > 1 else 0
-                                        blend_color = (
-                                            self._track_color[0] * (1 - t) + self._orange_warning_color[0] * t,
-                                            self._track_color[1] * (1 - t) + self._orange_warning_color[1] * t,
-                                            self._track_color[2] * (1 - t) + self._orange_warning_color[2] * t,
-                                            self._track_color[3] * (1 - t) + self._orange_warning_color[3] * t
-                                        )
-                                        seg_width = gradient_width / gradient_segments
-                                        draw_rounded_rect(
-                                            prev_segment_start_x + i * seg_width,
-                                            track_y,
-                                            seg_width,
-                                            self._track_height,
-                                            2,
-                                            blend_color,
-                                            segments=8
-                                        )
+                            prev_segment_start_x = self._marker_positions[preview_lod - 1]
+                            gradient_width = segment_start_x - prev_segment_start_x
+                            if gradient_width > 0:
+                                add_track_piece(prev_segment_start_x, gradient_width,
+                                                self._track_color, self._orange_warning_color)
                     else:
                         # First orange segment is at position 0, draw gradient from min_lod_x to first marker
                         orange_segment_width = segment_start_x - min_lod_x
                         if orange_segment_width > 0:
-                            # Draw full gradient from min_lod_x to orange marker
-                            gradient_segments = 30  # More segments for smoother gradient
-                            for i in range(gradient_segments):
-                                t = i / (gradient_segments - 1) if gradient_segments > 1 else 0
-                                blend_color = (
-                                    self._track_color[0] * (1 - t) + self._orange_warning_color[0] * t,
-                                    self._track_color[1] * (1 - t) + self._orange_warning_color[1] * t,
-                                    self._track_color[2] * (1 - t) + self._orange_warning_color[2] * t,
-                                    self._track_color[3] * (1 - t) + self._orange_warning_color[3] * t
-                                )
-                                seg_width = orange_segment_width / gradient_segments
-                                draw_rounded_rect(
-                                    min_lod_x + i * seg_width,
-                                    track_y,
-                                    seg_width,
-                                    self._track_height,
-                                    2,
-                                    blend_color,
-                                    segments=8
-                                )
-                
-                # Draw indicator (orange dot or "?" question mark) underneath segments at marker position
-                # Check if this LOD is missing (not in available_lods)
-                is_missing = quixel_lod in missing_lods
-                if is_missing:
-                    # Calculate position to align with bottom row numbers (same as Quixel LOD numbers)
-                    marker_y = self.y_screen + (self.height - 12) / 2
-                    blf.size(0, self._number_label_size)  # Use same font size as numbers
-                    question_text = "?"
-                    text_width, text_height = blf.dimensions(0, question_text)
-                    number_y = marker_y - self._number_label_gap - text_height  # Same position calculation as numbers
+                            add_track_piece(min_lod_x, orange_segment_width,
+                                            self._track_color, self._orange_warning_color)
 
-                    if self._auto_lod_enabled:
-                        # Draw orange dot when auto LOD is enabled (3px higher than "?" position)
-                        dot_radius = 2
-                        self._draw_circle(segment_start_x, number_y + 3, dot_radius, self._orange_warning_color)
-                    else:
-                        # Draw "?" question mark when auto LOD is disabled
-                        question_x = segment_start_x - text_width / 2
-                        blf.position(0, question_x, number_y, 0)
-                        blf.color(0, 0.7, 0.7, 0.7, 1.0)  # Light gray for question mark
-                        blf.draw(0, question_text)
-
-            # Draw indicator (orange dot or "?") at maxLOD position if that LOD is missing
-            if self._max_lod is not None:
-                max_quixel_lod = self._min_lod + self._max_lod
-                if max_quixel_lod in missing_lods:
-                    # Calculate position to align with bottom row numbers
-                    marker_y = self.y_screen + (self.height - 12) / 2
-                    blf.size(0, self._number_label_size)
-                    question_text = "?"
-                    text_width, text_height = blf.dimensions(0, question_text)
-                    number_y = marker_y - self._number_label_gap - text_height
+                # Indicator (orange dot or "?" question mark) underneath segments at marker position
+                if quixel_lod in missing_lods:
+                    self._indicator_xs.append(segment_start_x)
 
-                    if self._auto_lod_enabled:
-                        # Draw orange dot when auto LOD is enabled
-                        dot_radius = 2
-                        self._draw_circle(max_lod_x, number_y + 3, dot_radius, self._orange_warning_color)
-                    else:
-                        # Draw "?" question mark when auto LOD is disabled
-                        question_x = max_lod_x - text_width / 2
-                        blf.position(0, question_x, number_y, 0)
-                        blf.color(0, 0.7, 0.7, 0.7, 1.0)
-                        blf.draw(0, question_text)
+            # Indicator at maxLOD position if that LOD is missing
+            if self._min_lod + self._max_lod in missing_lods:
+                self._indicator_xs.append(max_lod_x)
 
             # Segment 3: max marker to end (darker gray)
             # Preview LODs beyond maxLOD should NOT be auto-generated and should NOT be orange
             # They are outside the range and should remain dark gray
             if max_lod_x < track_end_x:
-                segment3_width = track_end_x - max_lod_x
-                draw_rounded_rect(
-                    max_lod_x,
-                    track_y,
-                    segment3_width,
-                    self._track_height,
-                    2,
-                    self._track_color_outside,
-                    segments=8
-                )
+                add_track_piece(max_lod_x, track_end_x - max_lod_x, self._track_color_outside)
         else:
             # No min/max range set, draw full track with normal color
-            draw_rounded_rect(
-                track_start_x,
-                track_y,
-                track_full_width,
-                self._track_height,
-                2,
-                self._track_color,
-                segments=8
-            )
+            add_track_piece(track_start_x, track_full_width, self._track_color)
+
+        # Rounded caps on both ends of the track
+        cap_radius = self._track_height / 2
+        cap_y = track_y + cap_radius
+        builder.add_half_disc(track_start_x, cap_y, cap_radius, math.pi / 2, track_ends[0])
+        builder.add_half_disc(track_end_x, cap_y, cap_radius, -math.pi / 2, track_ends[1])
 
-        # Draw markers
-        # Calculate min/max marker positions
+        # Markers
         # Min marker: aligned with bottom row (position 0 where bottom shows minLOD)
         # Max marker: aligned with top row (position maxLOD where top shows maxLOD)
         min_marker_index = 0 if self._min_lod is not None else None
@@ -2928,9 +2665,6 @@ class BL_UI_Slider(BL_UI_Widget):
             is_minmax = is_min_lod or is_max_lod
 
             # Check if marker is inside or outside min/max range
-            # Map marker index to Quixel LOD: position 0 = minLOD, position 1 = minLOD+1, etc.
-            # If min_lod is None, use marker index directly (no Quixel LOD mapping)
-            quixel_lod_for_marker = (self._min_lod + i) if self._min_lod is not None else i
             is_inside_range = True
             if self._min_lod is not None and self._max_lod is not None:
                 # Check if preview LOD position i is within range [0, maxLOD]
@@ -2948,7 +2682,7 @@ class BL_UI_Slider(BL_UI_Widget):
             # Preview LODs beyond maxLOD should NOT be auto-generated and should NOT be orange
             preview_lod_needs_auto = False
             if self._auto_lod_enabled and self._min_lod is not None and self._max_lod is not None:
-                quixel_lod_for_preview = self._min_lod + i if self._min_lod is not None else i
+                quixel_lod_for_preview = self._min_lod + i
                 # ONLY check if within the minLOD to maxLOD range
                 # Preview LODs beyond maxLOD are not part of the range and should not be orange
                 if self._min_lod <= quixel_lod_for_preview <= self._max_lod:
@@ -2977,27 +2711,57 @@ class BL_UI_Slider(BL_UI_Widget):
                 marker_width = 2
                 marker_height = 12
 
+            # Marker is a quad centered on its X (width in geometry instead of line width)
             marker_y = self.y_screen + (self.height - marker_height) / 2
+            builder.add_quad(marker_x - marker_width / 2, marker_y, marker_width, marker_height, marker_color)
 
-            gpu.state.blend_set('ALPHA')
-            gpu.state.line_width_set(marker_width)
-
-            shader = gpu.shader.from_builtin('UNIFORM_COLOR')
-            vertices = (
-                (marker_x, marker_y),
-                (marker_x, marker_y + marker_height)
-            )
-            batch = batch_for_shader(shader, 'LINES', {"pos": vertices})
-            shader.bind()
-            shader.uniform_float("color", marker_color)
-            batch.draw(shader)
+        self._geometry_batch = builder.build()
+        self._number_labels = tuple(self._layout_number_labels())
 
-            gpu.state.line_width_set(1.0)
-            gpu.state.blend_set('NONE')
+    def _draw_missing_indicators(self):
+        """Draw orange dots (Auto LOD) or "?" marks under positions whose LOD is missing."""
+        if not self._indicator_xs:
+            return
 
-        # Draw number labels above markers
+        # Calculate position to align with bottom row numbers (same as Quixel LOD numbers)
+        marker_y = self.y_screen + (self.height - 12) / 2
+        blf.size(0, self._number_label_size)  # Use same font size as numbers
+        question_text = "?"
+        text_width, text_height = _text_dims(question_text, self._number_label_size)
+        number_y = marker_y - self._number_label_gap - text_height  # Same position calculation as numbers
+
+        if self._auto_lod_enabled:
+            # Draw orange dot when auto LOD is enabled (3px higher than "?" position)
+            dot_radius = 2
+            shader = DrawConstants.anti_aliased_shader
+            if shader is None:
+                for indicator_x in self._indicator_xs:
+                    self._draw_circle(indicator_x, number_y + 3, dot_radius, self._orange_warning_color)
+            else:
+                # All dots share one bind and every uniform except the center
+                gpu.state.blend_set('ALPHA')
+                shader.bind()
+                shader.uniform_int("shapeType", DrawConstants.AA_SHAPE_CIRCLE)
+                shader.uniform_float("viewportSize", DrawConstants.viewport_size())
+                shader.uniform_float("radius", dot_radius)
+                shader.uniform_float("color", _srgb_to_linear_rgba(self._orange_warning_color))
+                shader.uniform_float("edgeSoftness", 1.0)
+                shader.uniform_float("scale", (dot_radius + 1.0) * 2.0)
+                for indicator_x in self._indicator_xs:
+                    shader.uniform_float("center", (indicator_x, number_y + 3))
+                    DrawConstants.circle_quad_batch.draw(shader)
+                gpu.state.blend_set('NONE')
+        else:
+            # Draw "?" question mark when auto LOD is disabled
+            blf.color(0, 0.7, 0.7, 0.7, 1.0)  # Light gray for question mark
+            for indicator_x in self._indicator_xs:
+                blf.position(0, indicator_x - text_width / 2, number_y, 0)
+                blf.draw(0, question_text)
+
+    def _layout_number_labels(self):
+        """Yield (text, x, y, color) for the preview LOD numbers above and Quixel LOD numbers below the markers."""
+        # Number labels above markers
         # Top row always shows numbers 0, 1, 2, 3, 4, 5, 6, 7
-        blf.size(0, self._number_label_size)
         for i, marker_x in enumerate(self._marker_positions):
             # LOD number is the index (0, 1, 2, 3, 4, 5, 6, 7)
             lod_number = i
@@ -3015,14 +2779,12 @@ class BL_UI_Slider(BL_UI_Widget):
 
             # Center text horizontally on marker
             number_text = str(lod_number)
-            text_width, text_height = blf.dimensions(0, number_text)
+            text_width, text_height = _text_dims(number_text, self._number_label_size)
             number_x = marker_x - text_width / 2
 
-            blf.position(0, number_x, number_y, 0)
-            blf.color(0, number_color[0], number_color[1], number_color[2], number_color[3])
-            blf.draw(0, number_text)
+            yield number_text, number_x, number_y, number_color
 
-        # Draw number labels below markers
+        # Number labels below markers
         # Bottom row shows only Quixel LOD levels that exist in available_lods
         if self._min_lod is not None and self._max_lod is not None and len(self._marker_positions) > 0 and self._available_lods:
             marker_y = self.y_screen + (self.height - 12) / 2
@@ -3062,16 +2824,22 @@ class BL_UI_Slider(BL_UI_Widget):
 
                 # Center text horizontally on marker
                 number_text = str(quixel_lod_number)
-                text_width, text_height = blf.dimensions(0, number_text)
+                text_width, text_height = _text_dims(number_text, self._number_label_size)
                 number_x = marker_x - text_width / 2
                 number_y = marker_y - self._number_label_gap - text_height  # Below the marker
 
-                blf.position(0, number_x, number_y, 0)
-                blf.color(0, number_color[0], number_color[1],
-                         number_color[2], number_color[3])
-                blf.draw(0, number_text)
+                yield number_text, number_x, number_y, number_color
+
+    def _draw_number_labels(self):
+        """Draw the LOD number labels laid out by the last geometry rebuild."""
+        blf.size(0, self._number_label_size)
+        for number_text, number_x, number_y, number_color in self._number_labels:
+            blf.position(0, number_x, number_y, 0)
+            blf.color(0, *number_color)
+            blf.draw(0, number_text)
 
-        # Draw handle
+    def _draw_handle(self):
+        """Draw the slider handle (knob)."""
         handle_x = self._get_handle_position()
         handle_y = self.y_screen + self.height / 2
 
@@ -3086,37 +2854,49 @@ class BL_UI_Slider(BL_UI_Widget):
         else:
             handle_color = self._handle_color
 
+        # Outline is always white - knob should never be orange
+        outline_color = (1.0, 1.0, 1.0, 1.0)
+        outline_thickness = 2
+
+        shader = DrawConstants.anti_aliased_shader
+        if shader is None:
+            self._draw_circle(handle_x, handle_y, self._handle_radius, handle_color)
+            self._draw_circle_outline(handle_x, handle_y, self._handle_radius, outline_color, outline_thickness)
+            return
+
+        # Fill and outline share one bind; only shape, color and extent change
+        gpu.state.blend_set('ALPHA')
+        shader.bind()
+        shader.uniform_float("center", (handle_x, handle_y))
+        shader.uniform_float("viewportSize", DrawConstants.viewport_size())
+        shader.uniform_float("radius", self._handle_radius)
+        shader.uniform_float("edgeSoftness", 1.0)
+
         # Draw handle circle
-        self._draw_circle(handle_x, handle_y, self._handle_radius, handle_color)
+        shader.uniform_int("shapeType", DrawConstants.AA_SHAPE_CIRCLE)
+        shader.uniform_float("color", _srgb_to_linear_rgba(handle_color))
+        shader.uniform_float("scale", (self._handle_radius + 1.0) * 2.0)
+        DrawConstants.circle_quad_batch.draw(shader)
 
-        # Draw outline (always white - knob should never be orange)
-        outline_color = (1.0, 1.0, 1.0, 1.0)
-        self._draw_circle_outline(handle_x, handle_y, self._handle_radius, outline_color, 2)
+        # Draw outline
+        shader.uniform_int("shapeType", DrawConstants.AA_SHAPE_RING)
+        shader.uniform_float("thickness", outline_thickness)
+        shader.uniform_float("color", _srgb_to_linear_rgba(outline_color))
+        shader.uniform_float("scale", (self._handle_radius + outline_thickness * 0.5 + 1.0) * 2.0)
+        DrawConstants.circle_quad_batch.draw(shader)
+
+        gpu.state.blend_set('NONE')
 
     def _draw_circle(self, cx, cy, radius, color):
         """Draw a filled circle with anti-aliased edges."""
-        # Initialize shader if needed
-        DrawConstants.initialize()
-        
         # Fallback to old method if shader creation failed
         if DrawConstants.anti_aliased_circle_shader is None:
-            # Use original triangle fan method as fallback
+            # Use the baked unit triangle fan as fallback
             gpu.state.blend_set('ALPHA')
-            shader = gpu.shader.from_builtin('UNIFORM_COLOR')
-            segments = 32
-            vertices = [(cx, cy)]  # Center
-            for i in range(segments + 1):
-                angle = 2 * math.pi * i / segments
-                x = cx + radius * math.cos(angle)
-                y = cy + radius * math.sin(angle)
-                vertices.append((x, y))
-            indices = []
-            for i in range(segments):
-                indices.append((0, i + 1, i + 2))
-            batch = batch_for_shader(shader, 'TRIS', {"pos": vertices}, indices=indices)
+            shader = DrawConstants.uniform_shader
             shader.bind()
             shader.uniform_float("color", color)
-            batch.draw(shader)
+            _draw_unit_circle(DrawConstants.unit_circle_fan_batch, shader, cx, cy, radius)
             gpu.state.blend_set('NONE')
             return
         
@@ -3124,17 +2904,16 @@ class BL_UI_Slider(BL_UI_Widget):
 
         shader = DrawConstants.anti_aliased_circle_shader
         shader.bind()
+        shader.uniform_int("shapeType", DrawConstants.AA_SHAPE_CIRCLE)
         
-        # Get viewport size for coordinate conversion
-        viewport = gpu.state.viewport_get()
-        viewport_width = viewport[2] if len(viewport) > 2 else 1920
-        viewport_height = viewport[3] if len(viewport) > 3 else 1080
+        # Viewport size for coordinate conversion (queried once per frame)
+        viewport_width, viewport_height = DrawConstants.viewport_size()
         
         # Set shader uniforms
         shader.uniform_float("center", (cx, cy))
         shader.uniform_float("viewportSize", (viewport_width, viewport_height))
         shader.uniform_float("radius", radius)
-        shader.uniform_float("color", color)
+        shader.uniform_float("color", _srgb_to_linear_rgba(color))
         shader.uniform_float("edgeSoftness", 1.0)  # 1-pixel soft edge for smooth anti-aliasing
         
         # Calculate scale to cover the circle area (with some padding for edge softness)
@@ -3149,26 +2928,15 @@ class BL_UI_Slider(BL_UI_Widget):
 
     def _draw_circle_outline(self, cx, cy, radius, color, thickness):
         """Draw a circle outline with anti-aliased edges."""
-        # Initialize shader if needed
-        DrawConstants.initialize()
-        
         # Fallback to old method if shader creation failed
         if DrawConstants.anti_aliased_circle_outline_shader is None:
-            # Use original line strip method as fallback
+            # Use the baked unit line strip as fallback
             gpu.state.blend_set('ALPHA')
             gpu.state.line_width_set(thickness)
-            shader = gpu.shader.from_builtin('UNIFORM_COLOR')
-            segments = 32
-            vertices = []
-            for i in range(segments + 1):
-                angle = 2 * math.pi * i / segments
-                x = cx + radius * math.cos(angle)
-                y = cy + radius * math.sin(angle)
-                vertices.append((x, y))
-            batch = batch_for_shader(shader, 'LINE_STRIP', {"pos": vertices})
+            shader = DrawConstants.uniform_shader
             shader.bind()
             shader.uniform_float("color", color)
-            batch.draw(shader)
+            _draw_unit_circle(DrawConstants.unit_circle_ring_batch, shader, cx, cy, radius)
             gpu.state.line_width_set(1.0)
             gpu.state.blend_set('NONE')
             return
@@ -3177,18 +2945,17 @@ class BL_UI_Slider(BL_UI_Widget):
 
         shader = DrawConstants.anti_aliased_circle_outline_shader
         shader.bind()
+        shader.uniform_int("shapeType", DrawConstants.AA_SHAPE_RING)
         
-        # Get viewport size for coordinate conversion
-        viewport = gpu.state.viewport_get()
-        viewport_width = viewport[2] if len(viewport) > 2 else 1920
-        viewport_height = viewport[3] if len(viewport) > 3 else 1080
+        # Viewport size for coordinate conversion (queried once per frame)
+        viewport_width, viewport_height = DrawConstants.viewport_size()
         
         # Set shader uniforms
         shader.uniform_float("center", (cx, cy))
         shader.uniform_float("viewportSize", (viewport_width, viewport_height))
         shader.uniform_float("radius", radius)
         shader.uniform_float("thickness", thickness)
-        shader.uniform_float("color", color)
+        shader.uniform_float("color", _srgb_to_linear_rgba(color))
         shader.uniform_float("edgeSoftness", 1.0)  # 1-pixel soft edge for smooth anti-aliasing
         
         # Calculate scale to cover the outline area (with some padding for edge softness)
@@ -3206,8 +2973,7 @@ class BL_UI_Slider(BL_UI_Widget):
         handle_x = self._get_handle_position()
         handle_y = self.y_screen + self.height / 2
 
-        dist = math.sqrt((x - handle_x) ** 2 + (y - handle_y) ** 2)
-        return dist <= self._handle_radius
+        return _point_in_circle(float(x), float(y), float(handle_x), float(handle_y), float(self._handle_radius))
 
     def mouse_down(self, x, y):
         """Handle mouse down event."""
@@ -3243,14 +3009,14 @@ class BL_UI_Slider(BL_UI_Widget):
         return False
 
     def mouse_move(self, x, y):
-        """Handle mouse move event."""
-        # Update hover state
-        was_hovered = self._is_hovered
-        self._is_hovered = self._is_handle_hovered(x, y)
+        """Handle mouse move event.
 
+        While dragging, _is_hovered is left stale on purpose: the pressed color
+        overrides the hover color, so the hit test is skipped until mouse up.
+        """
         # Update dragging
         if self._is_dragging:
-            # Update value while dragging and trigger callback immediately
+            # Update value while dragging and trigger callback once per value change
             new_value = self._value_from_position(x)
             if new_value != self._current_value:
                 self._current_value = new_value
@@ -3259,13 +3025,159 @@ class BL_UI_Slider(BL_UI_Widget):
                     self.on_value_changed(self._current_value)
             return True
 
-        return was_hovered != self._is_hovered
+        # Update hover state
+        was_hovered = self._is_hovered
+        self._is_hovered = self._is_handle_hovered(x, y)
+        if was_hovered != self._is_hovered:
+            return True
+
+        return False
 
     def update(self, x, y):
         """Update widget position."""
         super().update(x, y)
         # Clear cached positions when widget moves
         self._marker_positions = []
+        self._dirty = True
+
+
+# ========================================
+# TOOLBAR LAYOUT
+# ========================================
+# Dimensions from spec
+_BUTTON_WIDTH = 100  # Reduced from 120
+_BUTTON_HEIGHT = 28  # Updated to 28px
+_BUTTON_SPACING = 4  # Gap between Cancel and Accept buttons
+_MARGIN_BOTTOM = 20
+_PANEL_PADDING = 8  # Updated to 8px padding
+_PANEL_HEIGHT = 44  # Fixed panel height
+_ACCEPT_RIGHT_PADDING = 8  # Right padding for accept button
+_TOOLBAR_GAP = 8  # Gap between bottom and top toolbar
+
+# LOD controls dimensions
+_MIN_LOD_LABEL_WIDTH = 56  # Width for "Min LOD" (no colon)
+_MAX_LOD_LABEL_WIDTH = 66  # Width for "Max LOD" (no colon)
+_LABEL_DROPDOWN_GAP = 4  # 4px gap between label and dropdown
+_LOD_DROPDOWN_WIDTH = 80
+_DROPDOWN_TO_MAX_LOD_GAP = 8  # 8px gap between Min LOD dropdown and Max LOD label
+_MAX_LOD_TO_AUTO_LOD_GAP = 16  # 16px gap between Max LOD dropdown and Auto LOD (doubled)
+_AUTO_LOD_WIDTH = 100  # Width for Auto LOD checkbox
+_AUTO_LOD_TO_DIVIDER_GAP = 8  # 8px gap between Auto LOD and divider
+_DIVIDER_SPACING = 8  # Space for divider line
+
+# Top toolbar dimensions (label + slider + divider + wireframe button + HDRI buttons)
+_LOD_LABEL_WIDTH = 72  # Width for "LOD0" and "Quixel LOD0"
+_LABEL_TO_SLIDER_GAP = 8  # 8px gap between label and slider
+_SLIDER_WIDTH = 240
+_SLIDER_TO_DIVIDER_GAP = 8
+_TOP_DIVIDER_SPACING = 16  # Space for divider line
+_TOGGLE_BUTTON_SIZE = _BUTTON_HEIGHT  # Square floor/wireframe/HDRI buttons
+_TOGGLE_BUTTON_GAP = 4  # Gap between floor, wireframe and HDRI
+_HDRI_DROPDOWN_WIDTH = 16  # Dropdown arrow width
+_TOP_RIGHT_PADDING = 8
+
+# Bottom row: Min LOD [4px] dropdown [8px] Max LOD [4px] dropdown [16px] Auto LOD [8px] divider [8px] Cancel | Accept
+# Each offset is the distance from the previous element's X, so a cumulative
+# sum from the panel X gives every element's X in one pass.
+_BOTTOM_ROW_OFFSETS = np.array([
+    _PANEL_PADDING + 8,                                  # min_lod_label_x (8px left padding)
+    _MIN_LOD_LABEL_WIDTH + _LABEL_DROPDOWN_GAP,          # min_lod_dropdown_x
+    _LOD_DROPDOWN_WIDTH + _DROPDOWN_TO_MAX_LOD_GAP,      # max_lod_label_x
+    _MAX_LOD_LABEL_WIDTH + _LABEL_DROPDOWN_GAP,          # max_lod_dropdown_x
+    _LOD_DROPDOWN_WIDTH + _MAX_LOD_TO_AUTO_LOD_GAP,      # auto_lod_x
+    _AUTO_LOD_WIDTH + _AUTO_LOD_TO_DIVIDER_GAP,          # divider_x
+    _DIVIDER_SPACING,                                    # cancel_x (Cancel first, then Accept)
+    _BUTTON_WIDTH + _BUTTON_SPACING,                     # accept_x
+], dtype=np.float64)
+_BOTTOM_PANEL_WIDTH = float(_BOTTOM_ROW_OFFSETS.sum() + _BUTTON_WIDTH + _ACCEPT_RIGHT_PADDING)
+
+# Top row: LOD label [8px] slider [8px] divider [16px] Floor [4px] Wireframe [4px] HDRI|v
+_TOP_ROW_OFFSETS = np.array([
+    _PANEL_PADDING + 8,                                  # lod_label_x (8px left padding)
+    _LOD_LABEL_WIDTH + _LABEL_TO_SLIDER_GAP,             # slider_x
+    _SLIDER_WIDTH + _SLIDER_TO_DIVIDER_GAP,              # top_divider_x
+    _TOP_DIVIDER_SPACING,                                # floor_x
+    _TOGGLE_BUTTON_SIZE + _TOGGLE_BUTTON_GAP,            # wireframe_x
+    _TOGGLE_BUTTON_SIZE + _TOGGLE_BUTTON_GAP,            # hdri_button_x
+    _TOGGLE_BUTTON_SIZE,                                 # hdri_dropdown_x (attached to HDRI button)
+], dtype=np.float64)
+_TOP_PANEL_WIDTH = float(_TOP_ROW_OFFSETS.sum() + _HDRI_DROPDOWN_WIDTH + _TOP_RIGHT_PADDING)
+
+
+@dataclass(slots=True)
+class ToolbarLayout:
+    """Screen positions of every toolbar element, computed once per init."""
+
+    # Bottom toolbar (LOD controls & buttons)
+    panel_x: float
+    panel_y: float
+    panel_width: float
+    button_y: float
+    min_lod_label_x: float
+    min_lod_dropdown_x: float
+    max_lod_label_x: float
+    max_lod_dropdown_x: float
+    auto_lod_x: float
+    divider_x: float
+    cancel_x: float
+    accept_x: float
+    label_y: float
+    divider_y_start: float
+    divider_y_end: float
+
+    # Top toolbar (LOD slider)
+    top_panel_x: float
+    top_panel_y: float
+    top_panel_width: float
+    top_widget_y: float
+    lod_label_x: float
+    slider_x: float
+    top_divider_x: float
+    floor_x: float
+    wireframe_x: float
+    hdri_button_x: float
+    hdri_dropdown_x: float
+    lod_label_y: float
+    top_divider_y_start: float
+    top_divider_y_end: float
+
+    @classmethod
+    def compute(cls, area_width):
+        """Compute the layout for a viewport area of the given width."""
+        # Center everything
+        panel_x = (area_width - _BOTTOM_PANEL_WIDTH) / 2
+        panel_y = _MARGIN_BOTTOM
+        # Center buttons vertically within the panel
+        button_y = _MARGIN_BOTTOM + (_PANEL_HEIGHT - _BUTTON_HEIGHT) / 2
+        bottom_xs = (panel_x + np.cumsum(_BOTTOM_ROW_OFFSETS)).tolist()
+
+        top_panel_x = (area_width - _TOP_PANEL_WIDTH) / 2
+        top_panel_y = panel_y + _PANEL_HEIGHT + _TOOLBAR_GAP
+        # Center widgets vertically within top panel
+        top_widget_y = top_panel_y + (_PANEL_HEIGHT - _BUTTON_HEIGHT) / 2
+        top_xs = (top_panel_x + np.cumsum(_TOP_ROW_OFFSETS)).tolist()
+
+        return cls(
+            panel_x, panel_y, _BOTTOM_PANEL_WIDTH, button_y,
+            *bottom_xs,
+            button_y + _BUTTON_HEIGHT / 2,
+            panel_y + 8,
+            panel_y + _PANEL_HEIGHT - 8,
+            top_panel_x, top_panel_y, _TOP_PANEL_WIDTH, top_widget_y,
+            *top_xs,
+            top_widget_y + _BUTTON_HEIGHT / 2,
+            top_panel_y + 8,
+            top_panel_y + _PANEL_HEIGHT - 8,
+        )
+
+    def bounds(self):
+        """Get the (x0, y0, x1, y1) rectangle covering both toolbar panels."""
+        return (
+            min(self.panel_x, self.top_panel_x),
+            self.panel_y,
+            max(self.panel_x + self.panel_width, self.top_panel_x + self.top_panel_width),
+            self.top_panel_y + _PANEL_HEIGHT,
+        )
 
 
 class ImportToolbar:
@@ -3319,6 +3231,12 @@ class ImportToolbar:
         self.previous_use_shadows = None
 
         self.visible = False
+        self.layout = None  # ToolbarLayout, computed in init()
+        self._top_divider_batch = None  # Static divider line batches, built with the layout
+        self._divider_batch = None
+        self._text_heights = {}  # {(font_size, text): height} for toolbar labels
+        self._toolbar_bounds = None  # (x0, y0, x1, y1) around both panels, for mouse_move
+        self._was_in_bounds = False  # Whether the last mouse_move was inside _toolbar_bounds
 
         # Store imported data for cleanup
         self.imported_objects = []
@@ -3329,13 +3247,30 @@ class ImportToolbar:
         self.lod_levels = []  # List of available LOD levels
         self.selected_min_lod = None  # Currently selected min LOD level
         self.selected_max_lod = 5  # Default max LOD is LOD5
+        self.selected_lod_level = 0  # LOD chosen in the min LOD dropdown
         self.auto_lod_enabled = True  # Auto LOD enabled by default
         self.wireframe_enabled = False  # Wireframe toggle state
         self.current_preview_lod = 0  # Current LOD being previewed
+        self._last_lod_levels = ()  # Levels last passed to set_lod_levels
+
+        # LOD level per object name (memoized extract_lod_from_object_name results)
+        self._lod_cache = {}  # {obj_name: lod_level}
+
+        # Names of imported objects that still exist (kept in sync on import,
+        # LOD generation/filtering and cleanup to avoid bpy.data.objects lookups)
+        self._alive_names = set()
+
+        # Imported mesh objects grouped by LOD level (kept in sync on LOD generation/filtering)
+        self._objects_by_lod = defaultdict(list)  # {lod_level: [obj, ...]}
 
         # LOD positioning data (for restoring original positions)
         self.lod_original_positions = {}  # {obj_name: (x, y, z)}
         self.lod_text_objects = []  # List of created text objects
+        self._last_selected_lod = None  # LOD the text colors were last applied for
+        self._mat_selected = None  # LOD label materials (see _ensure_lod_materials)
+        self._mat_below = None
+        self._mat_above = None
+        self._last_applied_preview_lod = None  # (min_lod, quixel_lod) last shown by update_lod_visibility
 
         # OPTIMIZED: Store attach roots as source of truth
         # Attach roots contain ALL data needed:
@@ -3354,10 +3289,63 @@ class ImportToolbar:
         self.pending_lod_timer = None  # Store timer handle for debouncing
         self.target_lod = None  # The LOD level that should be loaded after debounce
 
+        # Viewport redraw coalescing (see _batch_redraws)
+        self._redraw_depth = 0
+        self._redraw_pending = False
+
         # Callbacks
         self.on_accept = None
         self.on_cancel = None
 
+    @contextmanager
+    def _batch_redraws(self):
+        """Coalesce viewport redraws requested inside the block into one.
+
+        Reentrant: only the outermost block flushes the pending redraw.
+        """
+        self._redraw_depth += 1
+        try:
+            yield
+        finally:
+            self._redraw_depth -= 1
+            if self._redraw_depth == 0 and self._redraw_pending:
+                self._flush_redraw()
+
+    def _request_redraw(self):
+        """Request a viewport redraw (deferred while inside _batch_redraws)."""
+        self._redraw_pending = True
+        if self._redraw_depth == 0:
+            self._flush_redraw()
+
+    def _flush_redraw(self):
+        """Tag the viewport for redraw."""
+        import bpy
+
+        self._redraw_pending = False
+
+        # The toolbar lives in the modal's area; only timers run without one
+        area = bpy.context.area
+        if area:
+            area.tag_redraw()
+            return
+
+        for area in self._get_view3d_areas():
+            area.tag_redraw()
+
+    def _get_view3d_areas(self):
+        """Get the 3D viewport areas of the current screen.
+
+        Re-scanned on every call: screen.areas is short, and Area structs are
+        not IDs, so a cached one can be freed (area join/split, type change)
+        without raising ReferenceError when used.
+        """
+        import bpy
+
+        screen = bpy.context.screen
+        if not screen:
+            return []
+        return [area for area in screen.areas if area.type == 'VIEW_3D']
+
     def _scan_hdri_assets(self):
         """Scan assets/img folder for HDRI files.
 
@@ -3408,77 +3396,21 @@ class ImportToolbar:
             if world:
                 self.original_world_nodes = self._backup_world_nodes(world)
 
-        # Dimensions from spec
-        button_width = 100  # Reduced from 120
-        button_height = 28  # Updated to 28px
-        button_spacing = 4  # Gap between Cancel and Accept buttons
-        margin_bottom = 20
-        panel_padding = 8  # Updated to 8px padding
-        panel_height = 44  # Fixed panel height
-        accept_right_padding = 8  # Right padding for accept button
-
-        # LOD controls dimensions
-        min_lod_label_width = 56  # Width for "Min LOD" (no colon)
-        max_lod_label_width = 66  # Width for "Max LOD" (no colon)
-        label_dropdown_gap = 4  # 4px gap between label and dropdown
-        lod_dropdown_width = 80
-        dropdown_to_max_lod_gap = 8  # 8px gap between Min LOD dropdown and Max LOD label
-        max_lod_to_auto_lod_gap = 16  # 16px gap between Max LOD dropdown and Auto LOD (doubled)
-        auto_lod_width = 100  # Width for Auto LOD checkbox
-        auto_lod_to_divider_gap = 8  # 8px gap between Auto LOD and divider
-        divider_spacing = 8  # Space for divider line
-
-        # Calculate total width with all LOD controls
-        # Layout: Min LOD [4px] dropdown [8px] Max LOD [4px] dropdown [16px] Auto LOD [8px] divider [8px] Cancel | Accept
-        buttons_width = button_width * 2 + button_spacing
-        lod_section_width = (min_lod_label_width + label_dropdown_gap + lod_dropdown_width + dropdown_to_max_lod_gap +
-                            max_lod_label_width + label_dropdown_gap + lod_dropdown_width + max_lod_to_auto_lod_gap +
-                            auto_lod_width)
-        total_content_width = lod_section_width + auto_lod_to_divider_gap + divider_spacing + buttons_width + accept_right_padding
-
-        # Center everything
-        panel_width = total_content_width + panel_padding * 2
-        panel_x = (area.width - panel_width) / 2
-        panel_y = margin_bottom
-
-        # Center buttons vertically within the panel
-        button_y = margin_bottom + (panel_height - button_height) / 2
-
-        # LOD section on the left with 8px padding
-        min_lod_label_x = panel_x + panel_padding + 8  # Add 8px left padding
-        min_lod_dropdown_x = min_lod_label_x + min_lod_label_width + label_dropdown_gap
-
-        max_lod_label_x = min_lod_dropdown_x + lod_dropdown_width + dropdown_to_max_lod_gap
-        max_lod_dropdown_x = max_lod_label_x + max_lod_label_width + label_dropdown_gap
-
-        auto_lod_x = max_lod_dropdown_x + lod_dropdown_width + max_lod_to_auto_lod_gap
-
-        # Divider position
-        divider_x = auto_lod_x + auto_lod_width + auto_lod_to_divider_gap
-
-        # Buttons on the right (SWAPPED: Cancel first, then Accept)
-        buttons_start_x = divider_x + divider_spacing
+        layout = self.layout = ToolbarLayout.compute(area.width)
+        self._toolbar_bounds = layout.bounds()
+        self._build_divider_batches()
 
         # Create background panel
-        self.background_panel = BL_UI_Widget(panel_x, panel_y, panel_width, panel_height)
+        self.background_panel = BL_UI_Widget(layout.panel_x, layout.panel_y, layout.panel_width, _PANEL_HEIGHT)
         # Color #1d1d1d = RGB(29, 29, 29) = (29/255, 29/255, 29/255)
         self.background_panel._bg_color = (0.114, 0.114, 0.114, 1.0)  # #1d1d1d
         self.background_panel.init(context)
 
-        # Store label positions and divider position for drawing
-        self.min_lod_label_x = min_lod_label_x
-        self.min_lod_label_y = button_y + button_height / 2
-        self.max_lod_label_x = max_lod_label_x
-        self.max_lod_label_y = button_y + button_height / 2
-        self.divider_x = divider_x
-        self.divider_y_start = panel_y + 8
-        self.divider_y_end = panel_y + panel_height - 8
-
         # Get addon directory for icon paths
         addon_dir = Path(__file__).parent.parent
 
         # Create Min LOD dropdown (renamed from lod_dropdown)
-        self.min_lod_dropdown = BL_UI_Dropdown(min_lod_dropdown_x, button_y, lod_dropdown_width, button_height)
+        self.min_lod_dropdown = BL_UI_Dropdown(layout.min_lod_dropdown_x, layout.button_y, _LOD_DROPDOWN_WIDTH, _BUTTON_HEIGHT)
         # Set check icon path
         check_icon_path = addon_dir / "assets" / "icons" / "check_16.png"
         if check_icon_path.exists():
@@ -3491,7 +3423,7 @@ class ImportToolbar:
             self.min_lod_dropdown.set_items(["LOD0"])  # Default
 
         # Create Max LOD dropdown (LOD0-LOD7, default LOD5)
-        self.max_lod_dropdown = BL_UI_Dropdown(max_lod_dropdown_x, button_y, lod_dropdown_width, button_height)
+        self.max_lod_dropdown = BL_UI_Dropdown(layout.max_lod_dropdown_x, layout.button_y, _LOD_DROPDOWN_WIDTH, _BUTTON_HEIGHT)
         # Set check icon path
         if check_icon_path.exists():
             self.max_lod_dropdown._check_icon_path = str(check_icon_path)
@@ -3501,7 +3433,7 @@ class ImportToolbar:
         self.max_lod_dropdown.on_change = self._on_max_lod_changed
 
         # Create Auto LOD checkbox
-        self.auto_lod_checkbox = BL_UI_Checkbox(auto_lod_x, button_y, auto_lod_width, button_height)
+        self.auto_lod_checkbox = BL_UI_Checkbox(layout.auto_lod_x, layout.button_y, _AUTO_LOD_WIDTH, _BUTTON_HEIGHT)
         self.auto_lod_checkbox.text = "Auto LOD"
         self.auto_lod_checkbox._text_size = 12
         self.auto_lod_checkbox.checked = True  # Start enabled
@@ -3509,7 +3441,7 @@ class ImportToolbar:
         self.auto_lod_checkbox.init(context)
 
         # Create Cancel button (FIRST, on the left)
-        self.cancel_button = BL_UI_Button(buttons_start_x, button_y, button_width, button_height)
+        self.cancel_button = BL_UI_Button(layout.cancel_x, layout.button_y, _BUTTON_WIDTH, _BUTTON_HEIGHT)
         self.cancel_button.text = "Cancel"
         # Normal: #1d1d1d = RGB(29, 29, 29)
         self.cancel_button._normal_bg_color = (0.114, 0.114, 0.114, 1.0)
@@ -3520,8 +3452,7 @@ class ImportToolbar:
         self.cancel_button.init(context)
 
         # Create Accept button (SECOND, on the right)
-        accept_x = buttons_start_x + button_width + button_spacing
-        self.accept_button = BL_UI_Button(accept_x, button_y, button_width, button_height)
+        self.accept_button = BL_UI_Button(layout.accept_x, layout.button_y, _BUTTON_WIDTH, _BUTTON_HEIGHT)
         self.accept_button.text = "Accept"
         # Normal: #138ae8 = RGB(19, 138, 232) = (19/255, 138/255, 232/255)
         self.accept_button._normal_bg_color = (0.0745, 0.541, 0.910, 1.0)
@@ -3535,66 +3466,23 @@ class ImportToolbar:
         # ========================================
         # TOP TOOLBAR (LOD Slider)
         # ========================================
-        toolbar_gap = 8  # Gap between bottom and top toolbar
-        top_panel_y = panel_y + panel_height + toolbar_gap
-
-        # Top toolbar dimensions (label + slider + divider + wireframe button + HDRI buttons)
-        lod_label_width = 72  # Width for "LOD0" and "Quixel LOD0"
-        label_to_slider_gap = 8  # 8px gap between label and slider
-        slider_width = 240
-        slider_to_divider_gap = 8
-        divider_spacing = 16  # Space for divider line
-        floor_button_size = button_height  # Square floor button
-        floor_button_gap = 4  # Gap between floor and wireframe
-        wireframe_button_size = button_height  # Square button
-        hdri_button_gap = 4  # Gap between wireframe and HDRI
-        hdri_button_size = button_height  # Square HDRI button (same as wireframe)
-        hdri_dropdown_width = 16  # Dropdown arrow width
-        hdri_total_width = hdri_button_size + hdri_dropdown_width
-        top_right_padding = 8
-
-        # Calculate top toolbar width
-        top_content_width = (lod_label_width + label_to_slider_gap + slider_width +
-                            slider_to_divider_gap + divider_spacing + floor_button_size +
-                            floor_button_gap + wireframe_button_size +
-                            hdri_button_gap + hdri_total_width + top_right_padding)
-        top_panel_width = top_content_width + panel_padding * 2
-        top_panel_x = (area.width - top_panel_width) / 2
-
         # Create top background panel
-        self.top_background_panel = BL_UI_Widget(top_panel_x, top_panel_y, top_panel_width, panel_height)
+        self.top_background_panel = BL_UI_Widget(layout.top_panel_x, layout.top_panel_y, layout.top_panel_width, _PANEL_HEIGHT)
         self.top_background_panel._bg_color = (0.114, 0.114, 0.114, 1.0)  # #1d1d1d
         self.top_background_panel.init(context)
 
-        # Center widgets vertically within top panel
-        top_widget_y = top_panel_y + (panel_height - button_height) / 2
-
-        # Calculate positions for top toolbar elements
-        lod_label_x = top_panel_x + panel_padding + 8  # 8px left padding
-        slider_x = lod_label_x + lod_label_width + label_to_slider_gap
-        top_divider_x = slider_x + slider_width + slider_to_divider_gap
-        floor_x = top_divider_x + divider_spacing
-        wireframe_x = floor_x + floor_button_size + floor_button_gap
-
-        # Store label position and divider position for drawing
-        self.lod_slider_label_x = lod_label_x
-        self.lod_slider_label_y = top_widget_y + button_height / 2
+        # Default label text (preview LOD / Quixel LOD / status)
         self.lod_slider_label_text = "LOD0"  # Default label (preview LOD)
         self.lod_slider_quixel_label_text = "Quixel LOD0"  # Default Quixel LOD label
         self.lod_slider_status_text = None  # Status text ("Generated" or "Missing")
 
-        # Store divider position
-        self.top_divider_x = top_divider_x
-        self.top_divider_y_start = top_panel_y + 8
-        self.top_divider_y_end = top_panel_y + panel_height - 8
-
         # Create LOD slider
-        self.lod_slider = BL_UI_Slider(slider_x, top_widget_y, slider_width, button_height)
+        self.lod_slider = BL_UI_Slider(layout.slider_x, layout.top_widget_y, _SLIDER_WIDTH, _BUTTON_HEIGHT)
         self.lod_slider.init(context)
         self.lod_slider.on_value_changed = self._handle_slider_change
 
         # Create floor toggle button
-        self.floor_toggle = BL_UI_ToggleButton(floor_x, top_widget_y, floor_button_size)
+        self.floor_toggle = BL_UI_ToggleButton(layout.floor_x, layout.top_widget_y, _TOGGLE_BUTTON_SIZE)
         # Set icon path (fallback to "F" text if icon not found)
         addon_dir = Path(__file__).parent.parent
         floor_icon_path = addon_dir / "assets" / "icons" / "floor_32.png"
@@ -3610,7 +3498,7 @@ class ImportToolbar:
         self._handle_floor_toggle(True)
 
         # Create wireframe toggle button
-        self.wireframe_toggle = BL_UI_ToggleButton(wireframe_x, top_widget_y, wireframe_button_size)
+        self.wireframe_toggle = BL_UI_ToggleButton(layout.wireframe_x, layout.top_widget_y, _TOGGLE_BUTTON_SIZE)
         # Set icon path (fallback to "W" text if icon not found)
         addon_dir = Path(__file__).parent.parent
         icon_path = addon_dir / "assets" / "icons" / "wireframe_32.png"
@@ -3628,11 +3516,8 @@ class ImportToolbar:
         # Scan available HDRIs
         self.available_hdris = self._scan_hdri_assets()
 
-        # Position after wireframe button
-        hdri_button_x = wireframe_x + wireframe_button_size + hdri_button_gap
-
-        # Create HDRI toggle button
-        self.hdri_toggle = BL_UI_ToggleButton(hdri_button_x, top_widget_y, hdri_button_size)
+        # Create HDRI toggle button (positioned after wireframe button)
+        self.hdri_toggle = BL_UI_ToggleButton(layout.hdri_button_x, layout.top_widget_y, _TOGGLE_BUTTON_SIZE)
         hdri_icon_path = addon_dir / "assets" / "icons" / "hdri_32.png"
         if hdri_icon_path.exists():
             self.hdri_toggle.icon_path = str(hdri_icon_path)
@@ -3642,9 +3527,8 @@ class ImportToolbar:
         self.hdri_toggle.init(context)
 
         # Create dropdown button (attached to right side of HDRI button)
-        dropdown_x = hdri_button_x + hdri_button_size
-        self.hdri_dropdown_button = BL_UI_DropdownButton(dropdown_x, top_widget_y,
-                                                          hdri_dropdown_width, button_height)
+        self.hdri_dropdown_button = BL_UI_DropdownButton(layout.hdri_dropdown_x, layout.top_widget_y,
+                                                          _HDRI_DROPDOWN_WIDTH, _BUTTON_HEIGHT)
         dropdown_icon_path = addon_dir / "assets" / "icons" / "dropdown_2_16.png"
         if dropdown_icon_path.exists():
             self.hdri_dropdown_button.icon_path = str(dropdown_icon_path)
@@ -3665,7 +3549,7 @@ class ImportToolbar:
 
     def _update_slider_labels(self):
         """Update LOD slider labels (preview LOD, Quixel LOD, and status)."""
-        if not hasattr(self, 'lod_slider') or not self.lod_slider:
+        if not self.lod_slider:
             return
 
         # Get current preview LOD from slider
@@ -3676,11 +3560,10 @@ class ImportToolbar:
 
         # Get min_lod from dropdown
         min_lod = 0
-        if hasattr(self, 'min_lod_dropdown') and self.min_lod_dropdown:
+        if self.min_lod_dropdown:
             min_lod_text = self.min_lod_dropdown.get_selected_item()
             if min_lod_text:
-                import re
-                match = re.search(r'LOD(\d+)', min_lod_text)
+                match = _LOD_NUM_RE.search(min_lod_text)
                 if match:
                     min_lod = int(match.group(1))
 
@@ -3709,7 +3592,7 @@ class ImportToolbar:
         
         # OPTIMIZATION: Only update if LOD level actually changed!
         # This prevents hundreds of redundant calls during slider drag
-        if hasattr(self, 'current_preview_lod') and self.current_preview_lod == lod_level:
+        if self.current_preview_lod == lod_level:
             return
 
         # Immediately update label text for responsive UI
@@ -3717,11 +3600,10 @@ class ImportToolbar:
 
         # Get min_lod from dropdown
         min_lod = 0
-        if hasattr(self, 'min_lod_dropdown') and self.min_lod_dropdown:
+        if self.min_lod_dropdown:
             min_lod_text = self.min_lod_dropdown.get_selected_item()
             if min_lod_text:
-                import re
-                match = re.search(r'LOD(\d+)', min_lod_text)
+                match = _LOD_NUM_RE.search(min_lod_text)
                 if match:
                     min_lod = int(match.group(1))
 
@@ -3763,8 +3645,6 @@ class ImportToolbar:
         This is called by bpy.app.timers after the debounce period.
         Processes the target LOD and updates loading state.
         """
-        import bpy
-        
         # Check if we still have a valid target LOD
         if self.target_lod is None:
             # No target, clear loading state and unregister
@@ -3798,7 +3678,6 @@ class ImportToolbar:
 
     def _handle_wireframe_toggle(self, toggled):
         """Handle wireframe toggle button."""
-        import bpy
         self.wireframe_enabled = toggled
 
         # Apply wireframe to all imported objects
@@ -3808,14 +3687,10 @@ class ImportToolbar:
                 obj.show_all_edges = toggled
 
         # Force viewport update
-        for area in bpy.context.screen.areas:
-            if area.type == 'VIEW_3D':
-                area.tag_redraw()
+        self._request_redraw()
 
     def _disable_wireframe(self):
         """Disable wireframe mode and reset the toggle button."""
-        import bpy
-
         # Disable wireframe on all imported objects
         for obj in self.imported_objects:
             if hasattr(obj, 'show_wire'):
@@ -3827,12 +3702,10 @@ class ImportToolbar:
 
         # Reset toggle button visual state if it exists
         if self.wireframe_toggle:
-            self.wireframe_toggle._toggled = False
+            self.wireframe_toggle.toggled = False
 
         # Force viewport update
-        for area in bpy.context.screen.areas:
-            if area.type == 'VIEW_3D':
-                area.tag_redraw()
+        self._request_redraw()
 
     def _handle_floor_toggle(self, toggled):
         """Handle floor toggle button."""
@@ -3890,65 +3763,56 @@ class ImportToolbar:
                 self.floor_obj.hide_viewport = True
 
         # Force viewport update
-        for area in bpy.context.screen.areas:
-            if area.type == 'VIEW_3D':
-                area.tag_redraw()
+        self._request_redraw()
 
     def _save_grid_settings(self):
         """Save current grid overlay settings."""
-        import bpy
         self.previous_grid_settings = {}
-        for area in bpy.context.screen.areas:
-            if area.type == 'VIEW_3D':
-                for space in area.spaces:
-                    if space.type == 'VIEW_3D':
-                        overlay = space.overlay
-                        self.previous_grid_settings = {
-                            'show_floor': overlay.show_floor,
-                            'show_axis_x': overlay.show_axis_x,
-                            'show_axis_y': overlay.show_axis_y,
-                            'show_axis_z': overlay.show_axis_z,
-                        }
-                        return
+        for area in self._get_view3d_areas():
+            for space in area.spaces:
+                if space.type == 'VIEW_3D':
+                    overlay = space.overlay
+                    self.previous_grid_settings = {
+                        'show_floor': overlay.show_floor,
+                        'show_axis_x': overlay.show_axis_x,
+                        'show_axis_y': overlay.show_axis_y,
+                        'show_axis_z': overlay.show_axis_z,
+                    }
+                    return
 
     def _disable_grid(self):
         """Disable Blender's grid overlay."""
-        import bpy
-        for area in bpy.context.screen.areas:
-            if area.type == 'VIEW_3D':
-                for space in area.spaces:
-                    if space.type == 'VIEW_3D':
-                        overlay = space.overlay
-                        overlay.show_floor = False
-                        overlay.show_axis_x = False
-                        overlay.show_axis_y = False
-                        overlay.show_axis_z = False
+        for area in self._get_view3d_areas():
+            for space in area.spaces:
+                if space.type == 'VIEW_3D':
+                    overlay = space.overlay
+                    overlay.show_floor = False
+                    overlay.show_axis_x = False
+                    overlay.show_axis_y = False
+                    overlay.show_axis_z = False
 
     def _restore_grid_settings(self):
         """Restore previous grid overlay settings."""
-        import bpy
         # If no previous settings were saved, restore to defaults (all enabled)
         if not self.previous_grid_settings:
-            for area in bpy.context.screen.areas:
-                if area.type == 'VIEW_3D':
-                    for space in area.spaces:
-                        if space.type == 'VIEW_3D':
-                            overlay = space.overlay
-                            overlay.show_floor = True
-                            overlay.show_axis_x = True
-                            overlay.show_axis_y = True
-                            overlay.show_axis_z = True
-            return
-
-        for area in bpy.context.screen.areas:
-            if area.type == 'VIEW_3D':
+            for area in self._get_view3d_areas():
                 for space in area.spaces:
                     if space.type == 'VIEW_3D':
                         overlay = space.overlay
-                        overlay.show_floor = self.previous_grid_settings.get('show_floor', True)
-                        overlay.show_axis_x = self.previous_grid_settings.get('show_axis_x', True)
-                        overlay.show_axis_y = self.previous_grid_settings.get('show_axis_y', True)
-                        overlay.show_axis_z = self.previous_grid_settings.get('show_axis_z', True)
+                        overlay.show_floor = True
+                        overlay.show_axis_x = True
+                        overlay.show_axis_y = True
+                        overlay.show_axis_z = True
+            return
+
+        for area in self._get_view3d_areas():
+            for space in area.spaces:
+                if space.type == 'VIEW_3D':
+                    overlay = space.overlay
+                    overlay.show_floor = self.previous_grid_settings.get('show_floor', True)
+                    overlay.show_axis_x = self.previous_grid_settings.get('show_axis_x', True)
+                    overlay.show_axis_y = self.previous_grid_settings.get('show_axis_y', True)
+                    overlay.show_axis_z = self.previous_grid_settings.get('show_axis_z', True)
 
     def _disable_floor(self):
         """Disable floor and restore grid settings."""
@@ -3972,17 +3836,14 @@ class ImportToolbar:
 
         # Reset toggle button visual state if it exists
         if self.floor_toggle:
-            self.floor_toggle._toggled = False
+            self.floor_toggle.toggled = False
 
         # Force viewport update
-        for area in bpy.context.screen.areas:
-            if area.type == 'VIEW_3D':
-                    area.tag_redraw()
+        self._request_redraw()
 
 
     def _handle_hdri_toggle(self, toggled):
         """Handle HDRI toggle button - enables/disables viewport shading."""
-        import bpy
         self.hdri_enabled = toggled
 
         if toggled:
@@ -4038,14 +3899,10 @@ class ImportToolbar:
         elif self.hdri_panel:
             self.hdri_panel.visible = False
             # Force redraw
-            for area in bpy.context.screen.areas:
-                if area.type == 'VIEW_3D':
-                    area.tag_redraw()
+            self._request_redraw()
 
     def _handle_hdri_selected(self, hdr_path, hdri_name):
         """Handle HDRI selection from panel."""
-        import bpy
-
         self.current_hdri = hdr_path
 
         # Apply HDRI to world background
@@ -4055,16 +3912,14 @@ class ImportToolbar:
         if not self.hdri_enabled:
             self.hdri_enabled = True
             if self.hdri_toggle:
-                self.hdri_toggle._toggled = True
+                self.hdri_toggle.toggled = True
             self._set_viewport_shading(True)
 
         # Keep the panel open so user can try different HDRIs
         # Panel will close when clicking outside or toggling dropdown
 
         # Force viewport update
-        for area in bpy.context.screen.areas:
-            if area.type == 'VIEW_3D':
-                area.tag_redraw()
+        self._request_redraw()
 
     def _close_all_dropdowns(self, exclude_dropdown=None):
         """Close all dropdown menus except the excluded one.
@@ -4085,16 +3940,12 @@ class ImportToolbar:
 
     def _close_hdri_panel(self):
         """Close HDRI selection panel."""
-        import bpy
-
         self.hdri_panel_visible = False
         if self.hdri_panel:
             self.hdri_panel.visible = False
 
         # Force viewport update
-        for area in bpy.context.screen.areas:
-            if area.type == 'VIEW_3D':
-                area.tag_redraw()
+        self._request_redraw()
 
     def _is_point_in_hdri_panel(self, x, y):
         """Check if point is inside HDRI panel bounds."""
@@ -4108,115 +3959,114 @@ class ImportToolbar:
 
         scene = bpy.context.scene
 
-        for area in bpy.context.screen.areas:
-            if area.type == 'VIEW_3D':
-                for space in area.spaces:
-                    if space.type == 'VIEW_3D':
-                        if enabled:
-                            # Store current viewport shading settings ONLY if not already stored
-                            if self.previous_shading_type is None:
-                                self.previous_shading_type = space.shading.type
-                            if self.previous_use_scene_world is None:
-                                self.previous_use_scene_world = space.shading.use_scene_world
-
-                            # Store current render engine and EEVEE settings
-                            if self.previous_render_engine is None:
-                                self.previous_render_engine = scene.render.engine
-
-                            # Check if current or previous engine is EEVEE (legacy or Next)
-                            is_eevee = scene.render.engine in ('BLENDER_EEVEE', 'BLENDER_EEVEE_NEXT')
-                            was_eevee = self.previous_render_engine in ('BLENDER_EEVEE', 'BLENDER_EEVEE_NEXT')
-
-                            if is_eevee or was_eevee:
-                                eevee = scene.eevee
-                                if self.previous_use_raytracing is None:
-                                    self.previous_use_raytracing = eevee.use_raytracing if hasattr(eevee, 'use_raytracing') else False
-                                    if hasattr(eevee, 'ray_tracing_method'):
-                                        self.previous_ray_tracing_method = eevee.ray_tracing_method
-                                    if hasattr(eevee, 'ray_tracing_options') and hasattr(eevee.ray_tracing_options, 'resolution_scale'):
-                                        self.previous_ray_tracing_resolution = eevee.ray_tracing_options.resolution_scale
-                                    self.previous_fast_gi = eevee.use_fast_gi if hasattr(eevee, 'use_fast_gi') else False
-                                    self.previous_use_shadows = eevee.use_shadows if hasattr(eevee, 'use_shadows') else True
-
-                            # Enable RENDERED shading mode with scene world
-                            space.shading.type = 'RENDERED'
-                            space.shading.use_scene_world = True
-
-                            # Switch to EEVEE render engine (use EEVEE_NEXT if available, otherwise legacy EEVEE)
+        for area in self._get_view3d_areas():
+            for space in area.spaces:
+                if space.type == 'VIEW_3D':
+                    if enabled:
+                        # Store current viewport shading settings ONLY if not already stored
+                        if self.previous_shading_type is None:
+                            self.previous_shading_type = space.shading.type
+                        if self.previous_use_scene_world is None:
+                            self.previous_use_scene_world = space.shading.use_scene_world
+
+                        # Store current render engine and EEVEE settings
+                        if self.previous_render_engine is None:
+                            self.previous_render_engine = scene.render.engine
+
+                        # Check if current or previous engine is EEVEE (legacy or Next)
+                        is_eevee = scene.render.engine in ('BLENDER_EEVEE', 'BLENDER_EEVEE_NEXT')
+                        was_eevee = self.previous_render_engine in ('BLENDER_EEVEE', 'BLENDER_EEVEE_NEXT')
+
+                        if is_eevee or was_eevee:
+                            eevee = scene.eevee
+                            if self.previous_use_raytracing is None:
+                                self.previous_use_raytracing = eevee.use_raytracing if hasattr(eevee, 'use_raytracing') else False
+                                if hasattr(eevee, 'ray_tracing_method'):
+                                    self.previous_ray_tracing_method = eevee.ray_tracing_method
+                                if hasattr(eevee, 'ray_tracing_options') and hasattr(eevee.ray_tracing_options, 'resolution_scale'):
+                                    self.previous_ray_tracing_resolution = eevee.ray_tracing_options.resolution_scale
+                                self.previous_fast_gi = eevee.use_fast_gi if hasattr(eevee, 'use_fast_gi') else False
+                                self.previous_use_shadows = eevee.use_shadows if hasattr(eevee, 'use_shadows') else True
+
+                        # Enable RENDERED shading mode with scene world
+                        space.shading.type = 'RENDERED'
+                        space.shading.use_scene_world = True
+
+                        # Switch to EEVEE render engine (use EEVEE_NEXT if available, otherwise legacy EEVEE)
+                        try:
+                            scene.render.engine = 'BLENDER_EEVEE_NEXT'
+                        except:
                             try:
-                                scene.render.engine = 'BLENDER_EEVEE_NEXT'
-                            except:
+                                scene.render.engine = 'BLENDER_EEVEE'
+                            except Exception as e:
+                                pass
+
+                        # Configure EEVEE settings with error handling
+                        try:
+                            eevee = scene.eevee
+
+                            # Enable raytracing
+                            if hasattr(eevee, 'use_raytracing'):
+                                eevee.use_raytracing = True
+
+                            # Set raytracing method
+                            if hasattr(eevee, 'ray_tracing_method'):
                                 try:
-                                    scene.render.engine = 'BLENDER_EEVEE'
+                                    eevee.ray_tracing_method = 'SCREEN'
                                 except Exception as e:
                                     pass
 
-                            # Configure EEVEE settings with error handling
-                            try:
-                                eevee = scene.eevee
-
-                                # Enable raytracing
-                                if hasattr(eevee, 'use_raytracing'):
-                                    eevee.use_raytracing = True
-
-                                # Set raytracing method
-                                if hasattr(eevee, 'ray_tracing_method'):
+                            # Set raytracing resolution
+                            if hasattr(eevee, 'ray_tracing_options'):
+                                if hasattr(eevee.ray_tracing_options, 'resolution_scale'):
                                     try:
-                                        eevee.ray_tracing_method = 'SCREEN'
+                                        eevee.ray_tracing_options.resolution_scale = 2
                                     except Exception as e:
                                         pass
 
-                                # Set raytracing resolution
-                                if hasattr(eevee, 'ray_tracing_options'):
-                                    if hasattr(eevee.ray_tracing_options, 'resolution_scale'):
-                                        try:
-                                            eevee.ray_tracing_options.resolution_scale = 2
-                                        except Exception as e:
-                                            pass
+                            # Enable Fast GI
+                            if hasattr(eevee, 'use_fast_gi'):
+                                eevee.use_fast_gi = True
 
-                                # Enable Fast GI
-                                if hasattr(eevee, 'use_fast_gi'):
-                                    eevee.use_fast_gi = True
+                            # Enable shadows
+                            if hasattr(eevee, 'use_shadows'):
+                                eevee.use_shadows = True
 
-                                # Enable shadows
-                                if hasattr(eevee, 'use_shadows'):
-                                    eevee.use_shadows = True
+                        except Exception as e:
+                            pass
 
-                            except Exception as e:
-                                pass
+                    else:
+                        # Restore previous shading mode
+                        if self.previous_shading_type is not None:
+                            space.shading.type = self.previous_shading_type
+                        else:
+                            space.shading.type = 'SOLID'
 
+                        # Restore previous use_scene_world setting
+                        if self.previous_use_scene_world is not None:
+                            space.shading.use_scene_world = self.previous_use_scene_world
                         else:
-                            # Restore previous shading mode
-                            if self.previous_shading_type is not None:
-                                space.shading.type = self.previous_shading_type
-                            else:
-                                space.shading.type = 'SOLID'
-
-                            # Restore previous use_scene_world setting
-                            if self.previous_use_scene_world is not None:
-                                space.shading.use_scene_world = self.previous_use_scene_world
-                            else:
-                                space.shading.use_scene_world = False
-
-                            # Restore render engine
-                            if self.previous_render_engine is not None:
-                                scene.render.engine = self.previous_render_engine
-
-                            # Restore EEVEE settings if applicable (supports both legacy and Next)
-                            if scene.render.engine in ('BLENDER_EEVEE', 'BLENDER_EEVEE_NEXT'):
-                                eevee = scene.eevee
-                                if self.previous_use_raytracing is not None and hasattr(eevee, 'use_raytracing'):
-                                    eevee.use_raytracing = self.previous_use_raytracing
-                                if self.previous_ray_tracing_method is not None and hasattr(eevee, 'ray_tracing_method'):
-                                    eevee.ray_tracing_method = self.previous_ray_tracing_method
-                                if self.previous_ray_tracing_resolution is not None and hasattr(eevee, 'ray_tracing_options') and hasattr(eevee.ray_tracing_options, 'resolution_scale'):
-                                    eevee.ray_tracing_options.resolution_scale = self.previous_ray_tracing_resolution
-                                if self.previous_fast_gi is not None and hasattr(eevee, 'use_fast_gi'):
-                                    eevee.use_fast_gi = self.previous_fast_gi
-                                if self.previous_use_shadows is not None and hasattr(eevee, 'use_shadows'):
-                                    eevee.use_shadows = self.previous_use_shadows
-
-                area.tag_redraw()
+                            space.shading.use_scene_world = False
+
+                        # Restore render engine
+                        if self.previous_render_engine is not None:
+                            scene.render.engine = self.previous_render_engine
+
+                        # Restore EEVEE settings if applicable (supports both legacy and Next)
+                        if scene.render.engine in ('BLENDER_EEVEE', 'BLENDER_EEVEE_NEXT'):
+                            eevee = scene.eevee
+                            if self.previous_use_raytracing is not None and hasattr(eevee, 'use_raytracing'):
+                                eevee.use_raytracing = self.previous_use_raytracing
+                            if self.previous_ray_tracing_method is not None and hasattr(eevee, 'ray_tracing_method'):
+                                eevee.ray_tracing_method = self.previous_ray_tracing_method
+                            if self.previous_ray_tracing_resolution is not None and hasattr(eevee, 'ray_tracing_options') and hasattr(eevee.ray_tracing_options, 'resolution_scale'):
+                                eevee.ray_tracing_options.resolution_scale = self.previous_ray_tracing_resolution
+                            if self.previous_fast_gi is not None and hasattr(eevee, 'use_fast_gi'):
+                                eevee.use_fast_gi = self.previous_fast_gi
+                            if self.previous_use_shadows is not None and hasattr(eevee, 'use_shadows'):
+                                eevee.use_shadows = self.previous_use_shadows
+
+            area.tag_redraw()
 
     def _setup_hdri_background(self, hdri_path):
         """Set up world shader with HDRI environment texture."""
@@ -4260,8 +4110,6 @@ class ImportToolbar:
 
     def _backup_world_nodes(self, world):
         """Backup the current world node setup."""
-        import bpy
-
         if not world or not world.use_nodes:
             return None
 
@@ -4359,16 +4207,100 @@ class ImportToolbar:
             output_node = nodes.new('ShaderNodeOutputWorld')
             output_node.location = (300, 300)
 
-            links.new(bg_node.outputs['Background'], output_node.inputs['Surface'])
+            links.new(bg_node.outputs['Background'], output_node.inputs['Surface'])
+
+    def _handle_auto_lod_change(self, checked):
+        """Handle Auto LOD checkbox change."""
+        self.auto_lod_enabled = checked
+        # Update slider with Auto LOD state
+        if self.lod_slider:
+            self.lod_slider.set_auto_lod_enabled(checked)
+        # Update slider labels to reflect status change (Generated/Missing)
+        self._update_slider_labels()
+
+    def _lod_of(self, obj):
+        """Get the LOD level of an object, parsing its name only on first lookup."""
+        name = obj.name
+        lod_level = self._lod_cache.get(name)
+        if lod_level is None:
+            from ..operations.asset_processor import extract_lod_from_object_name
+            lod_level = extract_lod_from_object_name(name)
+            self._lod_cache[name] = lod_level
+        return lod_level
+
+    def _remember_lod(self, obj, old_name, lod_level):
+        """Update the LOD cache after an object was renamed to a new LOD level."""
+        self._lod_cache.pop(old_name, None)
+        self._lod_cache[obj.name] = lod_level
+        if old_name in self._alive_names:
+            self._alive_names.discard(old_name)
+            self._alive_names.add(obj.name)
+
+    def _invalidate_lod_state(self):
+        """Forget the last applied LOD colors/visibility so the next update runs in full.
+
+        Call whenever LOD objects or their text labels are created, removed or
+        shown outside of update_lod_visibility.
+        """
+        self._last_selected_lod = None
+        self._last_applied_preview_lod = None
+
+    def _remove_datablocks(self, id_blocks, collection):
+        """Delete many datablocks with one bpy.data.batch_remove call.
+
+        Falls back to removing them one by one from the given collection
+        (e.g. bpy.data.objects) if the batch call fails.
+
+        Returns:
+            int: Number of datablocks removed
+        """
+        if not id_blocks:
+            return 0
+        try:
+            bpy.data.batch_remove(ids=id_blocks)
+            return len(id_blocks)
+        except (RuntimeError, ReferenceError, TypeError):
+            removed = 0
+            for id_block in id_blocks:
+                try:
+                    collection.remove(id_block, do_unlink=True)
+                    removed += 1
+                except (RuntimeError, ReferenceError):
+                    pass
+            return removed
+
+    @staticmethod
+    def _apply_hidden(hidden_states):
+        """Hide/show objects with the eye icon, writing only the ones that change.
+
+        hide_set() is view-layer local and runs the normal update (base flags
+        and depsgraph tag), so skipping unchanged objects keeps a slider tick
+        down to the LODs that actually flip.
+
+        Args:
+            hidden_states: Iterable of (obj, hidden) pairs
+
+        Returns:
+            bool: True if any object changed
+        """
+        changed = False
+        for obj, hidden in hidden_states:
+            try:
+                if obj.hide_get() != hidden:
+                    obj.hide_set(hidden)
+                    changed = True
+            except (AttributeError, ReferenceError, RuntimeError):
+                # Object was deleted or is not in the view layer
+                continue
+        return changed
 
-    def _handle_auto_lod_change(self, checked):
-        """Handle Auto LOD checkbox change."""
-        self.auto_lod_enabled = checked
-        # Update slider with Auto LOD state
-        if self.lod_slider:
-            self.lod_slider.set_auto_lod_enabled(checked)
-        # Update slider labels to reflect status change (Generated/Missing)
-        self._update_slider_labels()
+    @staticmethod
+    def _set_label_hidden(text_obj, hidden):
+        """Hide/show a LOD text label (eye icon and viewport flag), skipping no-op writes."""
+        if text_obj.hide_get() != hidden:
+            text_obj.hide_set(hidden)
+        if text_obj.hide_viewport != hidden:
+            text_obj.hide_viewport = hidden
 
     def update_lod_visibility(self):
         """Show/hide LODs based on slider position.
@@ -4387,8 +4319,7 @@ class ImportToolbar:
         if self.min_lod_dropdown:
             min_lod_text = self.min_lod_dropdown.get_selected_item()
             if min_lod_text:
-                import re
-                match = re.search(r'LOD(\d+)', min_lod_text)
+                match = _LOD_NUM_RE.search(min_lod_text)
                 if match:
                     min_lod = int(match.group(1))
 
@@ -4396,6 +4327,13 @@ class ImportToolbar:
         # Preview LOD position maps to Quixel LOD: quixel_lod = min_lod + preview_lod
         target_quixel_lod = min_lod + self.current_preview_lod
 
+        # Nothing to do if this exact LOD is already shown (slider/dropdown re-fires)
+        applied_key = (min_lod, target_quixel_lod)
+        if applied_key == self._last_applied_preview_lod:
+            return
+
+        # Collect the desired state of every LOD mesh, then write only the changes
+        hidden_states = []
         # Loop through each attach root (one per variation)
         for attach_root in self.attach_roots:
             # Loop through children of this attach root
@@ -4408,8 +4346,16 @@ class ImportToolbar:
                 quixel_lod = child.get("lod_level", 0)
 
                 # Match by Quixel LOD, not preview LOD position
-                should_hide = (quixel_lod != target_quixel_lod)
-                child.hide_set(should_hide)
+                hidden_states.append((child, quixel_lod != target_quixel_lod))
+
+        self._apply_hidden(hidden_states)
+
+        # With the same min LOD, only the previously shown and the new label flip
+        previous_key = self._last_applied_preview_lod
+        if previous_key is not None and previous_key[0] == min_lod:
+            changed_lods = (previous_key[1], target_quixel_lod)
+        else:
+            changed_lods = None
 
         # Update text labels using eye icon
         if self.lod_text_objects:
@@ -4421,111 +4367,108 @@ class ImportToolbar:
                     text_quixel_lod = item[1]  # This is the Quixel LOD the text represents
                 else:
                     continue
+
+                if changed_lods is not None and text_quixel_lod not in changed_lods:
+                    continue
                 
                 # Always hide text objects below minLOD (regardless of target_quixel_lod)
                 if text_quixel_lod < min_lod:
-                    text_obj.hide_set(True)
-                    text_obj.hide_viewport = True
+                    self._set_label_hidden(text_obj, True)
                     # Also hide secondary text object if it exists
-                    secondary_text_name = f"{text_obj.name}_Secondary"
-                    if secondary_text_name in bpy.data.objects:
-                        secondary_obj = bpy.data.objects[secondary_text_name]
-                        secondary_obj.hide_set(True)
-                        secondary_obj.hide_viewport = True
+                    secondary_obj = bpy.data.objects.get(f"{text_obj.name}_Secondary")
+                    if secondary_obj:
+                        self._set_label_hidden(secondary_obj, True)
                     continue
                 
                 # Match by Quixel LOD, not preview LOD position
-                should_hide = (text_quixel_lod != target_quixel_lod)
-                text_obj.hide_set(should_hide)
-                text_obj.hide_viewport = should_hide
+                self._set_label_hidden(text_obj, text_quixel_lod != target_quixel_lod)
+
+        self._last_applied_preview_lod = applied_key
 
         # Tag viewport for redraw
-        for area in bpy.context.screen.areas:
-            if area.type == 'VIEW_3D':
-                area.tag_redraw()
+        self._request_redraw()
 
     def _handle_accept(self, button):
         """Handle Accept button click."""
-        import bpy
-
-        # Restore HDRI and viewport state to original
-        if self.hdri_enabled:
-            # Turn off HDRI toggle
-            if self.hdri_toggle:
-                self.hdri_toggle._toggled = False
-            self.hdri_enabled = False
-            # Restore original world
-            self._restore_world_background()
-            # Restore original viewport shading
-            self._set_viewport_shading(False)
-
-        # Close HDRI panel if open
-        if self.hdri_panel_visible:
-            self.hdri_panel_visible = False
-            if self.hdri_panel:
-                self.hdri_panel.visible = False
-
-        # Reset stored viewport states for next time toolbar is used
-        self.previous_shading_type = None
-        self.previous_use_scene_world = None
-        self.previous_render_engine = None
-        self.previous_use_raytracing = None
-        self.previous_ray_tracing_method = None
-        self.previous_ray_tracing_resolution = None
-        self.previous_fast_gi = None
-        self.previous_use_shadows = None
+        # Every step below may request a redraw - flush a single one at the end
+        with self._batch_redraws():
+            # Restore HDRI and viewport state to original
+            if self.hdri_enabled:
+                # Turn off HDRI toggle
+                if self.hdri_toggle:
+                    self.hdri_toggle.toggled = False
+                self.hdri_enabled = False
+                # Restore original world
+                self._restore_world_background()
+                # Restore original viewport shading
+                self._set_viewport_shading(False)
+
+            # Close HDRI panel if open
+            if self.hdri_panel_visible:
+                self.hdri_panel_visible = False
+                if self.hdri_panel:
+                    self.hdri_panel.visible = False
+
+            # Reset stored viewport states for next time toolbar is used
+            self.previous_shading_type = None
+            self.previous_use_scene_world = None
+            self.previous_render_engine = None
+            self.previous_use_raytracing = None
+            self.previous_ray_tracing_method = None
+            self.previous_ray_tracing_resolution = None
+            self.previous_fast_gi = None
+            self.previous_use_shadows = None
+
+            # Disable wireframe mode if it was enabled
+            if self.wireframe_enabled:
+                self._disable_wireframe()
+
+            # Get selected min LOD level from dropdown
+            selected_lod_text = self.min_lod_dropdown.get_selected_item() if self.min_lod_dropdown else None
+            if selected_lod_text:
+                # Extract LOD number from "LOD2" -> 2
+                match = _LOD_NUM_RE.search(selected_lod_text)
+                target_lod = int(match.group(1)) if match else 0
+            else:
+                target_lod = 0
 
-        # Disable wireframe mode if it was enabled
-        if self.wireframe_enabled:
-            self._disable_wireframe()
+            # Get selected max LOD level from dropdown
+            max_lod_text = self.max_lod_dropdown.get_selected_item() if self.max_lod_dropdown else None
+            if max_lod_text:
+                match = _LOD_NUM_RE.search(max_lod_text)
+                max_lod = int(match.group(1)) if match else 5
+            else:
+                max_lod = 5
 
-        # Get selected min LOD level from dropdown
-        selected_lod_text = self.min_lod_dropdown.get_selected_item() if self.min_lod_dropdown else None
-        if selected_lod_text:
-            # Extract LOD number from "LOD2" -> 2
-            import re
-            match = re.search(r'LOD(\d+)', selected_lod_text)
-            target_lod = int(match.group(1)) if match else 0
-        else:
-            target_lod = 0
+            # Step 0: Reset LOD positions and delete text labels
+            self.reset_lod_positions_and_cleanup()
 
-        # Get selected max LOD level from dropdown
-        max_lod_text = self.max_lod_dropdown.get_selected_item() if self.max_lod_dropdown else None
-        if max_lod_text:
-            match = re.search(r'LOD(\d+)', max_lod_text)
-            max_lod = int(match.group(1)) if match else 5
-        else:
-            max_lod = 5
+            # Step 1: Apply material from selected LOD to all LOD levels
+            # Print removed to reduce console clutter
+            self._apply_material_to_all_lods(target_lod)
 
-        # Step 0: Reset LOD positions and delete text labels
-        self.reset_lod_positions_and_cleanup()
+            # Step 2: Apply LOD filtering if target LOD > 0 (BEFORE auto LOD generation)
+            # This renames LODs so that the selected min LOD becomes LOD0
+            if target_lod > 0:
+                # Print removed to reduce console clutter
+                self._apply_lod_filter(target_lod)
+                # After filtering, the base is now LOD0, so we generate from 0 to max_lod
+                adjusted_min_lod = 0
+            else:
+                adjusted_min_lod = target_lod
 
-        # Step 1: Apply material from selected LOD to all LOD levels
-        # Print removed to reduce console clutter
-        self._apply_material_to_all_lods(target_lod)
+            # Step 3: Generate auto LOD levels if enabled (AFTER filtering)
+            if self.auto_lod_enabled:
+                # Print removed to reduce console clutter
+                self._generate_auto_lods(adjusted_min_lod, max_lod)
 
-        # Step 2: Apply LOD filtering if target LOD > 0 (BEFORE auto LOD generation)
-        # This renames LODs so that the selected min LOD becomes LOD0
-        if target_lod > 0:
+            # Step 4: Clean up unused materials
             # Print removed to reduce console clutter
-            self._apply_lod_filter(target_lod)
-            # After filtering, the base is now LOD0, so we generate from 0 to max_lod
-            adjusted_min_lod = 0
-        else:
-            adjusted_min_lod = target_lod
+            self._cleanup_unused_materials()
 
-        # Step 3: Generate auto LOD levels if enabled (AFTER filtering)
-        if self.auto_lod_enabled:
+            # Step 5: Show only the lowest LOD level (highest number)
             # Print removed to reduce console clutter
-            self._generate_auto_lods(adjusted_min_lod, max_lod)
-
-        # Step 4: Clean up unused materials
-        # Print removed to reduce console clutter
-        self._cleanup_unused_materials()
-
-        # Step 5: Show only the lowest LOD level (highest number)
-        # Print removed to reduce console clutter
-        self._show_only_lowest_lod()
+            self._show_only_lowest_lod()
 
         if self.on_accept:
             self.on_accept()
@@ -4541,19 +4484,16 @@ class ImportToolbar:
             max_lod: Ending LOD level (e.g., 5 = lowest quality)
         """
         import bpy
-        from ..operations.asset_processor import extract_lod_from_object_name, set_ioi_lod_properties
+        from ..operations.asset_processor import set_ioi_lod_properties
 
         # Find the object at min_lod level to use as the base
         base_objects = []
-        for obj in self.imported_objects:
+        for obj in self._objects_by_lod.get(min_lod, ()):
             try:
                 # Quick validity check without expensive name lookup
                 if obj.type != 'MESH' or not obj.data:
                     continue
-
-                lod_level = extract_lod_from_object_name(obj.name)
-                if lod_level == min_lod:
-                    base_objects.append(obj)
+                base_objects.append(obj)
             except (AttributeError, ReferenceError):
                 # Object was deleted or is invalid
                 continue
@@ -4567,53 +4507,54 @@ class ImportToolbar:
         # Calculate decimation ratios based on steps from base LOD
         # Each step is 50% of the base: step 1 = 50%, step 2 = 25%, step 3 = 12.5%, etc.
 
+        # Index existing LODs by (parent name, LOD level) so each step is a single lookup.
+        # Objects of the same variation share a parent.
+        existing_by_parent_lod = set()
+        for obj in self.imported_objects:
+            try:
+                parent = obj.parent
+                existing_by_parent_lod.add((parent.name if parent else "", self._lod_of(obj)))
+            except (AttributeError, ReferenceError):
+                continue
+
         # Generate LOD levels
         new_objects = []
         for base_obj in base_objects:
-            # Get polycount of base object
-            base_polycount = len(base_obj.data.polygons)
+            base_parent = base_obj.parent
+            parent_key = base_parent.name if base_parent else ""
+
+            # Each LOD is decimated from the previous generated one rather than the full base
+            prev_obj = base_obj
+            prev_lod = min_lod
 
             for target_lod in range(min_lod + 1, max_lod + 1):
                 # Skip if this LOD already exists
-                existing = False
-                for obj in self.imported_objects:
-                    try:
-                        if extract_lod_from_object_name(obj.name) == target_lod:
-                            # Check if it's the same variation (same parent)
-                            if obj.parent == base_obj.parent:
-                                existing = True
-                                break
-                    except (AttributeError, ReferenceError):
-                        continue
-
-                if existing:
+                if (parent_key, target_lod) in existing_by_parent_lod:
                     # Print removed to reduce console clutter
                     continue
 
-                # Calculate decimation ratio based on steps from base LOD
-                # Steps from base: LOD(min+1) = 1 step, LOD(min+2) = 2 steps, etc.
-                steps_from_base = target_lod - min_lod
-                ratio = 0.5 ** steps_from_base  # 50% per step
+                # Calculate decimation ratio relative to the mesh we decimate from
+                # Chained: 50% of the previous LOD, so LOD(min+k) still ends up at 0.5^k of the base
+                steps_from_prev = target_lod - prev_lod
+                ratio = 0.5 ** steps_from_prev  # 50% per step
 
-                # Duplicate base object
+                # Duplicate base object, starting from the previous LOD's already decimated mesh
                 new_obj = base_obj.copy()
-                new_obj.data = base_obj.data.copy()
+                new_obj.data = prev_obj.data.copy()
                 bpy.context.collection.objects.link(new_obj)
 
                 # Update name to reflect new LOD level
-                import re
                 old_name = new_obj.name
                 if "_LOD_" in old_name:
                     # IOI format
-                    parts = old_name.split("_LOD_")
-                    if len(parts) == 2:
-                        base_name = parts[0]
+                    if len(old_name.split("_LOD_")) == 2:
                         set_ioi_lod_properties(new_obj, target_lod)
                 else:
                     # Simple format
-                    new_name = re.sub(r'_?LOD\d+', f'_LOD{target_lod}', old_name)
+                    new_name = _LOD_SUB_RE.sub(f'_LOD{target_lod}', old_name)
                     new_obj.name = new_name
                     set_ioi_lod_properties(new_obj, target_lod)
+                self._remember_lod(new_obj, old_name, target_lod)
 
                 # Add decimate modifier
                 modifier = new_obj.modifiers.new(name=f"Decimate_LOD{target_lod}", type='DECIMATE')
@@ -4625,18 +4566,35 @@ class ImportToolbar:
                 modifier.delimit = {'UV'}  # Preserve UV seam boundaries
                 modifier.use_symmetry = False  # Don't force symmetry
 
-                # Apply the modifier to bake the decimation
-                bpy.context.view_layer.objects.active = new_obj
-                bpy.ops.object.modifier_apply(modifier=modifier.name)
-
-                # Calculate new polycount
-                new_polycount = len(new_obj.data.polygons)
-
-                # Print removed to reduce console clutter
+                # Bake the decimation through the depsgraph instead of the modifier_apply operator.
+                # Like applying only the decimate modifier, every other modifier copied from
+                # the base is muted while baking so it is not baked in and then evaluated again.
+                muted_modifiers = [m for m in new_obj.modifiers if m != modifier and m.show_viewport]
+                for other in muted_modifiers:
+                    other.show_viewport = False
+                depsgraph = bpy.context.evaluated_depsgraph_get()
+                eval_obj = new_obj.evaluated_get(depsgraph)
+                new_mesh = bpy.data.meshes.new_from_object(
+                    eval_obj, preserve_all_data_layers=True, depsgraph=depsgraph
+                )
+                for other in muted_modifiers:
+                    other.show_viewport = True
+                old_mesh = new_obj.data
+                new_obj.modifiers.remove(modifier)
+                new_obj.data = new_mesh
+                bpy.data.meshes.remove(old_mesh)
 
                 # Add to tracking lists
                 new_objects.append(new_obj)
                 self.imported_objects.append(new_obj)
+                self._alive_names.add(new_obj.name)
+                self._objects_by_lod[target_lod].append(new_obj)
+                existing_by_parent_lod.add((parent_key, target_lod))
+                prev_obj = new_obj
+                prev_lod = target_lod
+
+        if new_objects:
+            self._invalidate_lod_state()
 
         # Print removed to reduce console clutter
 
@@ -4646,28 +4604,21 @@ class ImportToolbar:
         Args:
             target_lod: The LOD level whose material to use for all LODs
         """
-        import bpy
-        import re
-        from ..operations.asset_processor import extract_lod_from_object_name
-
         # Step 1: Find the material from the target LOD level
         target_material = None
         target_obj = None
 
-        for obj in self.imported_objects:
+        for obj in self._objects_by_lod.get(target_lod, ()):
             try:
                 # Quick validity check without expensive name lookup
                 if obj.type != 'MESH' or not obj.data:
                     continue
 
-                # Check if this object is at the target LOD level
-                lod_level = extract_lod_from_object_name(obj.name)
-                if lod_level == target_lod:
-                    # Get the material from this object
-                    if obj.data.materials and len(obj.data.materials) > 0:
-                        target_material = obj.data.materials[0]
-                        target_obj = obj
-                        break
+                # Get the material from this object
+                if obj.data.materials and len(obj.data.materials) > 0:
+                    target_material = obj.data.materials[0]
+                    target_obj = obj
+                    break
             except (AttributeError, ReferenceError):
                 # Object was deleted or is invalid
                 continue
@@ -4681,8 +4632,8 @@ class ImportToolbar:
         # Step 2: Remove LOD suffix from material name
         old_mat_name = target_material.name
         # Remove patterns like _LOD0, _LOD1, _LOD_0_______, etc.
-        new_mat_name = re.sub(r'_LOD_[_0-9]{8}', '', old_mat_name)  # IOI format
-        new_mat_name = re.sub(r'_LOD\d+', '', new_mat_name)  # Standard format
+        new_mat_name = _LOD_IOI_RE.sub('', old_mat_name)  # IOI format
+        new_mat_name = _LOD_SUB_RE.sub('', new_mat_name)  # Standard format
 
         if new_mat_name != old_mat_name:
             target_material.name = new_mat_name
@@ -4696,9 +4647,14 @@ class ImportToolbar:
                 if obj.type != 'MESH' or not obj.data:
                     continue
 
+                # Skip objects already using only the target material
+                mats = obj.data.materials
+                if len(mats) == 1 and mats[0] == target_material:
+                    continue
+
                 # Clear existing materials and apply the target material
-                obj.data.materials.clear()
-                obj.data.materials.append(target_material)
+                mats.clear()
+                mats.append(target_material)
                 materials_applied += 1
             except (AttributeError, ReferenceError):
                 # Object was deleted or is invalid
@@ -4716,42 +4672,45 @@ class ImportToolbar:
             target_lod: The LOD level to start from (becomes new LOD0)
         """
         import bpy
-        from ..operations.asset_processor import extract_lod_from_object_name, set_ioi_lod_properties
+        from ..operations.asset_processor import set_ioi_lod_properties
 
         objects_to_delete = []
         objects_to_rename = []
 
         # Step 1: Categorize objects by LOD level
-        for obj in list(self.imported_objects):
-            try:
-                # Quick validity check without expensive name lookup
-                if obj.type != 'MESH' or not obj.data:
-                    continue
-
-                # Get LOD level from object name
-                lod_level = extract_lod_from_object_name(obj.name)
+        for lod_level, objs in self._objects_by_lod.items():
+            for obj in objs:
+                try:
+                    # Quick validity check without expensive name lookup
+                    if obj.type != 'MESH' or not obj.data:
+                        continue
 
-                if lod_level < target_lod:
-                    # Delete this object
-                    objects_to_delete.append(obj)
-                else:
-                    # Rename this object
-                    objects_to_rename.append((obj, lod_level))
-            except (AttributeError, ReferenceError):
-                # Object was deleted or is invalid
-                continue
+                    if lod_level < target_lod:
+                        # Delete this object
+                        objects_to_delete.append(obj)
+                    else:
+                        # Rename this object
+                        objects_to_rename.append((obj, lod_level))
+                except (AttributeError, ReferenceError):
+                    # Object was deleted or is invalid
+                    continue
 
         # Step 2: Delete lower LODs
-        for obj in objects_to_delete:
-            try:
-                bpy.data.objects.remove(obj, do_unlink=True)
-                self.imported_objects.remove(obj)
-            except:
-                pass
-
-        # Step 3: Rename remaining objects
+        self._invalidate_lod_state()
+        if objects_to_delete:
+            for obj in objects_to_delete:
+                self._lod_cache.pop(obj.name, None)
+                self._alive_names.discard(obj.name)
+            # Drop references before the objects are freed
+            deleted = set(objects_to_delete)
+            self.imported_objects = [obj for obj in self.imported_objects if obj not in deleted]
+            self._remove_datablocks(objects_to_delete, bpy.data.objects)
+
+        # Step 3: Rename remaining objects (and re-bucket them under their new LOD)
+        self._objects_by_lod = defaultdict(list)
         for obj, old_lod in objects_to_rename:
             new_lod = old_lod - target_lod
+            self._objects_by_lod[new_lod].append(obj)
 
             # Replace LOD number in name
             # Pattern: _LOD_X_______ or _LODX
@@ -4765,91 +4724,48 @@ class ImportToolbar:
                     base_name = parts[0]
                     # Set new LOD properties and get new name
                     set_ioi_lod_properties(obj, new_lod)
+                    self._remember_lod(obj, old_name, new_lod)
             else:
                 # Handle simple format: _LOD0, _LOD1
-                import re
-                new_name = re.sub(r'_?LOD\d+', f'_LOD{new_lod}', old_name)
+                new_name = _LOD_SUB_RE.sub(f'_LOD{new_lod}', old_name)
                 if new_name != old_name:
                     obj.name = new_name
                     set_ioi_lod_properties(obj, new_lod)
+                    self._remember_lod(obj, old_name, new_lod)
 
     def _cleanup_unused_materials(self):
         """Remove all materials that are not being used by any imported objects."""
         import bpy
 
-        # Step 1: Find which materials are currently in use by imported objects
+        # Materials currently in use by imported objects
         materials_in_use = set()
         for obj in self.imported_objects:
             try:
                 # Quick validity check without expensive name lookup
                 if obj.type != 'MESH' or not obj.data:
                     continue
-
-                # Collect all materials used by this object
-                for mat_slot in obj.data.materials:
-                    if mat_slot:
-                        materials_in_use.add(mat_slot.name)
+                materials_in_use.update(mat.name for mat in obj.data.materials if mat)
             except (AttributeError, ReferenceError):
                 # Object was deleted or is invalid
                 continue
 
-        # Material tracking prints removed to reduce console clutter
-
-        # Step 2: Remove materials that were imported but are no longer in use
-        removed_count = 0
-        for mat in list(self.imported_materials):
-            try:
-                # Store name before any operations that might delete it
-                if not mat or mat.name not in bpy.data.materials:
-                    continue
-
-                mat_name = mat.name  # Store name before deletion
-
-                # If this material is not in use, remove it
-                if mat_name not in materials_in_use:
-                    bpy.data.materials.remove(mat, do_unlink=True)
-                    removed_count += 1
-                    # Print removed to reduce console clutter
-            except ReferenceError:
-                # Material already deleted, skip
-                pass
-            except Exception as e:
-                # Print removed to reduce console clutter
-                pass
-
-        # Step 3: Also check for materials created during import (not just tracked ones)
-        for mat_name in list(bpy.data.materials.keys()):
+        # Tracked imported materials (even if their name existed before import) plus
+        # everything else created during import, minus what the imported objects use
+        candidate_names = set(bpy.data.materials.keys()) - self.materials_before_import
+        for mat in self.imported_materials:
             try:
-                # Skip if it was there before import
-                if mat_name in self.materials_before_import:
-                    continue
-
-                mat = bpy.data.materials.get(mat_name)
-                if not mat:
-                    continue
-
-                # Store name before deletion
-                current_mat_name = mat.name
-
-                # If not in use, remove it
-                if current_mat_name not in materials_in_use:
-                    bpy.data.materials.remove(mat, do_unlink=True)
-                    removed_count += 1
-                    # Print removed to reduce console clutter
+                if mat:
+                    candidate_names.add(mat.name)
             except ReferenceError:
-                # Material already deleted, skip
-                pass
-            except Exception as e:
-                # Print removed to reduce console clutter
-                pass
+                # Material already deleted
+                continue
+        unused_names = candidate_names - materials_in_use
+        to_remove = [mat for mat in map(bpy.data.materials.get, unused_names) if mat]
 
-        # Cleanup summary prints removed to reduce console clutter
+        self._remove_datablocks(to_remove, bpy.data.materials)
 
     def _show_only_lowest_lod(self):
         """Show all LOD levels in viewport after accepting import."""
-        import bpy
-        from ..operations.asset_processor import extract_lod_from_object_name
-
         # Find all LOD levels in imported objects
         lod_levels = set()
         for obj in self.imported_objects:
@@ -4858,7 +4774,7 @@ class ImportToolbar:
                 if obj.type != 'MESH' or not obj.data:
                     continue
 
-                lod_level = extract_lod_from_object_name(obj.name)
+                lod_level = self._lod_of(obj)
                 lod_levels.add(lod_level)
             except (AttributeError, ReferenceError):
                 # Object was deleted or is invalid
@@ -4870,21 +4786,21 @@ class ImportToolbar:
 
         # Visibility prints removed to reduce console clutter
 
-        # Show all LODs using the eye icon
+        # Show all LODs using the eye icon, touching only the hidden ones
+        shown_states = []
         for obj in self.imported_objects:
             try:
                 # Quick validity check without expensive name lookup
                 if obj.type != 'MESH' or not obj.data:
                     continue
-
-                lod_level = extract_lod_from_object_name(obj.name)
-
-                # Show all LODs using eye icon (hide_set) - instant local visibility
-                obj.hide_set(False)
+                shown_states.append((obj, False))
             except (AttributeError, ReferenceError):
                 # Object was deleted or is invalid
                 continue
 
+        self._apply_hidden(shown_states)
+        self._invalidate_lod_state()
+
         # Print removed to reduce console clutter
 
     def _handle_cancel(self, button):
@@ -4905,7 +4821,7 @@ class ImportToolbar:
         if self.hdri_enabled:
             # Turn off HDRI toggle
             if self.hdri_toggle:
-                self.hdri_toggle._toggled = False
+                self.hdri_toggle.toggled = False
             self.hdri_enabled = False
             # Restore original world
             self._restore_world_background()
@@ -4944,19 +4860,19 @@ class ImportToolbar:
     def _cleanup_import(self):
         """Remove all imported objects and materials."""
         # Remove imported objects
-        removed_objects = 0
+        objects_to_remove = []
         for obj in list(self.imported_objects):
             try:
-                if obj and obj.name in bpy.data.objects:
-                    bpy.data.objects.remove(obj, do_unlink=True)
-                    removed_objects += 1
+                # Tracked names skip the RNA lookup; fall back to it for objects renamed outside the toolbar
+                if obj and (obj.name in self._alive_names or obj.name in bpy.data.objects):
+                    objects_to_remove.append(obj)
             except:
                 pass
+        self._remove_datablocks(objects_to_remove, bpy.data.objects)
+        self._alive_names.clear()
+        self._objects_by_lod.clear()
 
         # Remove imported materials (only if not used by other objects)
-        removed_materials = 0
-        skipped_materials = 0
-
         # Get all materials created during import
         materials_to_check = set()
         for mat in list(self.imported_materials):
@@ -4969,32 +4885,15 @@ class ImportToolbar:
                 if mat:
                     materials_to_check.add(mat)
 
-        # Check each material and only delete if not used
-        for mat in materials_to_check:
-            try:
-                if mat.name not in bpy.data.materials:
-                    continue  # Already deleted
-
-                # Check if material is used by any remaining objects
-                is_used = False
-                for obj in bpy.data.objects:
-                    if obj.type == 'MESH' and obj.data:
-                        for mat_slot in obj.data.materials:
-                            if mat_slot and mat_slot.name == mat.name:
-                                is_used = True
-                                break
-                    if is_used:
-                        break
+        # Collect materials still used by the remaining objects in a single pass
+        used = set()
+        for obj in bpy.data.objects:
+            if obj.type == 'MESH' and obj.data:
+                used.update(mat_slot.name for mat_slot in obj.data.materials if mat_slot)
 
-                if not is_used:
-                    # Material is not used, safe to delete
-                    bpy.data.materials.remove(mat, do_unlink=True)
-                    removed_materials += 1
-                else:
-                    # Material is still used by other objects, skip
-                    skipped_materials += 1
-            except Exception as e:
-                pass
+        # Only delete materials no remaining object uses (stale IDs are handled by _remove_datablocks)
+        materials_to_remove = [mat for mat in materials_to_check if mat.name not in used]
+        self._remove_datablocks(materials_to_remove, bpy.data.materials)
 
     def set_imported_data(self, objects, materials, materials_before, original_scene=None, temp_scene=None):
         """Store references to imported data for cleanup.
@@ -5007,7 +4906,6 @@ class ImportToolbar:
             temp_scene: Optional reference to temporary preview scene
         """
         import bpy
-        from ..operations.asset_processor import extract_lod_from_object_name
 
         self.imported_objects = objects
         self.imported_materials = materials
@@ -5015,6 +4913,12 @@ class ImportToolbar:
         self.original_scene = original_scene
         self.temp_scene = temp_scene
 
+        # Fresh LOD cache for the new import (filled lazily by _lod_of)
+        self._lod_cache = {}
+        self._alive_names = set()
+        self._objects_by_lod = defaultdict(list)
+        self._invalidate_lod_state()
+
         # OPTIMIZED: Extract attach roots from imported objects
         # Attach roots already have LOD organization built in during import!
         # No need to loop through objects or reorganize anything
@@ -5028,6 +4932,9 @@ class ImportToolbar:
                     continue
                 if bpy.data.objects[obj.name] != obj:
                     continue
+                self._alive_names.add(obj.name)
+                if obj.type == 'MESH' and obj.data:
+                    self._objects_by_lod[self._lod_of(obj)].append(obj)
                 if obj.get("ioiAttachRootNode"):
                     self.attach_roots.append(obj)
             except (ReferenceError, AttributeError, KeyError):
@@ -5042,7 +4949,13 @@ class ImportToolbar:
         Args:
             lod_levels: List of LOD level numbers (e.g., [0, 1, 2, 3])
         """
-        self.lod_levels = sorted(lod_levels)
+        # Skip rewiring the dropdown and slider if the levels haven't changed
+        levels = tuple(sorted(lod_levels))
+        if levels == self._last_lod_levels:
+            return
+        self._last_lod_levels = levels
+
+        self.lod_levels = list(levels)
         if self.min_lod_dropdown and self.lod_levels:
             items = [f"LOD{level}" for level in self.lod_levels]
             self.min_lod_dropdown.set_items(items)
@@ -5098,35 +5011,25 @@ class ImportToolbar:
         if self.max_lod_dropdown.on_change:
             self.max_lod_dropdown.on_change(target_item)
 
-    def _update_slider_minmax_markers(self):
-        """Update the slider's min/max LOD markers based on dropdown selections."""
+    def _update_slider_minmax_markers(self, min_lod=None, max_lod=None):
+        """Update the slider's min/max LOD markers based on dropdown selections.
+
+        Args:
+            min_lod: Selected min LOD (defaults to the last min dropdown selection)
+            max_lod: Selected max LOD (defaults to the last max dropdown selection)
+        """
         if not self.lod_slider:
             return
 
         # Ensure object max LOD is set if lod_levels is available
         if self.lod_levels and self.lod_slider._object_max_lod is None:
-            max_lod = max(self.lod_levels)
-            self.lod_slider.set_object_max_lod(max_lod)
-
-        # Get min LOD from dropdown
-        min_lod = 0  # Default
-        if self.min_lod_dropdown:
-            min_lod_text = self.min_lod_dropdown.get_selected_item()
-            if min_lod_text:
-                import re
-                match = re.search(r'LOD(\d+)', min_lod_text)
-                if match:
-                    min_lod = int(match.group(1))
+            self.lod_slider.set_object_max_lod(max(self.lod_levels))
 
-        # Get max LOD from dropdown
-        max_lod = 5  # Default
-        if self.max_lod_dropdown:
-            max_lod_text = self.max_lod_dropdown.get_selected_item()
-            if max_lod_text:
-                import re
-                match = re.search(r'LOD(\d+)', max_lod_text)
-                if match:
-                    max_lod = int(match.group(1))
+        # Dropdown handlers keep these in sync, so no need to re-parse the dropdown text
+        if min_lod is None:
+            min_lod = self.selected_lod_level
+        if max_lod is None:
+            max_lod = self.selected_max_lod
 
         # Validate: min_lod should not be greater than max_lod
         if min_lod > max_lod:
@@ -5139,11 +5042,8 @@ class ImportToolbar:
 
     def _on_lod_selection_changed(self, selected_text):
         """Handle min LOD dropdown selection change - update text colors and markers."""
-        import re
-        import bpy
-
         # Extract LOD number from selected text (e.g., "LOD2" -> 2)
-        match = re.search(r'LOD(\d+)', selected_text)
+        match = _LOD_NUM_RE.search(selected_text)
         if match:
             selected_lod = int(match.group(1))
             self.selected_lod_level = selected_lod
@@ -5154,16 +5054,23 @@ class ImportToolbar:
             if self.min_lod_dropdown:
                 min_lod_text = self.min_lod_dropdown.get_selected_item()
                 if min_lod_text:
-                    min_match = re.search(r'LOD(\d+)', min_lod_text)
+                    min_match = _LOD_NUM_RE.search(min_lod_text)
                     if min_match:
                         min_lod = int(min_match.group(1))
 
             # Update slider min/max markers
-            self._update_slider_minmax_markers()
+            self._update_slider_minmax_markers(min_lod=selected_lod)
+
+            # Resolve the three text materials once instead of per text object
+            self._ensure_lod_materials()
+
+            # Colors only depend on the selected LOD, so skip the pass if it hasn't changed
+            text_items = self.lod_text_objects if selected_lod != self._last_selected_lod else ()
+            self._last_selected_lod = selected_lod
 
             # Update text object colors - but only for LODs >= minLOD
             # LODs below minLOD should keep their original colors (they're hidden anyway)
-            for item in self.lod_text_objects:
+            for item in text_items:
                 try:
                     # Handle tuple (text_obj, lod_level, total_tris) or (text_obj, lod_level) or just text_obj
                     if isinstance(item, tuple) and len(item) >= 2:
@@ -5172,7 +5079,7 @@ class ImportToolbar:
                     else:
                         # Try to extract LOD from name if not a tuple
                         text_obj = item
-                        name_match = re.search(r'LOD(\d+)', text_obj.name)
+                        name_match = _LOD_NUM_RE.search(text_obj.name)
                         lod_level = int(name_match.group(1)) if name_match else 0
 
                     # Skip color update for LODs below minLOD - they should keep their original colors
@@ -5189,13 +5096,13 @@ class ImportToolbar:
                     # Selected = White (no blue), Below selected (lower numbers) = Black, Above selected (higher numbers) = White
                     if lod_level == selected_lod:
                         # White for selected (removed blue)
-                        text_data.materials.append(self._get_or_create_text_material("LOD_Selected", (1.0, 1.0, 1.0, 1.0)))
+                        text_data.materials.append(self._mat_selected)
                     elif lod_level < selected_lod:
                         # Almost black for LODs with lower numbers (worse quality)
-                        text_data.materials.append(self._get_or_create_text_material("LOD_Below", (0.15, 0.15, 0.15, 1.0)))
+                        text_data.materials.append(self._mat_below)
                     else:
                         # Almost white for LODs with higher numbers (better quality)
-                        text_data.materials.append(self._get_or_create_text_material("LOD_Above", (0.9, 0.9, 0.9, 1.0)))
+                        text_data.materials.append(self._mat_above)
                 except:
                     pass
             
@@ -5206,8 +5113,12 @@ class ImportToolbar:
 
     def _on_max_lod_changed(self, selected_text):
         """Handle max LOD dropdown selection change - update markers."""
+        match = _LOD_NUM_RE.search(selected_text) if selected_text else None
+        if match:
+            self.selected_max_lod = int(match.group(1))
+
         # Update slider min/max markers
-        self._update_slider_minmax_markers()
+        self._update_slider_minmax_markers(max_lod=self.selected_max_lod)
         # Update text labels with Quixel LOD info (maxLOD might affect display)
         self._update_lod_text_labels()
         self._update_slider_labels()  # Update slider Quixel LOD labels
@@ -5215,41 +5126,36 @@ class ImportToolbar:
     def position_lods_for_preview(self):
         """Position LODs in Y direction with 1m gap and create text labels showing LOD level and polycount."""
         import bpy
-        from ..operations.asset_processor import extract_lod_from_object_name
 
         # Header prints removed to reduce console clutter
 
+        # Label materials are shared by every label created below
+        self._ensure_lod_materials()
+
         # Group objects by attach root (variation), then by LOD level
         # This ensures each variation's LODs are positioned independently
-        variations = {}
-        for obj in self.imported_objects:
-            try:
-                # Quick validity check without expensive name lookup
-                if obj.type != 'MESH' or not obj.data:
+        # Keyed by the parent object itself (bpy structs hash by pointer), so names
+        # are only fetched once per variation below
+        # _objects_by_lod already holds only valid meshes with their LOD level parsed
+        variations = defaultdict(lambda: defaultdict(list))
+        for lod_level, objs in self._objects_by_lod.items():
+            for obj in objs:
+                try:
+                    # Group by attach root (parent), then by LOD level within this variation
+                    variations[obj.parent][lod_level].append(obj)
+                except (AttributeError, ReferenceError):
+                    # Object was deleted or is invalid
                     continue
 
-                # Get the attach root (parent) of this object
-                parent = obj.parent
-                parent_name = parent.name if parent else "no_parent"
-
-                # Initialize this variation if not seen before
-                if parent_name not in variations:
-                    variations[parent_name] = {}
-
-                # Group by LOD level within this variation
-                lod_level = extract_lod_from_object_name(obj.name)
-                if lod_level not in variations[parent_name]:
-                    variations[parent_name][lod_level] = []
-                variations[parent_name][lod_level].append(obj)
-            except (AttributeError, ReferenceError):
-                # Object was deleted or is invalid
-                continue
-
         # Variation count print removed to reduce console clutter
 
         # Process each variation independently
-        for variation_name in sorted(variations.keys()):
-            lods_by_level = variations[variation_name]
+        variation_names = {
+            parent: (parent.name if parent else "no_parent") for parent in variations
+        }
+        for parent in sorted(variations, key=variation_names.__getitem__):
+            variation_name = variation_names[parent]
+            lods_by_level = variations[parent]
 
             # Processing variation print removed to reduce console clutter
 
@@ -5262,54 +5168,38 @@ class ImportToolbar:
             for lod_level in sorted_lod_levels:
                 objects = lods_by_level[lod_level]
 
-                # Calculate bounding box for this LOD level
-                min_x, max_x = None, None
-                min_z, max_z = None, None
+                # Calculate bounding box for this LOD level (all three axes in one pass)
                 total_tris = 0
+                obj_mins = []
+                obj_maxs = []
 
                 for obj in objects:
                     # Store original position (in local space relative to parent)
-                    self.lod_original_positions[obj.name] = obj.location.copy()
+                    self.lod_original_positions[obj.name] = tuple(obj.location)
 
                     # Calculate world bounding box
-                    bbox_corners = [obj.matrix_world @ mathutils.Vector(corner) for corner in obj.bound_box]
-                    for corner in bbox_corners:
-                        if min_x is None or corner.x < min_x:
-                            min_x = corner.x
-                        if max_x is None or corner.x > max_x:
-                            max_x = corner.x
-                        if min_z is None or corner.z < min_z:
-                            min_z = corner.z
-                        if max_z is None or corner.z > max_z:
-                            max_z = corner.z
+                    mins, maxs = _world_bbox(obj)
+                    obj_mins.append(mins)
+                    obj_maxs.append(maxs)
 
                     # Count triangles
-                    if obj.data:
-                        total_tris += len(obj.data.polygons)
-
-                width = max_x - min_x if min_x is not None else 0.0
-                height = max_z - min_z if min_z is not None else 0.0
-                depth = 0.0  # Will calculate from Y bounds
+                    mesh = obj.data
+                    if mesh:
+                        total_tris += len(mesh.polygons)
 
-                # Calculate depth for text sizing
-                min_y, max_y = None, None
-                for obj in objects:
-                    bbox_corners = [obj.matrix_world @ mathutils.Vector(corner) for corner in obj.bound_box]
-                    for corner in bbox_corners:
-                        if min_y is None or corner.y < min_y:
-                            min_y = corner.y
-                        if max_y is None or corner.y > max_y:
-                            max_y = corner.y
-                depth = max_y - min_y if min_y is not None else 0.0
+                # Reduce all object bounds of this LOD level at once
+                # (every LOD group holds at least one object, so the bounds always exist)
+                min_x, min_y, min_z = np.min(obj_mins, axis=0).tolist()
+                max_x, max_y, max_z = np.max(obj_maxs, axis=0).tolist()
 
                 # Calculate text size based on mesh size (5% of the largest dimension)
-                max_dimension = max(width, depth, height)
+                max_dimension = max(max_x - min_x, max_y - min_y, max_z - min_z)
                 text_size = max(0.1, max_dimension * 0.05)  # At least 0.1, up to 5% of mesh size
 
                 # Calculate the center of the bounding box in local space
                 # This will be used to position the text
-                center_x = (min_x + max_x) / 2.0 if min_x is not None else 0.0
-                center_y = (min_y + max_y) / 2.0 if min_y is not None else 0.0
+                center_x = (min_x + max_x) / 2.0
+                center_y = (min_y + max_y) / 2.0
 
                 # Don't move objects - they stay at their original positions
                 # LOD position print removed to reduce console clutter
@@ -5324,41 +5214,42 @@ class ImportToolbar:
                 text_obj = bpy.data.objects.new(name=f"{variation_name}_LOD{lod_level}_Label", object_data=text_data)
 
                 # Rotate text 90 degrees on X axis (to face upward/toward camera)
-                text_obj.rotation_euler.x = math.radians(90)
+                text_obj.rotation_euler.x = _HALF_PI
 
                 # Set text color based on LOD hierarchy
                 # Selected = White (no blue), Below selected (lower numbers) = Black, Above selected (higher numbers) = White
                 selected_lod = self.selected_lod_level if self.selected_lod_level is not None else 0
                 if lod_level == selected_lod:
                     # White color for selected LOD (removed blue)
-                    text_data.materials.append(self._get_or_create_text_material("LOD_Selected", (1.0, 1.0, 1.0, 1.0)))
+                    text_data.materials.append(self._mat_selected)
                 elif lod_level < selected_lod:
                     # Almost black for LODs with lower numbers (worse quality)
-                    text_data.materials.append(self._get_or_create_text_material("LOD_Below", (0.15, 0.15, 0.15, 1.0)))
+                    text_data.materials.append(self._mat_below)
                 else:
                     # Almost white for LODs with higher numbers (better quality)
-                    text_data.materials.append(self._get_or_create_text_material("LOD_Above", (0.9, 0.9, 0.9, 1.0)))
+                    text_data.materials.append(self._mat_above)
 
                 # Position text above the LOD at its original position
                 # Get the first object's parent (attach root) to position text relative to it
                 if objects:
                     first_obj = objects[0]
-                    if first_obj.parent:
+                    first_parent = first_obj.parent
+                    if first_parent:
                         # For LOD0 (first LOD), calculate and store position offsets
                         if lod0_position_offsets is None:
                             # Calculate position relative to parent for LOD0
-                            lod0_parent = first_obj.parent
+                            lod0_parent = first_parent
                             lod0_text_size = text_size
-                            x_offset = center_x - first_obj.parent.location.x
-                            y_offset = center_y - first_obj.parent.location.y
-                            z_offset = max_z - first_obj.parent.location.z + text_size * 1.5
-                            lod0_position_offsets = (x_offset, y_offset, z_offset)
+                            parent_x, parent_y, parent_z = first_parent.location
+                            lod0_position_offsets = (
+                                center_x - parent_x,
+                                center_y - parent_y,
+                                max_z - parent_z + text_size * 1.5,
+                            )
                         
                         # Use stored position offsets for all LODs (calculated once for LOD0)
                         text_obj.parent = lod0_parent
-                        text_obj.location.x = lod0_position_offsets[0]
-                        text_obj.location.y = lod0_position_offsets[1]
-                        text_obj.location.z = lod0_position_offsets[2]
+                        text_obj.location = lod0_position_offsets
                         
                         # Link to the same collections as the mesh objects (which are in attach root collections)
                         if first_obj.users_collection:
@@ -5374,13 +5265,11 @@ class ImportToolbar:
                             lod0_text_size = text_size
                             x_offset = center_x
                             y_offset = center_y
-                            z_offset = max_z + text_size * 1.5 if max_z is not None else text_size * 1.5
+                            z_offset = max_z + text_size * 1.5
                             lod0_position_offsets = (x_offset, y_offset, z_offset)
                         
                         # Use stored position for all LODs
-                        text_obj.location.x = lod0_position_offsets[0]
-                        text_obj.location.y = lod0_position_offsets[1]
-                        text_obj.location.z = lod0_position_offsets[2]
+                        text_obj.location = lod0_position_offsets
                         
                         # Link to the same collections as the mesh objects
                         if first_obj.users_collection:
@@ -5395,6 +5284,7 @@ class ImportToolbar:
 
                 # Store text object for later cleanup (with LOD level info and tris count)
                 self.lod_text_objects.append((text_obj, lod_level, total_tris))
+                self._invalidate_lod_state()
 
                 # Label creation print removed to reduce console clutter
 
@@ -5406,6 +5296,15 @@ class ImportToolbar:
         # Update text labels with Quixel LOD info
         self._update_lod_text_labels()
 
+    def _ensure_lod_materials(self):
+        """Fetch (or create) the Selected/Below/Above label materials for a label pass.
+
+        Re-resolved on every pass since material cleanup may have removed them.
+        """
+        self._mat_selected = self._get_or_create_text_material("LOD_Selected", _COLOR_LOD_SELECTED)
+        self._mat_below = self._get_or_create_text_material("LOD_Below", _COLOR_LOD_BELOW)
+        self._mat_above = self._get_or_create_text_material("LOD_Above", _COLOR_LOD_ABOVE)
+
     def _get_or_create_text_material(self, mat_name, color):
         """Get or create a material for text objects with specified color.
 
@@ -5446,8 +5345,7 @@ class ImportToolbar:
         if self.min_lod_dropdown:
             min_lod_text = self.min_lod_dropdown.get_selected_item()
             if min_lod_text:
-                import re
-                match = re.search(r'LOD(\d+)', min_lod_text)
+                match = _LOD_NUM_RE.search(min_lod_text)
                 if match:
                     min_lod = int(match.group(1))
         
@@ -5456,14 +5354,17 @@ class ImportToolbar:
         if self.max_lod_dropdown:
             max_lod_text = self.max_lod_dropdown.get_selected_item()
             if max_lod_text:
-                import re
-                match = re.search(r'LOD(\d+)', max_lod_text)
+                match = _LOD_NUM_RE.search(max_lod_text)
                 if match:
                     max_lod = int(match.group(1))
         
         # Calculate Quixel LOD for currently previewed LOD
         # Formula: quixel_lod = min_lod + preview_position
         quixel_lod = min_lod + self.current_preview_lod
+
+        # Labels created/recolored below share these materials
+        if self.lod_text_objects:
+            self._ensure_lod_materials()
         
         # Check if this LOD needs auto-generation
         # Only mark as auto-generated if within minLOD to maxLOD range
@@ -5500,7 +5401,6 @@ class ImportToolbar:
         
         # Now update the visible text objects (only those >= minLOD)
         # First, hide all text objects that don't match the target LOD (same logic as update_lod_visibility)
-        import bpy
         if self.lod_text_objects:
             for item in self.lod_text_objects:
                 try:
@@ -5513,14 +5413,11 @@ class ImportToolbar:
                     
                     # Always hide text objects below minLOD (regardless of target_quixel_lod)
                     if text_quixel_lod < min_lod:
-                        text_obj.hide_set(True)
-                        text_obj.hide_viewport = True
+                        self._set_label_hidden(text_obj, True)
                         continue
 
                     # Match by Quixel LOD, not preview LOD position
-                    should_hide = (text_quixel_lod != target_quixel_lod)
-                    text_obj.hide_set(should_hide)
-                    text_obj.hide_viewport = should_hide
+                    self._set_label_hidden(text_obj, text_quixel_lod != target_quixel_lod)
                 except (AttributeError, ReferenceError):
                     continue
         
@@ -5556,7 +5453,6 @@ class ImportToolbar:
         
         # If LOD doesn't exist, create text objects for ALL variations (not just one)
         if not lod_exists:
-            import math
             preview_lod_display = self.current_preview_lod
             
             # Group existing text objects by variation to find reference for each variation
@@ -5631,7 +5527,7 @@ class ImportToolbar:
                 text_obj.location.x = reference_text_obj.location.x
                 text_obj.location.y = reference_text_obj.location.y
                 text_obj.location.z = reference_text_obj.location.z
-                text_obj.rotation_euler.x = math.radians(90)
+                text_obj.rotation_euler.x = _HALF_PI
                 
                 # Set text color
                 # Compare Quixel LODs, not preview LOD positions, to fix color issue when minLOD > 0
@@ -5639,11 +5535,11 @@ class ImportToolbar:
                 selected_lod_quixel = self.selected_lod_level if self.selected_lod_level is not None else 0
                 # Compare target_quixel_lod (current) with selected_lod_quixel (selected) - both are Quixel LODs
                 if target_quixel_lod == selected_lod_quixel:
-                    text_data.materials.append(self._get_or_create_text_material("LOD_Selected", (1.0, 1.0, 1.0, 1.0)))
+                    text_data.materials.append(self._mat_selected)
                 elif target_quixel_lod < selected_lod_quixel:
-                    text_data.materials.append(self._get_or_create_text_material("LOD_Below", (0.15, 0.15, 0.15, 1.0)))
+                    text_data.materials.append(self._mat_below)
                 else:
-                    text_data.materials.append(self._get_or_create_text_material("LOD_Above", (0.9, 0.9, 0.9, 1.0)))
+                    text_data.materials.append(self._mat_above)
                 
                 # Make it visible
                 text_obj.hide_set(False)
@@ -5651,6 +5547,7 @@ class ImportToolbar:
                 
                 # Store in lod_text_objects for future reference
                 self.lod_text_objects.append((text_obj, target_quixel_lod, 0))
+                self._invalidate_lod_state()
                 created_any = True
             
             # If we created text objects, we need to find the one for the current variation to update
@@ -5695,8 +5592,6 @@ class ImportToolbar:
                 continue
             
             text_data = text_obj_to_update.data
-            import bpy
-            import math
             
             # Update main text body
             # Display preview LOD position, not Quixel LOD
@@ -5713,11 +5608,11 @@ class ImportToolbar:
             # Compare target_quixel_lod (current) with selected_lod_quixel (selected) - both are Quixel LODs
             if target_quixel_lod == selected_lod_quixel:
                 # Use white instead of blue for selected
-                text_data.materials.append(self._get_or_create_text_material("LOD_Selected", (1.0, 1.0, 1.0, 1.0)))
+                text_data.materials.append(self._mat_selected)
             elif target_quixel_lod < selected_lod_quixel:
-                text_data.materials.append(self._get_or_create_text_material("LOD_Below", (0.15, 0.15, 0.15, 1.0)))
+                text_data.materials.append(self._mat_below)
             else:
-                text_data.materials.append(self._get_or_create_text_material("LOD_Above", (0.9, 0.9, 0.9, 1.0)))
+                text_data.materials.append(self._mat_above)
         
 
     def _delete_text_labels(self):
@@ -5743,11 +5638,10 @@ class ImportToolbar:
 
         # Clear the list
         self.lod_text_objects.clear()
+        self._invalidate_lod_state()
 
     def reset_lod_positions_and_cleanup(self):
         """Reset LOD positions to original and delete text labels."""
-        import bpy
-
         # Header prints removed to reduce console clutter
 
         # Reset object positions
@@ -5757,8 +5651,7 @@ class ImportToolbar:
                 # Quick validity check without expensive name lookup
                 # Restore original position if we stored it
                 if obj.name in self.lod_original_positions:
-                    original_pos = self.lod_original_positions[obj.name]
-                    obj.location = original_pos.copy()
+                    obj.location = self.lod_original_positions[obj.name]
                     reset_count += 1
             except (ReferenceError, AttributeError):
                 # Object has been deleted or is invalid, skip it
@@ -5777,86 +5670,117 @@ class ImportToolbar:
 
         # Print removed to reduce console clutter
 
+    def _build_divider_batches(self):
+        """Build the top and bottom divider line batches for the current layout."""
+        DrawConstants.initialize()
+        shader = DrawConstants.uniform_shader
+        layout = self.layout
+
+        self._top_divider_batch = batch_for_shader(shader, 'LINES', {"pos": [
+            (layout.top_divider_x, layout.top_divider_y_start),
+            (layout.top_divider_x, layout.top_divider_y_end),
+        ]})
+        self._divider_batch = batch_for_shader(shader, 'LINES', {"pos": [
+            (layout.divider_x, layout.divider_y_start),
+            (layout.divider_x, layout.divider_y_end),
+        ]})
+
+    def _text_height(self, size, text):
+        """Get the height of a label at the given font size, measured once per text."""
+        key = (size, text)
+        height = self._text_heights.get(key)
+        if height is None:
+            blf.size(0, size)
+            height = self._text_heights[key] = blf.dimensions(0, text)[1]
+        return height
+
+    def _draw_labels(self):
+        """Draw the slider and Min/Max LOD labels, sharing font state between them."""
+        layout = self.layout
+        line_spacing = 4  # Space between the two slider label lines
+
+        # Measure first (cached) so font size/color are only set once per group below
+        min_label_height = self._text_height(12, "Min LOD")
+        max_label_height = self._text_height(12, "Max LOD")
+        # Always calculate height based on a consistent reference to avoid position shift
+        # Use the Quixel LOD text for consistent height calculation
+        reference_text_height = self._text_height(10, self.lod_slider_quixel_label_text)
+
+        # White 12px labels: Preview LOD (top line of slider label), Min LOD, Max LOD (no colons)
+        blf.size(0, 12)
+        blf.color(0, 1.0, 1.0, 1.0, 1.0)
+
+        blf.position(0, layout.lod_label_x, layout.lod_label_y + line_spacing / 2, 0)
+        blf.draw(0, self.lod_slider_label_text)
+
+        blf.position(0, layout.min_lod_label_x, layout.label_y - min_label_height / 2, 0)
+        blf.draw(0, "Min LOD")
+
+        blf.position(0, layout.max_lod_label_x, layout.label_y - max_label_height / 2, 0)
+        blf.draw(0, "Max LOD")
+
+        # Bottom line of slider label (Quixel LOD or Status) - DARK GRAY, slightly smaller
+        # Show status if missing, otherwise show Quixel LOD
+        if self.lod_slider_status_text:
+            bottom_text = self.lod_slider_status_text
+        else:
+            bottom_text = self.lod_slider_quixel_label_text
+
+        blf.size(0, 10)
+        blf.color(0, 0.6, 0.6, 0.6, 1.0)
+        blf.position(0, layout.lod_label_x, layout.lod_label_y - line_spacing / 2 - reference_text_height, 0)
+        blf.draw(0, bottom_text)
+
+    def _draw_dividers(self):
+        """Draw the top and bottom divider lines in one blend/shader setup."""
+        if not (self._top_divider_batch and self._divider_batch):
+            return
+
+        gpu.state.blend_set('ALPHA')
+
+        shader = DrawConstants.uniform_shader
+        shader.bind()
+        shader.uniform_float("color", (0.2, 0.2, 0.2, 0.5))
+        self._top_divider_batch.draw(shader)
+        self._divider_batch.draw(shader)
+
+        gpu.state.blend_set('NONE')
+
     def draw(self):
         """Draw all toolbar elements."""
         if not self.visible:
             return
 
+        # Read the viewport once for every widget drawn this frame
+        DrawConstants.begin_frame()
+
+        # Background panels first (top: LOD slider, bottom: LOD controls & buttons),
+        # then the top toolbar's square buttons, all in a single SDF draw. The
+        # buttons only draw their icons below. Nothing else overlaps them, so
+        # moving their backgrounds ahead of the labels and slider is safe.
+        top_buttons = (self.floor_toggle, self.wireframe_toggle, self.hdri_toggle, self.hdri_dropdown_button)
+        draw_rounded_rects([
+            widget.background()
+            for widget in (self.top_background_panel, self.background_panel) + top_buttons
+            if widget and widget.visible and not widget.is_offscreen()
+        ])
+
+        # Static labels and dividers of both toolbars
+        if self.layout:
+            self._draw_labels()
+            self._draw_dividers()
+
         # ========================================
         # TOP TOOLBAR (LOD Slider)
         # ========================================
-        # Draw top background panel
-        if self.top_background_panel:
-            self.top_background_panel.draw()
-
-        # Draw LOD slider label (two lines)
-        if hasattr(self, 'lod_slider_label_x'):
-            # Calculate line height and spacing
-            blf.size(0, 12)  # Top line size
-            top_text_height = blf.dimensions(0, self.lod_slider_label_text)[1]
-            line_spacing = 4  # Space between lines
-
-            # Draw top line (Preview LOD) - WHITE
-            top_y = self.lod_slider_label_y + line_spacing / 2
-            blf.position(0, self.lod_slider_label_x, top_y, 0)
-            blf.color(0, 1.0, 1.0, 1.0, 1.0)  # White
-            blf.draw(0, self.lod_slider_label_text)
-
-            # Draw bottom line (Quixel LOD or Status) - DARK GRAY
-            blf.size(0, 10)  # Slightly smaller for bottom line
-
-            # Build bottom text - show status if missing, otherwise show Quixel LOD
-            if self.lod_slider_status_text:
-                bottom_text = self.lod_slider_status_text
-            else:
-                bottom_text = self.lod_slider_quixel_label_text
-
-            # Always calculate height based on a consistent reference to avoid position shift
-            # Use the Quixel LOD text for consistent height calculation
-            reference_text_height = blf.dimensions(0, self.lod_slider_quixel_label_text)[1]
-            bottom_y = self.lod_slider_label_y - line_spacing / 2 - reference_text_height
-
-            blf.position(0, self.lod_slider_label_x, bottom_y, 0)
-            blf.color(0, 0.6, 0.6, 0.6, 1.0)  # Dark gray
-            blf.draw(0, bottom_text)
-
         # Draw LOD slider
         if self.lod_slider:
             self.lod_slider.draw()
 
-        # Draw top divider line
-        if hasattr(self, 'top_divider_x'):
-            DrawConstants.initialize()
-            gpu.state.blend_set('ALPHA')
-
-            shader = DrawConstants.uniform_shader
-            vertices = [
-                (self.top_divider_x, self.top_divider_y_start),
-                (self.top_divider_x, self.top_divider_y_end)
-            ]
-            batch = batch_for_shader(shader, 'LINES', {"pos": vertices})
-
-            shader.bind()
-            shader.uniform_float("color", (0.2, 0.2, 0.2, 0.5))
-            batch.draw(shader)
-
-            gpu.state.blend_set('NONE')
-
-        # Draw floor toggle button
-        if self.floor_toggle:
-            self.floor_toggle.draw()
-
-        # Draw wireframe toggle button
-        if self.wireframe_toggle:
-            self.wireframe_toggle.draw()
-
-        # Draw HDRI toggle button
-        if self.hdri_toggle:
-            self.hdri_toggle.draw()
-
-        # Draw HDRI dropdown button
-        if self.hdri_dropdown_button:
-            self.hdri_dropdown_button.draw()
+        # Draw floor, wireframe and HDRI toggle icons and the HDRI dropdown button icon
+        for button in top_buttons:
+            if button:
+                button.draw_foreground()
 
         # ========================================
         # HDRI PANEL (drawn on top of everything)
@@ -5868,44 +5792,6 @@ class ImportToolbar:
         # ========================================
         # BOTTOM TOOLBAR (LOD Controls & Buttons)
         # ========================================
-        # Draw background panel first
-        if self.background_panel:
-            self.background_panel.draw()
-
-        # Draw Min LOD label (no colon)
-        if hasattr(self, 'min_lod_label_x'):
-            blf.size(0, 12)
-            text_height = blf.dimensions(0, "Min LOD")[1]
-            blf.position(0, self.min_lod_label_x, self.min_lod_label_y - text_height / 2, 0)
-            blf.color(0, 1.0, 1.0, 1.0, 1.0)
-            blf.draw(0, "Min LOD")
-
-        # Draw Max LOD label (no colon)
-        if hasattr(self, 'max_lod_label_x'):
-            blf.size(0, 12)
-            text_height = blf.dimensions(0, "Max LOD")[1]
-            blf.position(0, self.max_lod_label_x, self.max_lod_label_y - text_height / 2, 0)
-            blf.color(0, 1.0, 1.0, 1.0, 1.0)
-            blf.draw(0, "Max LOD")
-
-        # Draw divider line
-        if hasattr(self, 'divider_x'):
-            DrawConstants.initialize()
-            gpu.state.blend_set('ALPHA')
-
-            shader = DrawConstants.uniform_shader
-            vertices = [
-                (self.divider_x, self.divider_y_start),
-                (self.divider_x, self.divider_y_end)
-            ]
-            batch = batch_for_shader(shader, 'LINES', {"pos": vertices})
-
-            shader.bind()
-            shader.uniform_float("color", (0.2, 0.2, 0.2, 0.5))
-            batch.draw(shader)
-
-            gpu.state.blend_set('NONE')
-
         # Draw Min LOD dropdown
         if self.min_lod_dropdown:
             self.min_lod_dropdown.draw()
@@ -6031,6 +5917,21 @@ class ImportToolbar:
         if not self.visible:
             return False
 
+        # Away from both toolbars nothing can be hovered, unless something extends past
+        # the panels (HDRI panel, open dropdown list) or the slider is being dragged
+        if self._toolbar_bounds:
+            x0, y0, x1, y1 = self._toolbar_bounds
+            in_bounds = x0 <= x <= x1 and y0 <= y <= y1
+            if not in_bounds and not self._was_in_bounds and not (
+                self.hdri_panel_visible
+                or (self.lod_slider and self.lod_slider._is_dragging)
+                or (self.min_lod_dropdown and self.min_lod_dropdown._is_open)
+                or (self.max_lod_dropdown and self.max_lod_dropdown._is_open)
+            ):
+                return False
+            # Dispatch once more after leaving so widgets clear their hover state
+            self._was_in_bounds = in_bounds
+
         # Handle HDRI panel hover (if visible)
         if self.hdri_panel_visible and self.hdri_panel:
             self.hdri_panel.mouse_move(x, y)
@@ -6040,8 +5941,7 @@ class ImportToolbar:
         if self.lod_slider:
             self.lod_slider.mouse_move(x, y)
             # Check if slider is currently dragging
-            if hasattr(self.lod_slider, '_is_dragging'):
-                is_dragging = self.lod_slider._is_dragging
+            is_dragging = self.lod_slider._is_dragging
 
         if self.floor_toggle:
             self.floor_toggle.mouse_move(x, y)